@@ -6,6 +6,7 @@ Provides SQLite-based persistent storage for:
 - Command audit logging (compliance/debugging)
 """
 
+from mtp_gateway.adapters.persistence.migrations import SchemaVersionError
 from mtp_gateway.adapters.persistence.models import (
     CommandAuditLog,
     ServiceStateSnapshot,
@@ -16,6 +17,7 @@ from mtp_gateway.adapters.persistence.repository import PersistenceRepository
 __all__ = [
     "CommandAuditLog",
     "PersistenceRepository",
+    "SchemaVersionError",
     "ServiceStateSnapshot",
     "TagValueRecord",
 ]
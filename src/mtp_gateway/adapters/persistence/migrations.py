@@ -0,0 +1,133 @@
+"""Schema versioning for the SQLite persistence database.
+
+The schema version is kept in SQLite's ``PRAGMA user_version``. Databases
+written before versioning was introduced report version 0 and are upgraded
+in place; databases written by a newer gateway are refused.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import structlog
+from sqlalchemy import inspect, text
+
+from mtp_gateway.adapters.persistence.models import Base, TagValueRecord, UTCMicroseconds
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.engine import Connection
+
+logger = structlog.get_logger(__name__)
+
+# Bump together with a new entry in _MIGRATIONS whenever the on-disk
+# layout of an existing table changes.
+SCHEMA_VERSION = 2
+
+
+class SchemaVersionError(Exception):
+    """Raised when the database was written by a newer schema version."""
+
+
+def _migrate_tag_values_to_typed_columns(conn: Connection) -> None:
+    """Move tag_values from a JSON ``value`` column to typed value columns."""
+    inspector = inspect(conn)
+    if not inspector.has_table("tag_values"):
+        return
+    if "value" not in {column["name"] for column in inspector.get_columns("tag_values")}:
+        return
+
+    # The old indexes keep their names across RENAME and would clash with
+    # the ones created for the new table.
+    conn.execute(text("DROP INDEX IF EXISTS ix_tag_values_tag_name"))
+    conn.execute(text("DROP INDEX IF EXISTS ix_tag_values_timestamp"))
+    conn.execute(text("ALTER TABLE tag_values RENAME TO _tag_values_v0"))
+    TagValueRecord.__table__.create(conn)
+    conn.execute(
+        text(
+            """
+            INSERT INTO tag_values (
+                id, tag_name, value_kind, value_bool, value_int, value_real,
+                value_text, quality, timestamp, source_timestamp
+            )
+            SELECT
+                id,
+                tag_name,
+                CASE json_type(value)
+                    WHEN 'true' THEN 0 WHEN 'false' THEN 0
+                    WHEN 'integer' THEN 1 WHEN 'real' THEN 2 WHEN 'text' THEN 3
+                    ELSE 4
+                END,
+                CASE json_type(value) WHEN 'true' THEN 1 WHEN 'false' THEN 0 END,
+                CASE json_type(value) WHEN 'integer' THEN json_extract(value, '$') END,
+                CASE json_type(value) WHEN 'real' THEN json_extract(value, '$') END,
+                CASE json_type(value)
+                    WHEN 'text' THEN json_extract(value, '$')
+                    WHEN 'null' THEN value WHEN 'array' THEN value WHEN 'object' THEN value
+                END,
+                quality,
+                timestamp,
+                source_timestamp
+            FROM _tag_values_v0
+            """
+        )
+    )
+    conn.execute(text("DROP TABLE _tag_values_v0"))
+
+
+def _migrate_timestamps_to_microseconds(conn: Connection) -> None:
+    """Rewrite text DATETIME values as integer microseconds since the epoch.
+
+    Older gateways stored UTC timestamps as 'YYYY-MM-DD HH:MM:SS.ffffff'.
+    """
+    existing = set(inspect(conn).get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing:
+            continue
+        for column in table.columns:
+            if not isinstance(column.type, UTCMicroseconds):
+                continue
+            conn.execute(
+                text(
+                    f"UPDATE {table.name} SET {column.name} = "
+                    f"CAST(strftime('%s', substr({column.name}, 1, 19)) AS INTEGER) * 1000000"
+                    f" + CAST(substr({column.name}, 21, 6) AS INTEGER)"
+                    f" WHERE typeof({column.name}) = 'text'"
+                )
+            )
+
+
+# _MIGRATIONS[n] upgrades a database from version n to n + 1
+_MIGRATIONS: tuple[Callable[[Connection], None], ...] = (
+    _migrate_tag_values_to_typed_columns,
+    _migrate_timestamps_to_microseconds,
+)
+
+
+def upgrade_schema(conn: Connection) -> None:
+    """Create missing tables and bring an existing database up to date.
+
+    Args:
+        conn: Synchronous connection inside an open transaction.
+
+    Raises:
+        SchemaVersionError: If the database is newer than SCHEMA_VERSION.
+    """
+    version = conn.execute(text("PRAGMA user_version")).scalar_one()
+    if version > SCHEMA_VERSION:
+        msg = (
+            f"Database schema version {version} is newer than the supported "
+            f"version {SCHEMA_VERSION}; upgrade the gateway or use another db_path"
+        )
+        raise SchemaVersionError(msg)
+
+    existing = set(inspect(conn).get_table_names())
+    if version < SCHEMA_VERSION and existing & set(Base.metadata.tables):
+        for step in range(version, SCHEMA_VERSION):
+            logger.info("Migrating database schema", from_version=step, to_version=step + 1)
+            _MIGRATIONS[step](conn)
+
+    Base.metadata.create_all(conn)
+    if version != SCHEMA_VERSION:
+        conn.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
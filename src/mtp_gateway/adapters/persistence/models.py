@@ -6,12 +6,53 @@ and command audit logging. Uses SQLAlchemy 2.0 declarative style.
 
 from __future__ import annotations
 
-import json
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import DateTime, Integer, String, Text
+import orjson
+from sqlalchemy import BigInteger, Boolean, Float, Integer, SmallInteger, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
+
+# Discriminator values for TagValueRecord.value_kind
+VALUE_KIND_BOOL = 0
+VALUE_KIND_INT = 1
+VALUE_KIND_REAL = 2
+VALUE_KIND_TEXT = 3
+VALUE_KIND_JSON = 4
+
+# SQLite INTEGER is a signed 64-bit value
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+class UTCMicroseconds(TypeDecorator[datetime]):
+    """Timezone-aware datetime stored as INTEGER microseconds since the epoch.
+
+    Integer storage skips SQLite's text datetime parsing and makes
+    time-range filters plain integer comparisons. Naive datetimes are
+    treated as UTC; values are always returned as UTC-aware datetimes.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect: Any) -> int | None:  # noqa: ARG002
+        """Convert a datetime to microseconds since the epoch."""
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return (value - _EPOCH) // _ONE_MICROSECOND
+
+    def process_result_value(self, value: int | None, dialect: Any) -> datetime | None:  # noqa: ARG002
+        """Convert microseconds since the epoch to a UTC datetime."""
+        if value is None:
+            return None
+        return _EPOCH + timedelta(microseconds=value)
 
 
 class Base(DeclarativeBase):
@@ -44,10 +85,10 @@ class ServiceStateSnapshot(Base):
     procedure_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
     parameters: Mapped[str | None] = mapped_column(Text, nullable=True)
     started_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+        UTCMicroseconds(), default=lambda: datetime.now(UTC)
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        UTCMicroseconds(),
         default=lambda: datetime.now(UTC),
         onupdate=lambda: datetime.now(UTC),
     )
@@ -74,7 +115,7 @@ class ServiceStateSnapshot(Base):
         self.service_name = service_name
         self.state = state
         self.procedure_id = procedure_id
-        self.parameters = json.dumps(parameters) if parameters else None
+        self.parameters = orjson.dumps(parameters).decode() if parameters else None
         self.started_at = started_at or datetime.now(UTC)
         self.updated_at = updated_at or datetime.now(UTC)
 
@@ -83,12 +124,15 @@ class TagValueRecord(Base):
     """Historical tag values for time-series queries.
 
     Stores tag values over time for trend analysis and debugging.
-    Values are stored as JSON to support multiple data types.
+    Values are stored in a typed column selected by ``value_kind`` so the
+    common numeric case needs no JSON encoding. Anything that is not a
+    bool, int, float or str falls back to JSON text.
 
     Attributes:
         id: Auto-incrementing primary key
         tag_name: Tag identifier
-        value: Tag value (stored as JSON-compatible type)
+        value: Tag value (read from / written to the typed columns)
+        value_kind: Discriminator selecting the typed value column
         quality: OPC UA quality string (e.g., "GOOD", "BAD")
         timestamp: When the value was recorded by the gateway
         source_timestamp: Original timestamp from the source (PLC)
@@ -98,12 +142,14 @@ class TagValueRecord(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     tag_name: Mapped[str] = mapped_column(String(255), index=True)
-    value: Mapped[Any] = mapped_column(Text)  # JSON serialized
+    value_kind: Mapped[int] = mapped_column(SmallInteger)
+    value_bool: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    value_int: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    value_real: Mapped[float | None] = mapped_column(Float, nullable=True)
+    value_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     quality: Mapped[str] = mapped_column(String(50))
-    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
-    source_timestamp: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), nullable=True
-    )
+    timestamp: Mapped[datetime] = mapped_column(UTCMicroseconds(), index=True)
+    source_timestamp: Mapped[datetime | None] = mapped_column(UTCMicroseconds(), nullable=True)
 
     def __init__(
         self,
@@ -128,6 +174,44 @@ class TagValueRecord(Base):
         self.timestamp = timestamp
         self.source_timestamp = source_timestamp
 
+    @property
+    def value(self) -> Any:
+        """Tag value decoded from the typed column selected by value_kind."""
+        kind = self.value_kind
+        if kind == VALUE_KIND_REAL:
+            return self.value_real
+        if kind == VALUE_KIND_INT:
+            return self.value_int
+        if kind == VALUE_KIND_BOOL:
+            return self.value_bool
+        if kind == VALUE_KIND_TEXT:
+            return self.value_text
+        return orjson.loads(self.value_text) if self.value_text is not None else None
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        """Store value in the matching typed column."""
+        self.value_bool = None
+        self.value_int = None
+        self.value_real = None
+        self.value_text = None
+        # bool must be checked before int (bool is an int subclass)
+        if isinstance(value, bool):
+            self.value_kind = VALUE_KIND_BOOL
+            self.value_bool = value
+        elif isinstance(value, int) and _INT64_MIN <= value <= _INT64_MAX:
+            self.value_kind = VALUE_KIND_INT
+            self.value_int = value
+        elif isinstance(value, float):
+            self.value_kind = VALUE_KIND_REAL
+            self.value_real = value
+        elif isinstance(value, str):
+            self.value_kind = VALUE_KIND_TEXT
+            self.value_text = value
+        else:
+            self.value_kind = VALUE_KIND_JSON
+            self.value_text = orjson.dumps(value).decode()
+
 
 class CommandAuditLog(Base):
     """Audit trail for all commands.
@@ -148,7 +232,7 @@ class CommandAuditLog(Base):
     __tablename__ = "command_audit"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    timestamp: Mapped[datetime] = mapped_column(UTCMicroseconds(), index=True)
     command_type: Mapped[str] = mapped_column(String(50))
     target: Mapped[str] = mapped_column(String(255))
     parameters: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -177,6 +261,6 @@ class CommandAuditLog(Base):
         self.timestamp = timestamp
         self.command_type = command_type
         self.target = target
-        self.parameters = json.dumps(parameters) if parameters else None
+        self.parameters = orjson.dumps(parameters).decode() if parameters else None
         self.result = result
         self.error_message = error_message
@@ -6,27 +6,100 @@ and command audit logging. Uses SQLAlchemy 2.0 async mode with aiosqlite.
 
 from __future__ import annotations
 
-import json
+import asyncio
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+import orjson
 import structlog
-from sqlalchemy import delete, select
+from sqlalchemy import bindparam, delete, select, update
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from mtp_gateway.adapters.persistence.migrations import upgrade_schema
 from mtp_gateway.adapters.persistence.models import (
-    Base,
     CommandAuditLog,
     ServiceStateSnapshot,
     TagValueRecord,
 )
+from mtp_gateway.domain.model.tags import Quality
+from mtp_gateway.domain.state_machine.packml import PackMLState
 
 if TYPE_CHECKING:
-    from mtp_gateway.domain.model.tags import Quality
+    from collections.abc import AsyncIterator
 
 logger = structlog.get_logger(__name__)
 
+# Precomputed enum -> name lookups; avoids hasattr() on every write
+_QUALITY_NAMES: dict[Any, str] = {quality: quality.name for quality in Quality}
+_STATE_NAMES: dict[Any, str] = {state: state.name for state in PackMLState}
+
+# Statements are built once at import time so SQLAlchemy's compiled cache
+# is hit directly instead of rebuilding the expression tree per call.
+_upsert = sqlite_insert(ServiceStateSnapshot)
+_STMT_UPSERT_STATE = _upsert.on_conflict_do_update(
+    index_elements=["service_name"],
+    set_={
+        "state": _upsert.excluded.state,
+        "procedure_id": _upsert.excluded.procedure_id,
+        "parameters": _upsert.excluded.parameters,
+        "updated_at": _upsert.excluded.updated_at,
+    },
+)
+del _upsert
+
+# Refreshes updated_at only while the row still holds the expected snapshot;
+# a rowcount of 0 means the row changed or vanished and needs the full upsert.
+_STMT_TOUCH_STATE = (
+    update(ServiceStateSnapshot)
+    .where(
+        ServiceStateSnapshot.service_name == bindparam("b_service_name"),
+        ServiceStateSnapshot.state == bindparam("b_state"),
+        ServiceStateSnapshot.procedure_id.is_not_distinct_from(bindparam("b_procedure_id")),
+        ServiceStateSnapshot.parameters == bindparam("b_parameters"),
+    )
+    .values(updated_at=bindparam("b_touched_at"))
+    .execution_options(synchronize_session=False)
+)
+
+_STMT_GET_STATE = select(ServiceStateSnapshot).where(
+    ServiceStateSnapshot.service_name == bindparam("service_name")
+)
+_STMT_DELETE_STATE = delete(ServiceStateSnapshot).where(
+    ServiceStateSnapshot.service_name == bindparam("service_name")
+)
+_STMT_ALL_STATES = select(ServiceStateSnapshot)
+_STMT_TAG_HISTORY = (
+    select(TagValueRecord)
+    .where(
+        TagValueRecord.tag_name == bindparam("tag_name"),
+        TagValueRecord.timestamp >= bindparam("start"),
+        TagValueRecord.timestamp <= bindparam("end"),
+    )
+    .order_by(TagValueRecord.timestamp.asc())
+)
+_STMT_AUDIT_LOG = (
+    select(CommandAuditLog)
+    .where(
+        CommandAuditLog.timestamp >= bindparam("start"),
+        CommandAuditLog.timestamp <= bindparam("end"),
+    )
+    .order_by(CommandAuditLog.timestamp.asc())
+)
+
+# Result sets larger than this are post-processed in a worker thread so the
+# JSON decoding does not stall connector polling on the event loop.
+_OFFLOAD_THRESHOLD = 500
+
+
+def _deserialize_audit_logs(logs: list[CommandAuditLog]) -> list[CommandAuditLog]:
+    """Deserialize parameters JSON on audit logs."""
+    for log in logs:
+        if isinstance(log.parameters, str):
+            log.parameters = orjson.loads(log.parameters)
+    return logs
+
 
 class PersistenceRepository:
     """Repository for persistent storage operations.
@@ -70,15 +143,21 @@ class PersistenceRepository:
             class_=AsyncSession,
             expire_on_commit=False,
         )
+        # Last committed (state, procedure_id, parameters) per service, used to
+        # only refresh updated_at for services idling in the same state
+        self._saved_states: dict[str, tuple[str, int | None, str]] = {}
         logger.debug("Persistence repository initialized", db_path=db_path)
 
     async def initialize(self) -> None:
-        """Create database tables if they don't exist.
+        """Create database tables and upgrade an older schema in place.
 
         Safe to call multiple times (idempotent).
+
+        Raises:
+            SchemaVersionError: If the database was written by a newer gateway.
         """
         async with self._engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(upgrade_schema)
         logger.info("Database tables initialized", db_path=self._db_path)
 
     async def close(self) -> None:
@@ -86,6 +165,31 @@ class PersistenceRepository:
         await self._engine.dispose()
         logger.debug("Persistence repository closed")
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[AsyncSession]:
+        """Open a session whose writes are committed together on exit.
+
+        Pass the yielded session to save_service_state(), record_tag_value()
+        or log_command() to group several writes into one commit. The
+        transaction is rolled back if the block raises.
+
+        Example:
+            >>> async with repo.transaction() as session:
+            ...     await repo.save_service_state(..., session=session)
+            ...     await repo.log_command(..., session=session)
+        """
+        async with self._session_factory() as session, session.begin():
+            yield session
+
+    @asynccontextmanager
+    async def _write_session(self, session: AsyncSession | None) -> AsyncIterator[AsyncSession]:
+        """Yield the caller's session, or a new one that commits on exit."""
+        if session is not None:
+            yield session
+            return
+        async with self.transaction() as own_session:
+            yield own_session
+
     # -------------------------------------------------------------------------
     # Service State Operations
     # -------------------------------------------------------------------------
@@ -96,51 +200,69 @@ class PersistenceRepository:
         state: Any,  # PackMLState enum
         procedure_id: int | None,
         parameters: dict[str, Any],
+        *,
+        session: AsyncSession | None = None,
     ) -> None:
         """Save or update service state snapshot.
 
         Upserts the service state - creates if new, updates if exists.
-        Uses SQLite INSERT OR REPLACE to handle concurrent updates safely.
+        Uses SQLite INSERT ... ON CONFLICT DO UPDATE to handle concurrent
+        updates safely. When the state, procedure and parameters match the
+        last snapshot saved for the service, only updated_at is refreshed.
 
         Args:
             service_name: Unique service identifier
             state: PackML state (enum or value)
             procedure_id: Active procedure ID
             parameters: Procedure parameters
+            session: Session from transaction() to join; commits its own if None
         """
         # Convert state enum to string if needed
-        state_str = state.name if hasattr(state, "name") else str(state)
-        params_json = json.dumps(parameters) if parameters else "{}"
+        state_str = _STATE_NAMES.get(state) or str(state)
+        params_json = orjson.dumps(parameters).decode() if parameters else "{}"
+        snapshot_key = (state_str, procedure_id, params_json)
         now = datetime.now(UTC)
 
-        async with self._session_factory() as session:
-            # Use SQLite upsert (INSERT OR REPLACE via on_conflict_do_update)
-            stmt = sqlite_insert(ServiceStateSnapshot).values(
-                service_name=service_name,
-                state=state_str,
-                procedure_id=procedure_id,
-                parameters=params_json,
-                started_at=now,
-                updated_at=now,
-            )
-            # On conflict with service_name, update the other fields
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["service_name"],
-                set_={
+        if session is None and self._saved_states.get(service_name) == snapshot_key:
+            async with self.transaction() as write_session:
+                touched = await write_session.execute(
+                    _STMT_TOUCH_STATE,
+                    {
+                        "b_service_name": service_name,
+                        "b_state": state_str,
+                        "b_procedure_id": procedure_id,
+                        "b_parameters": params_json,
+                        "b_touched_at": now,
+                    },
+                )
+            if touched.rowcount:
+                return
+
+        async with self._write_session(session) as write_session:
+            # SQLite upsert: on service_name conflict, update all but started_at
+            await write_session.execute(
+                _STMT_UPSERT_STATE,
+                {
+                    "service_name": service_name,
                     "state": state_str,
                     "procedure_id": procedure_id,
                     "parameters": params_json,
+                    "started_at": now,
                     "updated_at": now,
                 },
             )
-            await session.execute(stmt)
-            await session.commit()
             logger.debug(
                 "Service state saved",
                 service=service_name,
                 state=state_str,
             )
 
+        if session is None:
+            self._saved_states[service_name] = snapshot_key
+        else:
+            # Commit is up to the caller's transaction; don't trust the cache
+            self._saved_states.pop(service_name, None)
+
     async def get_service_state(self, service_name: str) -> ServiceStateSnapshot | None:
         """Get service state snapshot by name.
 
@@ -151,15 +273,12 @@ class PersistenceRepository:
             ServiceStateSnapshot or None if not found
         """
         async with self._session_factory() as session:
-            stmt = select(ServiceStateSnapshot).where(
-                ServiceStateSnapshot.service_name == service_name
-            )
-            result = await session.execute(stmt)
+            result = await session.execute(_STMT_GET_STATE, {"service_name": service_name})
             snapshot = result.scalar_one_or_none()
 
             if snapshot and isinstance(snapshot.parameters, str):
                 # Deserialize parameters JSON
-                snapshot.parameters = json.loads(snapshot.parameters)
+                snapshot.parameters = orjson.loads(snapshot.parameters)
 
             return snapshot
 
@@ -172,10 +291,8 @@ class PersistenceRepository:
             service_name: Service identifier
         """
         async with self._session_factory() as session:
-            stmt = delete(ServiceStateSnapshot).where(
-                ServiceStateSnapshot.service_name == service_name
-            )
-            await session.execute(stmt)
+            self._saved_states.pop(service_name, None)
+            await session.execute(_STMT_DELETE_STATE, {"service_name": service_name})
             await session.commit()
             logger.debug("Service state deleted", service=service_name)
 
@@ -186,14 +303,13 @@ class PersistenceRepository:
             List of all persisted service states
         """
         async with self._session_factory() as session:
-            stmt = select(ServiceStateSnapshot)
-            result = await session.execute(stmt)
+            result = await session.execute(_STMT_ALL_STATES)
             snapshots = list(result.scalars().all())
 
             # Deserialize parameters JSON
             for snapshot in snapshots:
                 if isinstance(snapshot.parameters, str):
-                    snapshot.parameters = json.loads(snapshot.parameters)
+                    snapshot.parameters = orjson.loads(snapshot.parameters)
 
             return snapshots
 
@@ -208,6 +324,8 @@ class PersistenceRepository:
         quality: Quality,
         timestamp: datetime,
         source_timestamp: datetime | None = None,
+        *,
+        session: AsyncSession | None = None,
     ) -> None:
         """Record a tag value for historical storage.
 
@@ -219,22 +337,20 @@ class PersistenceRepository:
             quality: OPC UA quality
             timestamp: Gateway timestamp
             source_timestamp: Source timestamp from PLC
+            session: Session from transaction() to join; commits its own if None
         """
         # Convert quality enum to string
-        quality_str = quality.name if hasattr(quality, "name") else str(quality)
-        # Serialize value to JSON
-        value_json = json.dumps(value)
+        quality_str = _QUALITY_NAMES.get(quality) or str(quality)
 
-        async with self._session_factory() as session:
+        async with self._write_session(session) as write_session:
             record = TagValueRecord(
                 tag_name=tag_name,
-                value=value_json,
+                value=value,
                 quality=quality_str,
                 timestamp=timestamp,
                 source_timestamp=source_timestamp,
             )
-            session.add(record)
-            await session.commit()
+            write_session.add(record)
 
     async def get_tag_history(
         self,
@@ -253,29 +369,10 @@ class PersistenceRepository:
             List of TagValueRecord ordered by timestamp ascending
         """
         async with self._session_factory() as session:
-            stmt = (
-                select(TagValueRecord)
-                .where(
-                    TagValueRecord.tag_name == tag_name,
-                    TagValueRecord.timestamp >= start,
-                    TagValueRecord.timestamp <= end,
-                )
-                .order_by(TagValueRecord.timestamp.asc())
+            result = await session.execute(
+                _STMT_TAG_HISTORY, {"tag_name": tag_name, "start": start, "end": end}
             )
-            result = await session.execute(stmt)
-            records = list(result.scalars().all())
-
-            # Deserialize value JSON and restore timezone info
-            for record in records:
-                if isinstance(record.value, str):
-                    record.value = json.loads(record.value)
-                # SQLite doesn't preserve timezone info, restore UTC
-                if record.timestamp and record.timestamp.tzinfo is None:
-                    record.timestamp = record.timestamp.replace(tzinfo=UTC)
-                if record.source_timestamp and record.source_timestamp.tzinfo is None:
-                    record.source_timestamp = record.source_timestamp.replace(tzinfo=UTC)
-
-            return records
+            return list(result.scalars().all())
 
     # -------------------------------------------------------------------------
     # Command Audit Log Operations
@@ -289,6 +386,8 @@ class PersistenceRepository:
         parameters: dict[str, Any] | None = None,
         result: str = "SUCCESS",
         error_message: str | None = None,
+        *,
+        session: AsyncSession | None = None,
     ) -> None:
         """Log a command execution for audit purposes.
 
@@ -299,8 +398,9 @@ class PersistenceRepository:
             parameters: Command parameters
             result: Command result (SUCCESS, FAILED)
             error_message: Error message if command failed
+            session: Session from transaction() to join; commits its own if None
         """
-        async with self._session_factory() as session:
+        async with self._write_session(session) as write_session:
             log = CommandAuditLog(
                 timestamp=timestamp,
                 command_type=command_type,
@@ -309,8 +409,7 @@ class PersistenceRepository:
                 result=result,
                 error_message=error_message,
             )
-            session.add(log)
-            await session.commit()
+            write_session.add(log)
 
     async def get_audit_log(
         self,
@@ -327,23 +426,9 @@ class PersistenceRepository:
             List of CommandAuditLog ordered by timestamp ascending
         """
         async with self._session_factory() as session:
-            stmt = (
-                select(CommandAuditLog)
-                .where(
-                    CommandAuditLog.timestamp >= start,
-                    CommandAuditLog.timestamp <= end,
-                )
-                .order_by(CommandAuditLog.timestamp.asc())
-            )
-            result = await session.execute(stmt)
+            result = await session.execute(_STMT_AUDIT_LOG, {"start": start, "end": end})
             logs = list(result.scalars().all())
 
-            # Deserialize parameters JSON and restore timezone info
-            for log in logs:
-                if isinstance(log.parameters, str):
-                    log.parameters = json.loads(log.parameters)
-                # SQLite doesn't preserve timezone info, restore UTC
-                if log.timestamp and log.timestamp.tzinfo is None:
-                    log.timestamp = log.timestamp.replace(tzinfo=UTC)
-
-            return logs
+            if len(logs) > _OFFLOAD_THRESHOLD:
+                return await asyncio.to_thread(_deserialize_audit_logs, logs)
+            return _deserialize_audit_logs(logs)
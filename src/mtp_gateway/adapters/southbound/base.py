@@ -8,12 +8,14 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
+import importlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from random import SystemRandom
-from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+from random import Random
+from typing import TYPE_CHECKING, Any, Protocol, cast, runtime_checkable
 
 import structlog
 
@@ -21,10 +23,11 @@ from mtp_gateway.config.schema import ConnectorConfig, ConnectorType
 from mtp_gateway.domain.model.tags import Quality, TagValue
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from mtp_gateway.domain.model.tags import TagDefinition
 
 logger = structlog.get_logger(__name__)
-_JITTER_RNG = SystemRandom()
 
 
 class ConnectorState(Enum):
@@ -38,6 +41,13 @@ class ConnectorState(Enum):
     STOPPED = "stopped"
 
 
+# States in which there is no connection to tear down
+_INACTIVE_STATES = frozenset({ConnectorState.DISCONNECTED, ConnectorState.STOPPED})
+
+# Sentinel for addresses absent from a _do_read result (None is a valid value)
+_MISSING = object()
+
+
 @dataclass
 class ConnectorHealth:
     """Health status for a connector."""
@@ -56,14 +66,23 @@ class ConnectorHealth:
         """Check if connector is in a healthy state."""
         return self.state == ConnectorState.CONNECTED and self.consecutive_errors == 0
 
-    def record_success(self) -> None:
-        """Record a successful operation."""
-        self.last_success = datetime.now(UTC)
+    def record_success(self, now: datetime | None = None) -> None:
+        """Record a successful operation.
+
+        Args:
+            now: Timestamp already taken by the caller, to avoid a second clock read
+        """
+        self.last_success = now or datetime.now(UTC)
         self.consecutive_errors = 0
 
-    def record_error(self, message: str) -> None:
-        """Record a failed operation."""
-        self.last_error = datetime.now(UTC)
+    def record_error(self, message: str, now: datetime | None = None) -> None:
+        """Record a failed operation.
+
+        Args:
+            message: Error description
+            now: Timestamp already taken by the caller, to avoid a second clock read
+        """
+        self.last_error = now or datetime.now(UTC)
         self.last_error_message = message
         self.consecutive_errors += 1
         self.total_errors += 1
@@ -147,6 +166,9 @@ class BaseConnector(ABC):
     and error handling.
     """
 
+    # Subclasses that don't declare __slots__ still get a __dict__ as usual
+    __slots__ = ("_backoff", "_config", "_health", "_lock")
+
     def __init__(self, config: ConnectorConfig) -> None:
         self._config: ConnectorConfig = config
         self._health = ConnectorHealth(state=ConnectorState.DISCONNECTED)
@@ -188,8 +210,13 @@ class BaseConnector(ABC):
 
     async def connect(self) -> None:
         """Connect with retry logic."""
+        # Lock-free fast path for the common already-connected case;
+        # the state is re-checked under the lock below.
+        if self._health.state is ConnectorState.CONNECTED:
+            return
+
         async with self._lock:
-            if self._health.state == ConnectorState.CONNECTED:
+            if self._health.state is ConnectorState.CONNECTED:
                 return
 
             self._health.state = ConnectorState.CONNECTING
@@ -209,8 +236,11 @@ class BaseConnector(ABC):
 
     async def disconnect(self) -> None:
         """Disconnect gracefully."""
+        if self._health.state in _INACTIVE_STATES:
+            return
+
         async with self._lock:
-            if self._health.state in (ConnectorState.DISCONNECTED, ConnectorState.STOPPED):
+            if self._health.state in _INACTIVE_STATES:
                 return
 
             logger.info("Disconnecting from PLC", connector=self.name)
@@ -230,28 +260,27 @@ class BaseConnector(ABC):
 
         try:
             raw_values = await self._do_read(addresses)
-            self._health.record_success()
+            now = datetime.now(UTC)
+            self._health.record_success(now)
 
-            # Convert raw values to TagValue with good quality
+            # One pass over the requested addresses, in request order; addresses
+            # _do_read could not read share one frozen BAD_CONFIG_ERROR value.
+            good = Quality.GOOD
+            missing = TagValue(value=0, timestamp=now, quality=Quality.BAD_CONFIG_ERROR)
+            get = raw_values.get
             result: dict[str, TagValue] = {}
-            now = datetime.now(UTC)
             for addr in addresses:
-                if addr in raw_values:
-                    result[addr] = TagValue(
-                        value=raw_values[addr],
-                        timestamp=now,
-                        quality=Quality.GOOD,
-                    )
-                else:
-                    result[addr] = TagValue(
-                        value=0,
-                        timestamp=now,
-                        quality=Quality.BAD_CONFIG_ERROR,
-                    )
+                value = get(addr, _MISSING)
+                result[addr] = (
+                    missing
+                    if value is _MISSING
+                    else TagValue(value=value, timestamp=now, quality=good)
+                )
             return result
 
         except Exception as e:
-            self._health.record_error(str(e))
+            now = datetime.now(UTC)
+            self._health.record_error(str(e), now)
             logger.warning(
                 "Read failed",
                 connector=self.name,
@@ -259,16 +288,9 @@ class BaseConnector(ABC):
                 error=str(e),
             )
 
-            # Return bad quality values
-            now = datetime.now(UTC)
-            return {
-                addr: TagValue(
-                    value=0,
-                    timestamp=now,
-                    quality=Quality.BAD_NO_COMMUNICATION,
-                )
-                for addr in addresses
-            }
+            # Return bad quality values; TagValue is frozen so one instance is shared
+            bad = TagValue(value=0, timestamp=now, quality=Quality.BAD_NO_COMMUNICATION)
+            return dict.fromkeys(addresses, bad)
 
     async def read_tag_values(self, tags: list[TagDefinition]) -> dict[str, TagValue]:
         """Read tags using their definitions.
@@ -280,9 +302,8 @@ class BaseConnector(ABC):
             return {}
 
         values_by_address = await self.read_tags([tag.address for tag in tags])
-        return {
-            tag.name: values_by_address.get(tag.address, TagValue.bad_no_comm()) for tag in tags
-        }
+        missing = TagValue.bad_no_comm()
+        return {tag.name: values_by_address.get(tag.address, missing) for tag in tags}
 
     async def write_tag(self, address: str, value: Any) -> bool:
         """Write with error handling."""
@@ -358,6 +379,25 @@ class ExponentialBackoff:
     max_retries: int = 10
     jitter: float = 0.1
     attempts: int = field(default=0, init=False)
+    _delays: list[float] = field(default_factory=list, init=False, repr=False)
+    _two_jitter: float = field(default=0.0, init=False, repr=False)
+    # Per-instance PRNG: jitter is not security sensitive, and this avoids
+    # both the urandom syscall and contention on the shared module generator
+    _rng: Random = field(default_factory=Random, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the doubling delays below max_delay and the jitter span.
+
+        Doubling stops at max_delay; later attempts use max_delay directly,
+        so the table stays short however large max_retries is.
+        """
+        delays: list[float] = []
+        delay = self.base_delay
+        while delay < self.max_delay and len(delays) < self.max_retries:
+            delays.append(delay)
+            delay *= 2
+        self._delays = delays
+        self._two_jitter = 2 * self.jitter
 
     def next_delay(self) -> float | None:
         """Calculate next delay with exponential backoff and jitter.
@@ -368,20 +408,51 @@ class ExponentialBackoff:
         if self.attempts >= self.max_retries:
             return None
 
-        self.attempts += 1
-        delay = min(self.base_delay * (2 ** (self.attempts - 1)), self.max_delay)
+        attempt = self.attempts
+        delays = self._delays
+        delay = delays[attempt] if attempt < len(delays) else self.max_delay
+        self.attempts = attempt + 1
 
-        # Add jitter to prevent thundering herd
-        jitter_range = delay * self.jitter
-        delay += _JITTER_RNG.uniform(-jitter_range, jitter_range)
+        # Add +/- jitter to prevent thundering herd
+        span = delay * self._two_jitter
+        delay += self._rng.random() * span - span * 0.5
 
-        return max(0.1, float(delay))
+        return max(0.1, delay)
 
     def reset(self) -> None:
         """Reset attempt counter."""
         self.attempts = 0
 
 
+# Connector implementations by type, as (module, class) so the protocol
+# drivers (and their optional dependencies) are only imported when used.
+_CONNECTOR_CLASSES: dict[ConnectorType, tuple[str, str]] = {
+    ConnectorType.MODBUS_TCP: (
+        "mtp_gateway.adapters.southbound.modbus.driver",
+        "ModbusTCPConnector",
+    ),
+    ConnectorType.MODBUS_RTU: (
+        "mtp_gateway.adapters.southbound.modbus.driver",
+        "ModbusRTUConnector",
+    ),
+    ConnectorType.S7: ("mtp_gateway.adapters.southbound.s7.driver", "S7Connector"),
+    ConnectorType.EIP: ("mtp_gateway.adapters.southbound.eip.driver", "EIPConnector"),
+    ConnectorType.OPCUA_CLIENT: (
+        "mtp_gateway.adapters.southbound.opcua_client.driver",
+        "OPCUAClientConnector",
+    ),
+}
+
+
+@functools.cache
+def _connector_class(connector_type: ConnectorType) -> Callable[[Any], ConnectorPort]:
+    """Import and memoize the connector class for a connector type."""
+    # Import implementations lazily to avoid circular imports
+    module_name, class_name = _CONNECTOR_CLASSES[connector_type]
+    module = importlib.import_module(module_name)
+    return cast("Callable[[Any], ConnectorPort]", getattr(module, class_name))
+
+
 def create_connector(config: ConnectorConfig) -> ConnectorPort:
     """Factory function to create a connector from configuration.
 
@@ -394,41 +465,6 @@ def create_connector(config: ConnectorConfig) -> ConnectorPort:
     Raises:
         ValueError: If connector type is not supported
     """
-    # Import implementations here to avoid circular imports
-    if config.type == ConnectorType.MODBUS_TCP:
-        from mtp_gateway.adapters.southbound.modbus.driver import (  # noqa: PLC0415
-            ModbusTCPConnector,
-        )
-
-        return ModbusTCPConnector(config)
-
-    elif config.type == ConnectorType.MODBUS_RTU:
-        from mtp_gateway.adapters.southbound.modbus.driver import (  # noqa: PLC0415
-            ModbusRTUConnector,
-        )
-
-        return ModbusRTUConnector(config)
-
-    elif config.type == ConnectorType.S7:
-        from mtp_gateway.adapters.southbound.s7.driver import (  # noqa: PLC0415
-            S7Connector,
-        )
-
-        return S7Connector(config)
-
-    elif config.type == ConnectorType.EIP:
-        from mtp_gateway.adapters.southbound.eip.driver import (  # noqa: PLC0415
-            EIPConnector,
-        )
-
-        return EIPConnector(config)
-
-    elif config.type == ConnectorType.OPCUA_CLIENT:
-        from mtp_gateway.adapters.southbound.opcua_client.driver import (  # noqa: PLC0415
-            OPCUAClientConnector,
-        )
-
-        return OPCUAClientConnector(config)
-
-    else:
+    if config.type not in _CONNECTOR_CLASSES:
         raise ValueError(f"Unsupported connector type: {config.type}")
+    return _connector_class(config.type)(config)
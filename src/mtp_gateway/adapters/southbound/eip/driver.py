@@ -17,14 +17,21 @@ from __future__ import annotations
 
 import asyncio
 import re
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import structlog
 
 from mtp_gateway.adapters.southbound.base import BaseConnector
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from mtp_gateway.config.schema import EIPConnectorConfig
 
 # Import pycomm3 lazily to handle optional dependency
@@ -41,8 +48,16 @@ HAS_PYCOMM3: bool = _HAS_PYCOMM3
 
 logger = structlog.get_logger(__name__)
 
+# Flush the coalescing window early once this many reads are queued
+_COALESCE_MAX_PENDING = 16
+
+T = TypeVar("T")
+
+# Number of distinct address lists whose read plans are kept per connector
+_PLAN_CACHE_SIZE = 64
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ParsedEIPAddress:
     """Parsed EIP tag address.
 
@@ -57,18 +72,22 @@ class ParsedEIPAddress:
     bit: int | None = None
 
 
-# Regular expressions for parsing EIP addresses
-# Array element: TagName[N] where N is a non-negative integer
-_ARRAY_PATTERN = re.compile(r"^(.+)\[(\d+)\]$")
-# Bit access: TagName{N} where N is a non-negative integer
-_BIT_PATTERN = re.compile(r"^(.+)\{(\d+)\}$")
-# Combined: TagName[N]{M} - array element with bit access
-_ARRAY_BIT_PATTERN = re.compile(r"^(.+)\[(\d+)\]\{(\d+)\}$")
+# Single pattern for array/bit suffixes: TagName[N], TagName{M}, TagName[N]{M}.
+# The lazy tag group keeps nested paths intact (e.g. MyUDT[1].Member[2]).
+# Unanchored and used with fullmatch(); ASCII keeps \d to plain digits.
+_EIP_PATTERN = re.compile(
+    r"(?P<tag>.+?)(?:\[(?P<elem>\d+)\])?(?:\{(?P<bit>\d+)\})?",
+    re.ASCII,
+)
 
 
+@lru_cache(maxsize=4096)
 def parse_eip_address(address_str: str) -> ParsedEIPAddress:
     """Parse an EIP tag address string into components.
 
+    Results are memoized: polled tag lists repeat every scan, so after the
+    first cycle parsing is a single cache lookup.
+
     Supports formats:
     - "MyTag"                      - Simple tag
     - "Program:MainProgram.MyTag"  - Program-scoped tag
@@ -91,46 +110,33 @@ def parse_eip_address(address_str: str) -> ParsedEIPAddress:
     if not address_str:
         raise ValueError("Invalid EIP address: empty string")
 
-    # Check for combined array + bit pattern first: Tag[N]{M}
-    match = _ARRAY_BIT_PATTERN.match(address_str)
-    if match:
-        tag_name = match.group(1)
-        element = int(match.group(2))
-        bit = int(match.group(3))
-        return ParsedEIPAddress(tag_name=tag_name, element=element, bit=bit)
+    has_bracket = "[" in address_str
+    has_brace = "{" in address_str
 
-    # Check for bit access pattern: Tag{N}
-    match = _BIT_PATTERN.match(address_str)
-    if match:
-        tag_name = match.group(1)
-        bit = int(match.group(2))
-        return ParsedEIPAddress(tag_name=tag_name, element=None, bit=bit)
+    # Fast path: simple tag name (including UDT members and program-scoped
+    # tags), which is the bulk of real configurations
+    if not has_bracket and not has_brace:
+        return ParsedEIPAddress(tag_name=address_str, element=None, bit=None)
 
-    # Check for array element pattern: Tag[N]
-    match = _ARRAY_PATTERN.match(address_str)
+    match = _EIP_PATTERN.fullmatch(address_str)
     if match:
-        tag_name = match.group(1)
-        element = int(match.group(2))
-        return ParsedEIPAddress(tag_name=tag_name, element=element, bit=None)
+        element = match["elem"]
+        bit = match["bit"]
+        if element is not None or bit is not None:
+            return ParsedEIPAddress(
+                tag_name=match["tag"],
+                element=int(element) if element is not None else None,
+                bit=int(bit) if bit is not None else None,
+            )
 
-    # Check for malformed patterns (unclosed brackets/braces)
-    if "[" in address_str and "]" not in address_str:
+    # No pattern matched - classify the error
+    if has_bracket and "]" not in address_str:
         raise ValueError(f"Invalid EIP address: unclosed bracket in '{address_str}'")
-    if "{" in address_str and "}" not in address_str:
+    if has_brace and "}" not in address_str:
         raise ValueError(f"Invalid EIP address: unclosed brace in '{address_str}'")
-
-    # Check for invalid array index (non-numeric)
-    if "[" in address_str:
-        # Has brackets but didn't match pattern - invalid index
+    if has_bracket:
         raise ValueError(f"Invalid EIP address: invalid array index in '{address_str}'")
-
-    # Check for invalid bit offset (non-numeric)
-    if "{" in address_str:
-        # Has braces but didn't match pattern - invalid bit
-        raise ValueError(f"Invalid EIP address: invalid bit offset in '{address_str}'")
-
-    # Simple tag name (including UDT members and program-scoped tags)
-    return ParsedEIPAddress(tag_name=address_str, element=None, bit=None)
+    raise ValueError(f"Invalid EIP address: invalid bit offset in '{address_str}'")
 
 
 def _build_tag_string(parsed: ParsedEIPAddress) -> str:
@@ -151,16 +157,138 @@ def _build_tag_string(parsed: ParsedEIPAddress) -> str:
     return parsed.tag_name
 
 
+# (tag_list, targets) for one batched read. targets[i] lists the (address, mask)
+# pairs served by tag_list[i], mask being 1 << bit for bit addresses. Addresses
+# sharing a base tag (e.g. Status{0} and Status{1}) map to one tag_list entry.
+# chunks partitions tag_list into the requests issued for one batched read.
+_ReadPlan = tuple[list[str], list[list[tuple[str, int | None]]], list[list[str]]]
+
+# Multiple Service Packet header plus per-service request/reply framing
+_MSP_OVERHEAD = 24
+_SERVICE_OVERHEAD = 8
+# Assumed reply payload per tag; UDTs are larger, and pycomm3 still splits
+# any request whose reply would overflow the connection size
+_SCALAR_REPLY_BYTES = 8
+
+
+def _tag_size_hint(tag_str: str) -> int:
+    """Estimate the bytes one tag adds to a Multiple Service Packet.
+
+    The request carries the symbolic path (padded to an even length) and the
+    reply carries the value, assumed scalar-sized.
+    """
+    return _SERVICE_OVERHEAD + len(tag_str) + (len(tag_str) & 1) + _SCALAR_REPLY_BYTES
+
+
+def _chunk_tags(tag_list: list[str], mtu: int, max_tags: int) -> list[list[str]]:
+    """Greedily pack tags into requests that fit the MTU and tag-count limits.
+
+    With both limits disabled (0) the whole list is a single request.
+    """
+    if not mtu and not max_tags:
+        return [tag_list]
+    budget = mtu - _MSP_OVERHEAD if mtu else 0
+    chunks: list[list[str]] = []
+    chunk: list[str] = []
+    used = 0
+    for tag_str in tag_list:
+        size = _tag_size_hint(tag_str)
+        if chunk and ((budget and used + size > budget) or len(chunk) == max_tags):
+            chunks.append(chunk)
+            chunk = []
+            used = 0
+        chunk.append(tag_str)
+        used += size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _tag_root(tag_str: str) -> str:
+    """Return the base tag a path hangs off (MyUDT for MyUDT.Member[2])."""
+    end = len(tag_str)
+    for sep in ".[":
+        index = tag_str.find(sep)
+        if index != -1 and index < end:
+            end = index
+    return tag_str[:end]
+
+
+def _store_value(
+    value: Any, tag_targets: list[tuple[str, int | None]], results: dict[str, Any]
+) -> None:
+    """Fan one tag value out to every address it serves.
+
+    Bit addresses each mask their own bit out of the shared integer.
+    """
+    is_int = isinstance(value, int)
+    for addr, mask in tag_targets:
+        if mask is not None and is_int:
+            results[addr] = (value & mask) != 0
+        else:
+            results[addr] = value
+
+
+def _read_chunks(driver: Any, chunks: list[list[str]]) -> list[Any]:
+    """Read each chunk with one driver call and concatenate the results in order."""
+    results: list[Any] = []
+    for chunk in chunks:
+        result = driver.read(*chunk)
+        if len(chunk) == 1:
+            results.append(result)
+        else:
+            results.extend(result)
+    return results
+
+
+@lru_cache(maxsize=4096)
+def _resolve(address_str: str) -> tuple[str, ParsedEIPAddress]:
+    """Parse an address and build its pycomm3 tag string in one cached lookup.
+
+    Raises:
+        ValueError: If address format is invalid
+    """
+    parsed = parse_eip_address(address_str)
+    # Interned so plan and result dicts hash and compare the same string object
+    return sys.intern(_build_tag_string(parsed)), parsed
+
+
 class EIPConnector(BaseConnector):
     """Allen-Bradley EtherNet/IP connector using pycomm3.
 
     Supports ControlLogix, CompactLogix, and Micro800 series PLCs.
     Uses CIP (Common Industrial Protocol) over EtherNet/IP.
 
-    pycomm3 is a synchronous library, so all operations are wrapped
-    with asyncio.to_thread() for async compatibility.
+    pycomm3 is a synchronous library whose socket is not thread-safe, so
+    all driver calls run on a single-worker executor owned by the connector.
+
+    Concurrent reads are coalesced: callers arriving within the same loop
+    iteration (or within ``coalesce_window_ms``) share one multi-tag request.
     """
 
+    __slots__ = (
+        "_batch_tasks",
+        "_cache_ttl_ns",
+        "_cip_mtu",
+        "_coalesce_window_s",
+        "_driver",
+        "_executor",
+        "_flush_handle",
+        "_host",
+        "_invalid_addresses",
+        "_keepalive_s",
+        "_keepalive_task",
+        "_last_io",
+        "_max_tags_per_packet",
+        "_pending",
+        "_pending_writes",
+        "_plan_cache",
+        "_slot",
+        "_value_cache",
+        "_write_flush_handle",
+        "_write_tasks",
+    )
+
     def __init__(self, config: EIPConnectorConfig) -> None:
         """Initialize EIP connector.
 
@@ -178,119 +306,306 @@ class EIPConnector(BaseConnector):
         self._driver: Any = None  # LogixDriver | None
         self._host = config.host
         self._slot = config.slot
+        self._coalesce_window_s = config.coalesce_window_ms / 1000
+        self._pending: list[tuple[list[str], asyncio.Future[dict[str, Any]]]] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+        self._plan_cache: OrderedDict[tuple[str, ...], _ReadPlan] = OrderedDict()
+        self._executor: ThreadPoolExecutor | None = None
+        self._keepalive_s = config.keepalive_s
+        self._cip_mtu = config.cip_mtu
+        self._max_tags_per_packet = config.max_tags_per_packet
+        self._cache_ttl_ns = config.cache_ttl_ms * 1_000_000
+        self._value_cache: dict[str, tuple[int, Any]] = {}
+        self._invalid_addresses: set[str] = set()
+        self._pending_writes: list[tuple[str, Any, asyncio.Future[None]]] = []
+        self._write_flush_handle: asyncio.Handle | None = None
+        self._write_tasks: set[asyncio.Task[None]] = set()
+        self._keepalive_task: asyncio.Task[None] | None = None
+        self._last_io = 0.0
+
+    def _submit(self, call: Callable[[], T]) -> asyncio.Future[T]:
+        """Run a blocking driver call on the connector's own executor thread.
+
+        The single-worker executor is created on first use and shut down on
+        disconnect, so every driver call for this connector runs on the same
+        thread instead of contending for the loop's shared default executor.
+        """
+        self._last_io = time.monotonic()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"eip-{self.name}"
+            )
+        return asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    def _shutdown_executor(self) -> None:
+        """Let the executor thread exit once its queued calls have run."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     async def _do_connect(self) -> None:
         """Establish connection to Allen-Bradley PLC.
 
         Uses pycomm3's LogixDriver for CIP/EIP communication.
         Connection is run in a thread to avoid blocking.
+
+        LogixDriver.open() registers an EtherNet/IP session and performs a
+        Forward Open, so reads use connected (Class 3) messaging; if the PLC
+        rejects the Forward Open, pycomm3 falls back to unconnected messaging.
+        With keepalive_s set, an idle connection is kept open by a periodic
+        no-op request so slow poll rates don't let the PLC time it out.
         """
+        self._plan_cache.clear()
+        self._value_cache.clear()
 
         def connect_sync() -> Any:
             driver = LogixDriver(self._host, slot=self._slot)
             driver.open()
             return driver
 
-        self._driver = await asyncio.to_thread(connect_sync)
+        self._driver = await self._submit(connect_sync)
 
         logger.debug(
             "EIP connected",
             host=self._host,
             slot=self._slot,
+            connected_messaging=bool(getattr(self._driver, "connected", False)),
         )
 
+        if self._keepalive_s > 0 and self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
     async def _do_disconnect(self) -> None:
         """Close connection to Allen-Bradley PLC."""
+        self._plan_cache.clear()
+        self._value_cache.clear()
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
         if self._driver:
 
             def disconnect_sync() -> None:
                 if self._driver:
                     self._driver.close()
 
-            await asyncio.to_thread(disconnect_sync)
-            self._driver = None
+            try:
+                await self._submit(disconnect_sync)
+            finally:
+                self._driver = None
+        self._shutdown_executor()
+
+    async def _keepalive_loop(self) -> None:
+        """Issue a cheap request whenever the connection has been idle too long."""
+        while True:
+            idle = time.monotonic() - self._last_io
+            if idle < self._keepalive_s:
+                await asyncio.sleep(self._keepalive_s - idle)
+                continue
+            driver = self._driver
+            if driver is None:
+                return
+            try:
+                await self._submit(driver.get_plc_time)
+            except Exception as e:
+                logger.warning("EIP keepalive failed", connector=self.name, error=str(e))
+                await asyncio.sleep(self._keepalive_s)
 
     async def _do_read(self, addresses: list[str]) -> dict[str, Any]:
         """Read multiple EIP tags.
 
+        The request is queued and merged with other reads pending on this
+        connector, so concurrent pollers cost a single CIP round trip.
+
         Args:
             addresses: List of EIP tag address strings to read
 
         Returns:
             Dictionary mapping addresses to values
-
-        Note:
-            pycomm3 supports batch reads natively - pass multiple tags
-            to read() for efficient communication.
         """
         if not self._driver:
             raise ConnectionError("Not connected")
 
-        driver = self._driver
-        results: dict[str, Any] = {}
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        self._pending.append((addresses, future))
+
+        if len(self._pending) >= _COALESCE_MAX_PENDING:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+            self._flush()
+        elif self._flush_handle is None:
+            if self._coalesce_window_s > 0:
+                self._flush_handle = loop.call_later(self._coalesce_window_s, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Start one batched read for every request queued so far."""
+        self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._read_coalesced(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _read_coalesced(
+        self, batch: list[tuple[list[str], asyncio.Future[dict[str, Any]]]]
+    ) -> None:
+        """Read the union of a batch's addresses and hand each caller its subset."""
+        unique = list(dict.fromkeys(addr for addresses, _ in batch for addr in addresses))
+        try:
+            values = await self._read_batch(unique)
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for addresses, future in batch:
+            if not future.done():
+                future.set_result({addr: values[addr] for addr in addresses if addr in values})
 
-        # Parse addresses and build tag list for batch read
-        tag_to_address: dict[str, str] = {}
-        parsed_addresses: dict[str, ParsedEIPAddress] = {}
+    def _read_plan(self, addresses: list[str]) -> _ReadPlan:
+        """Return the parsed read plan for an address list, building it on a miss.
 
+        Pollers pass the same address list every cycle, so the plan is kept
+        in a small LRU keyed by the list's contents.
+        """
+        key = tuple(addresses)
+        plan = self._plan_cache.get(key)
+        if plan is not None:
+            self._plan_cache.move_to_end(key)
+            return plan
+
+        tag_list: list[str] = []
+        targets: list[list[tuple[str, int | None]]] = []
+        tag_index: dict[str, int] = {}
+
+        invalid = self._invalid_addresses
         for addr in addresses:
+            if addr in invalid:
+                continue
             try:
-                parsed = parse_eip_address(addr)
-                tag_str = _build_tag_string(parsed)
-                tag_to_address[tag_str] = addr
-                parsed_addresses[addr] = parsed
+                tag_str, parsed = _resolve(addr)
             except ValueError as e:
+                # Remembered so the bad address is reported once, not on every
+                # new plan; it reads back as missing (BAD_CONFIG_ERROR)
+                invalid.add(addr)
                 logger.warning(
                     "Failed to parse EIP address",
                     address=addr,
                     error=str(e),
                 )
+                continue
+            target = (addr, None if parsed.bit is None else 1 << parsed.bit)
+            index = tag_index.get(tag_str)
+            if index is None:
+                tag_index[tag_str] = len(tag_list)
+                tag_list.append(tag_str)
+                targets.append([target])
+            else:
+                targets[index].append(target)
+
+        plan = (tag_list, targets, _chunk_tags(tag_list, self._cip_mtu, self._max_tags_per_packet))
+        self._plan_cache[key] = plan
+        if len(self._plan_cache) > _PLAN_CACHE_SIZE:
+            self._plan_cache.popitem(last=False)
+        return plan
+
+    def _serve_cached(
+        self,
+        tag_list: list[str],
+        targets: list[list[tuple[str, int | None]]],
+        chunks: list[list[str]],
+        results: dict[str, Any],
+    ) -> tuple[list[str], list[list[tuple[str, int | None]]], list[list[str]]]:
+        """Fill results from fresh cache entries and return the tags still to read."""
+        now_ns = time.monotonic_ns()
+        ttl_ns = self._cache_ttl_ns
+        cache = self._value_cache
+        stale_tags: list[str] = []
+        stale_targets: list[list[tuple[str, int | None]]] = []
+
+        for tag_str, tag_targets in zip(tag_list, targets, strict=True):
+            entry = cache.get(tag_str)
+            if entry is not None and now_ns - entry[0] < ttl_ns:
+                _store_value(entry[1], tag_targets, results)
+            else:
+                stale_tags.append(tag_str)
+                stale_targets.append(tag_targets)
 
-        if not tag_to_address:
-            return results
-
-        # Use batch read for efficiency
-        tag_list = list(tag_to_address.keys())
-
-        def read_sync() -> Any:
-            if len(tag_list) == 1:
-                return driver.read(tag_list[0])
-            return driver.read(*tag_list)
+        if len(stale_tags) == len(tag_list):
+            return tag_list, targets, chunks
+        stale_chunks = _chunk_tags(stale_tags, self._cip_mtu, self._max_tags_per_packet)
+        return stale_tags, stale_targets, stale_chunks
 
-        try:
-            read_result = await asyncio.to_thread(read_sync)
-
-            # Handle single vs multiple tag results
-            if len(tag_list) == 1:
-                tag_results = [read_result]
-            else:
-                tag_results = read_result if isinstance(read_result, list) else [read_result]
+    async def _read_batch(self, addresses: list[str]) -> dict[str, Any]:
+        """Issue one pycomm3 multi-tag read for the given addresses.
 
-            # Process results
-            for i, tag_str in enumerate(tag_list):
-                addr = tag_to_address[tag_str]
-                parsed = parsed_addresses[addr]
+        Note:
+            pycomm3 supports batch reads natively - pass multiple tags
+            to read() for efficient communication.
+        """
+        if not self._driver:
+            raise ConnectionError("Not connected")
 
-                if i < len(tag_results):
-                    tag_result = tag_results[i]
+        driver = self._driver
+        results: dict[str, Any] = {}
 
-                    # Check for error in tag result
-                    if hasattr(tag_result, "error") and tag_result.error:
-                        logger.warning(
-                            "EIP tag read error",
-                            address=addr,
-                            error=tag_result.error,
-                        )
-                        # Don't include in results - caller handles missing tags
-                        continue
+        tag_list, targets, chunks = self._read_plan(addresses)
+        if self._cache_ttl_ns and tag_list:
+            tag_list, targets, chunks = self._serve_cached(tag_list, targets, chunks, results)
+        if not tag_list:
+            return results
 
-                    value = tag_result.value if hasattr(tag_result, "value") else tag_result
+        try:
+            if len(chunks) == 1:
+                # driver.read(tag) and driver.read(*tags) are the same call for
+                # one tag, so the worker runs a prebuilt partial with no branching
+                read_result = await self._submit(partial(driver.read, *tag_list))
+            else:
+                # All chunks run back to back in one worker job
+                read_result = await self._submit(partial(_read_chunks, driver, chunks))
 
-                    # Handle bit extraction if needed
-                    if parsed.bit is not None and isinstance(value, int):
-                        value = bool(value & (1 << parsed.bit))
+            # pycomm3 returns a bare Tag for one tag and a list otherwise
+            tag_results = [read_result] if len(tag_list) == 1 else read_result
 
-                    results[addr] = value
+            # Process results
+            # zip stops at the shorter side, so a short result list simply
+            # leaves the remaining addresses missing
+            # Loop invariants hoisted out of the per-tag body
+            now_ns = time.monotonic_ns()
+            value_cache = self._value_cache if self._cache_ttl_ns else None
+            for tag_str, tag_result, tag_targets in zip(
+                tag_list, tag_results, targets, strict=False
+            ):
+                # Check for error in tag result
+                error = getattr(tag_result, "error", None)
+                if error:
+                    logger.warning(
+                        "EIP tag read error",
+                        addresses=[addr for addr, _ in tag_targets],
+                        error=error,
+                    )
+                    # Don't include in results - caller handles missing tags
+                    continue
+
+                value = getattr(tag_result, "value", tag_result)
+                if value_cache is not None:
+                    value_cache[tag_str] = (now_ns, value)
+                if len(tag_targets) == 1 and tag_targets[0][1] is None:
+                    # Common case: one plain address per tag, no bit to mask
+                    results[tag_targets[0][0]] = value
+                else:
+                    _store_value(value, tag_targets, results)
 
         except Exception as e:
             logger.warning(
@@ -305,6 +620,10 @@ class EIPConnector(BaseConnector):
     async def _do_write(self, address: str, value: Any) -> None:
         """Write to a single EIP tag.
 
+        Writes are pipelined like reads: concurrent writes are queued and sent
+        as one multi-tag driver.write(), and each caller still waits for its
+        own write to be acknowledged.
+
         Args:
             address: EIP tag address string
             value: Value to write
@@ -316,11 +635,7 @@ class EIPConnector(BaseConnector):
         if not self._driver:
             raise ConnectionError("Not connected")
 
-        parsed = parse_eip_address(address)
-        driver = self._driver
-
-        # Build tag string for pycomm3
-        tag_str = _build_tag_string(parsed)
+        tag_str, parsed = _resolve(address)
 
         # Handle bit writes
         write_value = value
@@ -329,11 +644,79 @@ class EIPConnector(BaseConnector):
             # For now, pass the boolean through and let pycomm3 handle it.
             write_value = value
 
-        def write_sync() -> Any:
-            return driver.write((tag_str, write_value))
-
-        result = await asyncio.to_thread(write_sync)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._pending_writes.append((tag_str, write_value, future))
+
+        if len(self._pending_writes) >= (self._max_tags_per_packet or _COALESCE_MAX_PENDING):
+            if self._write_flush_handle is not None:
+                self._write_flush_handle.cancel()
+            self._flush_writes()
+        elif self._write_flush_handle is None:
+            if self._coalesce_window_s > 0:
+                self._write_flush_handle = loop.call_later(
+                    self._coalesce_window_s, self._flush_writes
+                )
+            else:
+                self._write_flush_handle = loop.call_soon(self._flush_writes)
 
-        # Check for write error
-        if hasattr(result, "error") and result.error:
-            raise ValueError(f"Write failed: {result.error}")
+        try:
+            await future
+        finally:
+            if self._value_cache:
+                # Anything on the same base tag may overlap the written value
+                root = _tag_root(tag_str)
+                for cached in [key for key in self._value_cache if _tag_root(key) == root]:
+                    del self._value_cache[cached]
+
+    async def flush_writes(self) -> None:
+        """Send queued writes now and wait for every write issued so far.
+
+        A barrier for callers that need all earlier writes (including other
+        callers') to have reached the PLC before proceeding.
+        """
+        if self._pending_writes:
+            if self._write_flush_handle is not None:
+                self._write_flush_handle.cancel()
+            self._flush_writes()
+        if self._write_tasks:
+            await asyncio.gather(*self._write_tasks, return_exceptions=True)
+
+    def _flush_writes(self) -> None:
+        """Start one batched write for every write queued so far."""
+        self._write_flush_handle = None
+        batch, self._pending_writes = self._pending_writes, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._write_coalesced(batch))
+        self._write_tasks.add(task)
+        task.add_done_callback(self._write_tasks.discard)
+
+    async def _write_coalesced(self, batch: list[tuple[str, Any, asyncio.Future[None]]]) -> None:
+        """Send a batch of writes in one driver call and settle each caller."""
+        driver = self._driver
+        try:
+            if driver is None:
+                raise ConnectionError("Not connected")
+            pairs = [(tag_str, value) for tag_str, value, _ in batch]
+            result = await self._submit(partial(driver.write, *pairs))
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # pycomm3 returns a bare Tag for one write and a list otherwise
+        tag_results = [result] if len(batch) == 1 else result
+        for i, (_, _, future) in enumerate(batch):
+            if future.done():
+                continue
+            error = getattr(tag_results[i], "error", None) if i < len(tag_results) else "no reply"
+            if error:
+                future.set_exception(ValueError(f"Write failed: {error}"))
+            else:
+                future.set_result(None)
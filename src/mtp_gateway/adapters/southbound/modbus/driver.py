@@ -12,10 +12,13 @@ Modbus Address Mapping:
 
 from __future__ import annotations
 
+import asyncio
+import re
 import struct
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast
 
 import structlog
@@ -24,7 +27,7 @@ from pymodbus.exceptions import ModbusException as PymodbusModbusException
 from pymodbus.pdu import ExceptionResponse
 
 from mtp_gateway.adapters.southbound.base import BaseConnector
-from mtp_gateway.domain.model.tags import Quality, TagDefinition, TagValue
+from mtp_gateway.domain.model.tags import DataType, Quality, TagDefinition, TagValue
 
 if TYPE_CHECKING:
     from mtp_gateway.config.schema import ModbusRTUConnectorConfig, ModbusTCPConnectorConfig
@@ -34,6 +37,21 @@ logger = structlog.get_logger(__name__)
 ModbusException = cast("type[Exception]", PymodbusModbusException)
 
 
+# Result handed to an FC23 writer whose write did not go out with a read
+_NOT_CARRIED = object()
+
+# Longest a register write waits for an in-flight poll to carry it as FC23
+_FC23_HOLD_S = 0.05
+
+
+class _DeviceRejectedError(Exception):
+    """The device answered a run's request with a Modbus exception response.
+
+    Kept apart from pymodbus' own exceptions, which also cover timeouts and
+    dropped connections: only a rejection is worth retrying address by address.
+    """
+
+
 class ModbusRegisterType(Enum):
     """Modbus register types determined by address range."""
 
@@ -43,19 +61,46 @@ class ModbusRegisterType(Enum):
     HOLDING_REGISTER = "holding_register"  # 40001-49999
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedAddress:
     """Parsed Modbus address with type and offset."""
 
-    register_type: ModbusRegisterType
     address: int  # 0-based address for pymodbus
+    register_type: ModbusRegisterType
     count: int = 1  # Number of registers to read
     bit_offset: int | None = None  # For bit-level access within registers
 
 
-def parse_modbus_address(address_str: str) -> ParsedAddress:  # noqa: PLR0911
+# Optional named prefix, address digits, optional ".bit" suffix
+_ADDRESS_PATTERN = re.compile(r"(HR|IR|DI|C)?(\d+)(?:\.(\d+))?", re.ASCII)
+
+_PREFIX_TYPES: dict[str, ModbusRegisterType] = {
+    "HR": ModbusRegisterType.HOLDING_REGISTER,
+    "IR": ModbusRegisterType.INPUT_REGISTER,
+    "DI": ModbusRegisterType.DISCRETE_INPUT,
+    "C": ModbusRegisterType.COIL,
+}
+
+# Bits per register, and the mask selecting each one
+_REGISTER_BITS = 16
+_BIT_MASKS: tuple[int, ...] = tuple(1 << bit for bit in range(_REGISTER_BITS))
+
+# (first, last, register type) for standard 5-digit addresses
+_ADDRESS_RANGES: tuple[tuple[int, int, ModbusRegisterType], ...] = (
+    (1, 9999, ModbusRegisterType.COIL),
+    (10001, 19999, ModbusRegisterType.DISCRETE_INPUT),
+    (30001, 39999, ModbusRegisterType.INPUT_REGISTER),
+    (40001, 49999, ModbusRegisterType.HOLDING_REGISTER),
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_modbus_address(address_str: str) -> ParsedAddress:
     """Parse a Modbus address string into components.
 
+    Results are memoized (and immutable): tag addresses repeat every poll,
+    so after the first cycle parsing is a single cache lookup.
+
     Supports formats:
     - "40001" - Standard 5-digit Modbus address
     - "HR100" - Holding register with 0-based address
@@ -74,72 +119,62 @@ def parse_modbus_address(address_str: str) -> ParsedAddress:  # noqa: PLR0911
         ValueError: If address format is invalid
     """
     address_str = address_str.strip().upper()
-    bit_offset = None
-
-    # Check for bit access (e.g., "40001.2")
-    if "." in address_str:
-        base, bit_str = address_str.split(".", 1)
-        bit_offset = int(bit_str)
-        address_str = base
-
-    # Named prefix format
-    if address_str.startswith("HR"):
+    match = _ADDRESS_PATTERN.fullmatch(address_str)
+    if match is None:
+        raise ValueError(f"Invalid Modbus address format: {address_str}")
+
+    prefix, number, bit = match.groups()
+    addr_num = int(number)
+    bit_offset = int(bit) if bit is not None else None
+    if bit_offset is not None and bit_offset >= _REGISTER_BITS:
+        raise ValueError(f"Invalid Modbus bit offset: {address_str}")
+
+    # Named prefix format: the number is already the 0-based address
+    if prefix is not None:
         return ParsedAddress(
-            register_type=ModbusRegisterType.HOLDING_REGISTER,
-            address=int(address_str[2:]),
-            bit_offset=bit_offset,
-        )
-    elif address_str.startswith("IR"):
-        return ParsedAddress(
-            register_type=ModbusRegisterType.INPUT_REGISTER,
-            address=int(address_str[2:]),
-            bit_offset=bit_offset,
-        )
-    elif address_str.startswith("DI"):
-        return ParsedAddress(
-            register_type=ModbusRegisterType.DISCRETE_INPUT,
-            address=int(address_str[2:]),
-            bit_offset=bit_offset,
-        )
-    elif address_str.startswith("C"):
-        return ParsedAddress(
-            register_type=ModbusRegisterType.COIL,
-            address=int(address_str[1:]),
+            register_type=_PREFIX_TYPES[prefix],
+            address=addr_num,
             bit_offset=bit_offset,
         )
 
     # Standard 5-digit Modbus address
-    try:
-        addr_num = int(address_str)
-    except ValueError as e:
-        raise ValueError(f"Invalid Modbus address format: {address_str}") from e
-
-    if 1 <= addr_num <= 9999:
-        return ParsedAddress(
-            register_type=ModbusRegisterType.COIL,
-            address=addr_num - 1,
-            bit_offset=bit_offset,
-        )
-    elif 10001 <= addr_num <= 19999:
-        return ParsedAddress(
-            register_type=ModbusRegisterType.DISCRETE_INPUT,
-            address=addr_num - 10001,
-            bit_offset=bit_offset,
-        )
-    elif 30001 <= addr_num <= 39999:
-        return ParsedAddress(
-            register_type=ModbusRegisterType.INPUT_REGISTER,
-            address=addr_num - 30001,
-            bit_offset=bit_offset,
-        )
-    elif 40001 <= addr_num <= 49999:
-        return ParsedAddress(
-            register_type=ModbusRegisterType.HOLDING_REGISTER,
-            address=addr_num - 40001,
-            bit_offset=bit_offset,
-        )
-    else:
-        raise ValueError(f"Invalid Modbus address range: {addr_num}")
+    for first, last, register_type in _ADDRESS_RANGES:
+        if first <= addr_num <= last:
+            return ParsedAddress(
+                register_type=register_type,
+                address=addr_num - first,
+                bit_offset=bit_offset,
+            )
+    raise ValueError(f"Invalid Modbus address range: {addr_num}")
+
+
+# (register count, struct format) per decodable datatype
+_DECODE_FORMATS: dict[str, tuple[int, str]] = {
+    "bool": (1, "?"),
+    "int16": (1, "h"),
+    "uint16": (1, "H"),
+    "int32": (2, "i"),
+    "uint32": (2, "I"),
+    "int64": (4, "q"),
+    "uint64": (4, "Q"),
+    "float32": (2, "f"),
+    "float64": (4, "d"),
+}
+
+# (datatype, little-endian bytes) -> (register count, register packer, value unpacker).
+# Packing the registers as "<H" swaps the bytes inside each word in the same
+# C call, so byte order costs nothing extra; word order is a tuple reversal.
+# Bools never reach the codecs: they only look at bit 0 of one register.
+_DECODE_CODECS: dict[tuple[str, bool], tuple[int, struct.Struct, struct.Struct]] = {
+    (datatype, little): (
+        nregs,
+        struct.Struct(f"{'<' if little else '>'}{nregs}H"),
+        struct.Struct(f">{fmt}"),
+    )
+    for datatype, (nregs, fmt) in _DECODE_FORMATS.items()
+    if datatype != "bool"
+    for little in (False, True)
+}
 
 
 def decode_registers(
@@ -160,22 +195,23 @@ def decode_registers(
     Returns:
         Decoded Python value
     """
-    format_map = {
-        "bool": (1, "?"),
-        "int16": (1, "h"),
-        "uint16": (1, "H"),
-        "int32": (2, "i"),
-        "uint32": (2, "I"),
-        "int64": (4, "q"),
-        "uint64": (4, "Q"),
-        "float32": (2, "f"),
-        "float64": (4, "d"),
-    }
-
-    if datatype not in format_map:
-        raise ValueError(f"Unsupported data type: {datatype}")
-
-    expected_regs, fmt = format_map[datatype]
+    if datatype == "bool":
+        if not registers:
+            raise ValueError("Not enough registers for bool: got 0, need 1")
+        return bool(registers[0] & 0x01)
+
+    # Single-register shapes make up most tags; decode them without struct
+    if registers and byte_order != "little":
+        if datatype == "uint16":
+            return registers[0]
+        if datatype == "int16":
+            reg = registers[0]
+            return reg - 0x10000 if reg & 0x8000 else reg
+
+    try:
+        expected_regs, packer, unpacker = _DECODE_CODECS[datatype, byte_order == "little"]
+    except KeyError:
+        raise ValueError(f"Unsupported data type: {datatype}") from None
     if len(registers) < expected_regs:
         raise ValueError(
             f"Not enough registers for {datatype}: got {len(registers)}, need {expected_regs}"
@@ -183,17 +219,74 @@ def decode_registers(
 
     regs = registers[:expected_regs]
     if word_order == "little" and expected_regs > 1:
-        regs = list(reversed(regs))
+        regs.reverse()
 
-    raw_bytes = b"".join(r.to_bytes(2, "big") for r in regs)
-    if byte_order == "little":
-        raw_bytes = b"".join(raw_bytes[i : i + 2][::-1] for i in range(0, len(raw_bytes), 2))
+    value = unpacker.unpack(packer.pack(*regs))[0]
+    return cast("float | int", value)
 
-    if datatype == "bool":
-        return bool(regs[0] & 0x01)
 
-    value = struct.unpack(f">{fmt}", raw_bytes[: expected_regs * 2])[0]
-    return cast("float | int", value)
+def decode_registers_batch(
+    registers: list[int],
+    datatype: str,
+    *,
+    byte_order: str = "big",
+    word_order: str = "big",
+) -> list[float | int | bool]:
+    """Decode a flat buffer of back-to-back values of one datatype.
+
+    Used for coalesced runs of back-to-back values of one type (see
+    ReadRun.codec): the whole buffer goes through one pack and one
+    iter_unpack, so the per-value cost stays in C rather than in a Python
+    call per value.
+
+    Args:
+        registers: 16-bit register values, a whole number of values long
+        datatype: Data type of every value in the buffer
+        byte_order: Byte order within registers ("big" or "little")
+        word_order: Word order across registers ("big" or "little")
+
+    Returns:
+        Decoded values in buffer order
+
+    Raises:
+        ValueError: If the datatype is unsupported or the buffer is ragged
+    """
+    try:
+        nregs, fmt = _DECODE_FORMATS[datatype]
+    except KeyError:
+        raise ValueError(f"Unsupported data type: {datatype}") from None
+    if len(registers) % nregs:
+        raise ValueError(
+            f"Register count {len(registers)} is not a multiple of {nregs} for {datatype}"
+        )
+
+    if datatype == "bool":
+        return [bool(reg & 0x01) for reg in registers]
+
+    # Reversing the whole buffer reverses the words inside every value (and
+    # the value order, which is undone at the end) in one C-level pass
+    reverse = word_order == "little" and nregs > 1
+    regs = registers[::-1] if reverse else registers
+    raw = struct.pack(f"{'<' if byte_order == 'little' else '>'}{len(regs)}H", *regs)
+    values: list[float | int | bool] = [value for (value,) in struct.iter_unpack(f">{fmt}", raw)]
+    if reverse:
+        values.reverse()
+    return values
+
+
+# (datatype, little-endian bytes) -> (value packer, register unpacker). The
+# mirror image of _DECODE_CODECS: the value is packed big-endian, and reading
+# the bytes back as "<H" swaps each word's bytes in the same C call. Bools are
+# handled by encode_value before the lookup.
+_ENCODE_CODECS: dict[tuple[str, bool], tuple[struct.Struct, struct.Struct]] = {
+    (datatype, little): (
+        struct.Struct(f">{fmt}"),
+        struct.Struct(f"{'<' if little else '>'}{nregs}H"),
+    )
+    for datatype, (nregs, fmt) in _DECODE_FORMATS.items()
+    if datatype != "bool"
+    for little in (False, True)
+}
 
 
 def encode_value(
@@ -208,173 +301,397 @@ def encode_value(
     Args:
         value: Value to encode
         datatype: Source data type
-        byte_order: Byte order
+        byte_order: Byte order within registers ("big" or "little")
+        word_order: Word order across registers ("big" or "little")
 
     Returns:
         List of 16-bit register values
     """
-    format_map = {
-        "bool": "H",
-        "int16": "h",
-        "uint16": "H",
-        "int32": "i",
-        "uint32": "I",
-        "int64": "q",
-        "uint64": "Q",
-        "float32": "f",
-        "float64": "d",
-    }
-
-    if datatype not in format_map:
-        raise ValueError(f"Unsupported data type: {datatype}")
-
-    fmt = format_map[datatype]
-    raw_bytes = struct.pack(f">{fmt}", value)
-
     if datatype == "bool":
-        raw_bytes = raw_bytes[:2]
+        # A bool goes out as a full register, in either byte order
+        return [1 if value else 0]
+
+    try:
+        packer, unpacker = _ENCODE_CODECS[datatype, byte_order == "little"]
+    except KeyError:
+        raise ValueError(f"Unsupported data type: {datatype}") from None
 
-    # Split into 16-bit words
-    words = [raw_bytes[i : i + 2] for i in range(0, len(raw_bytes), 2)]
-    if byte_order == "little":
-        words = [word[::-1] for word in words]
-    if word_order == "little" and len(words) > 1:
-        words = list(reversed(words))
+    words = unpacker.unpack(packer.pack(value))
+    if word_order == "little":
+        words = words[::-1]
+    return list(words)
 
-    return [int.from_bytes(word, "big") for word in words]
+
+# Registers occupied per datatype; strings are variable and handled separately
+_REGISTER_COUNTS: dict[str, int] = {
+    **{datatype: nregs for datatype, (nregs, _) in _DECODE_FORMATS.items()},
+    "string": 1,
+}
 
 
 def get_register_count(datatype: str) -> int:
     """Get number of 16-bit registers needed for a data type."""
-    sizes = {
-        "bool": 1,
-        "int16": 1,
-        "uint16": 1,
-        "int32": 2,
-        "uint32": 2,
-        "int64": 4,
-        "uint64": 4,
-        "float32": 2,
-        "float64": 4,
-        "string": 1,  # Variable, handled separately
-    }
-    return sizes.get(datatype, 1)
-
-
-class ModbusTCPConnector(BaseConnector):
-    """Modbus TCP connector implementation."""
+    return _REGISTER_COUNTS.get(datatype, 1)
 
-    def __init__(self, config: ModbusTCPConnectorConfig) -> None:
-        super().__init__(config)
-        self._client: AsyncModbusTcpClient | None = None
-        self._host = config.host
-        self._port = config.port
-        self._unit_id = config.unit_id
-        self._timeout = config.timeout_ms / 1000
 
-    async def _do_connect(self) -> None:
-        """Establish Modbus TCP connection."""
-        self._client = AsyncModbusTcpClient(
-            host=self._host,
-            port=self._port,
-            timeout=self._timeout,
-        )
-        connected = await self._client.connect()
-        if not connected:
-            raise ConnectionError(f"Failed to connect to {self._host}:{self._port}")
+# Protocol ceilings per request (Modbus Application Protocol v1.1b3, FC 01-04)
+_MAX_READ_REGISTERS = 125
+_MAX_READ_BITS = 2000
 
-        logger.debug(
-            "Modbus TCP connected",
-            host=self._host,
-            port=self._port,
-            unit_id=self._unit_id,
-        )
+_BIT_TYPES = frozenset({ModbusRegisterType.COIL, ModbusRegisterType.DISCRETE_INPUT})
 
-    async def _do_disconnect(self) -> None:
-        """Close Modbus TCP connection."""
-        if self._client:
-            self._client.close()
-            self._client = None
+# Register table -> (pymodbus client method, response carries bits rather than registers)
+_READERS: dict[ModbusRegisterType, tuple[str, bool]] = {
+    ModbusRegisterType.COIL: ("read_coils", True),
+    ModbusRegisterType.DISCRETE_INPUT: ("read_discrete_inputs", True),
+    ModbusRegisterType.INPUT_REGISTER: ("read_input_registers", False),
+    ModbusRegisterType.HOLDING_REGISTER: ("read_holding_registers", False),
+}
 
-    async def _do_read(self, addresses: list[str]) -> dict[str, Any]:
-        """Read multiple Modbus addresses.
 
-        Currently reads each address individually. Future optimization:
-        coalesce adjacent addresses into single reads.
-        """
-        if not self._client:
-            raise ConnectionError("Not connected")
+@dataclass(slots=True)
+class ReadRun:
+    """One coalesced read request covering several tags.
 
-        results: dict[str, Any] = {}
+    Attributes:
+        register_type: Register table the run reads from
+        start: First 0-based address in the run
+        count: Number of registers/bits requested
+        members: (tag, parsed address, offset into the response, register count)
+        codec: (datatype, byte_order, word_order) when the members are whole
+            register values of that one type, back to back from the start of
+            the run, so the response decodes with decode_registers_batch
+    """
 
-        for addr_str in addresses:
-            try:
-                parsed = parse_modbus_address(addr_str)
-                value = await self._read_single(parsed)
-                results[addr_str] = value
-            except Exception as e:
-                logger.warning(
-                    "Failed to read address",
-                    address=addr_str,
-                    error=str(e),
+    register_type: ModbusRegisterType
+    start: int
+    count: int
+    members: list[tuple[TagDefinition, ParsedAddress, int, int]]
+    codec: tuple[str, str, str] | None = None
+
+
+def plan_reads(
+    tags: list[TagDefinition], max_gap: int = 4
+) -> tuple[list[ReadRun], dict[str, ValueError]]:
+    """Group tags into as few protocol reads as possible.
+
+    Tags are grouped by register table and sorted by address. A tag joins the
+    current run when it starts at most ``max_gap`` registers (or bits) past
+    the run's end and the run stays within the protocol's per-request limit.
+
+    Args:
+        tags: Tags to read
+        max_gap: Unused addresses tolerated between merged tags
+
+    Returns:
+        The runs to issue, and address errors keyed by tag name
+    """
+    errors: dict[str, ValueError] = {}
+    by_type: dict[
+        ModbusRegisterType,
+        list[tuple[int, int, TagDefinition, ParsedAddress, tuple[str, str, str] | None]],
+    ] = {}
+
+    for tag in tags:
+        try:
+            parsed = parse_modbus_address(tag.address)
+        except ValueError as e:
+            errors[tag.name] = e
+            continue
+        codec: tuple[str, str, str] | None = None
+        if parsed.register_type in _BIT_TYPES or parsed.bit_offset is not None:
+            width = 1
+        else:
+            datatype = tag.datatype.value
+            width = get_register_count(datatype)
+            if datatype in _DECODE_FORMATS:
+                codec = (datatype, tag.byte_order, tag.word_order)
+        by_type.setdefault(parsed.register_type, []).append(
+            (parsed.address, width, tag, parsed, codec)
+        )
+
+    runs: list[ReadRun] = []
+    for register_type, entries in by_type.items():
+        limit = _MAX_READ_BITS if register_type in _BIT_TYPES else _MAX_READ_REGISTERS
+        entries.sort(key=lambda entry: entry[0])
+        run: ReadRun | None = None
+        for address, width, tag, parsed, codec in entries:
+            if run is not None:
+                end = run.start + run.count
+                new_end = max(end, address + width)
+                if address - end <= max_gap and new_end - run.start <= limit:
+                    if run.codec is not None and (codec != run.codec or address != end):
+                        run.codec = None
+                    run.count = new_end - run.start
+                    run.members.append((tag, parsed, address - run.start, width))
+                    continue
+            run = ReadRun(register_type, address, width, [(tag, parsed, 0, width)], codec)
+            runs.append(run)
+
+    return runs, errors
+
+
+def split_run(run: ReadRun) -> list[ReadRun]:
+    """Split a run into one run per distinct address.
+
+    Members at the same address (e.g. bit tags packed into one register)
+    stay together, so they still share a single read.
+    """
+    singles: dict[tuple[int, int], ReadRun] = {}
+    for tag, parsed, _, width in run.members:
+        member = (tag, parsed, 0, width)
+        single = singles.get((parsed.address, width))
+        if single is None:
+            singles[parsed.address, width] = ReadRun(
+                run.register_type, parsed.address, width, [member]
+            )
+        else:
+            single.members.append(member)
+    return list(singles.values())
+
+
+class _ModbusConnectorBase(BaseConnector):
+    """Read path shared by the TCP and RTU connectors."""
+
+    __slots__ = (
+        "_client",
+        "_max_read_gap",
+        "_pending_writes",
+        "_polls_in_flight",
+        "_support_fc23",
+        "_timeout",
+        "_unit_id",
+    )
+
+    _client: Any
+    _unit_id: int
+    _max_read_gap: int
+    _support_fc23: bool
+    # Register writes waiting to ride on a read as FC23 (support_fc23 only)
+    _pending_writes: list[tuple[int, list[int], asyncio.Future[Any]]]
+    _polls_in_flight: int
+
+    async def read_tags(self, addresses: list[str]) -> dict[str, TagValue]:
+        """Read raw addresses as uint16 through the coalesced planner.
+
+        Unlike the generic path, qualities come straight from the planner:
+        a failed run reports BAD_NO_COMMUNICATION and a malformed address
+        BAD_CONFIG_ERROR, instead of both collapsing into a missing value.
+        """
+        return await self.read_tag_values(
+            [
+                TagDefinition(
+                    name=addr, connector=self.name, address=addr, datatype=DataType.UINT16
                 )
-                # Don't include failed reads - let caller handle quality
+                for addr in addresses
+            ]
+        )
 
-        return results
+    async def _do_read(self, addresses: list[str]) -> dict[str, Any]:
+        """Read raw addresses, returning only the values read successfully."""
+        if not self._client:
+            raise ConnectionError("Not connected")
+
+        values = await self.read_tags(addresses)
+        good = Quality.GOOD
+        return {addr: tv.value for addr, tv in values.items() if tv.quality is good}
 
     async def read_tag_values(self, tags: list[TagDefinition]) -> dict[str, TagValue]:
-        """Read Modbus tags using datatype metadata."""
+        """Read Modbus tags using datatype metadata.
+
+        Tags are coalesced into runs of adjacent addresses (see plan_reads), so
+        a poll costs one request per run instead of one per tag.
+        """
         if not tags:
             return {}
 
         self._health.total_reads += len(tags)
+        # One timestamp per poll, shared by every value and health record
+        now = datetime.now(UTC)
 
         if not self._client:
-            now = datetime.now(UTC)
-            self._health.record_error("Not connected")
-            return {
-                tag.name: TagValue(
-                    value=0,
-                    timestamp=now,
-                    quality=Quality.BAD_NO_COMMUNICATION,
-                )
-                for tag in tags
-            }
+            self._health.record_error("Not connected", now)
+            # TagValue is frozen, so one instance is shared by every tag
+            bad = TagValue(value=0, timestamp=now, quality=Quality.BAD_NO_COMMUNICATION)
+            return {tag.name: bad for tag in tags}
 
         results: dict[str, TagValue] = {}
-        now = datetime.now(UTC)
+        runs, errors = plan_reads(tags, self._max_read_gap)
+        if errors:
+            bad_config = TagValue(value=0, timestamp=now, quality=Quality.BAD_CONFIG_ERROR)
+            for name, error in errors.items():
+                self._health.record_error(str(error), now)
+                results[name] = bad_config
+
+        # pymodbus serializes requests on one client, so runs go out in turn
+        self._polls_in_flight += 1
+        try:
+            for run in runs:
+                await self._read_run(run, results, now)
+        finally:
+            self._polls_in_flight -= 1
+            if not self._polls_in_flight:
+                self._release_pending_writes()
+
+        return results
 
-        for tag in tags:
+    async def _read_run(self, run: ReadRun, results: dict[str, TagValue], now: datetime) -> None:
+        """Issue one coalesced read and decode every member into ``results``."""
+        try:
+            response = await self._request_run(run)
+        except _DeviceRejectedError as e:
+            singles = split_run(run)
+            if len(singles) > 1:
+                # A merged span can cross addresses the device doesn't
+                # implement; fall back to one read per distinct address
+                for single in singles:
+                    await self._read_run(single, results, now)
+                return
+            self._mark_failed(run, str(e), results, now)
+            return
+        except Exception as e:
+            # Timeouts and dropped links: re-reading address by address would
+            # only wait out one timeout per address on a dead link
+            self._mark_failed(run, str(e), results, now)
+            return
+
+        good = Quality.GOOD
+        codec = run.codec
+        if codec is not None and len(run.members) > 1 and len(response.registers) >= run.count:
+            # Back-to-back values of one type: decode the whole span at once
+            values = decode_registers_batch(
+                response.registers[: run.count],
+                codec[0],
+                byte_order=codec[1],
+                word_order=codec[2],
+            )
+            for (tag, _, _, _), value in zip(run.members, values, strict=True):
+                results[tag.name] = TagValue(value=value, timestamp=now, quality=good)
+            self._health.record_success(now)
+            return
+
+        is_bits = run.register_type in _BIT_TYPES
+        for tag, parsed, offset, width in run.members:
             try:
-                parsed = parse_modbus_address(tag.address)
-                value = await self._read_single(
-                    parsed,
-                    datatype=tag.datatype.value,
-                    byte_order=tag.byte_order,
-                    word_order=tag.word_order,
-                )
-                results[tag.name] = TagValue(
-                    value=value,
-                    timestamp=now,
-                    quality=Quality.GOOD,
-                )
-                self._health.record_success()
+                if is_bits:
+                    value: Any = response.bits[offset]
+                elif parsed.bit_offset is not None:
+                    value = bool(response.registers[offset] & _BIT_MASKS[parsed.bit_offset])
+                else:
+                    value = decode_registers(
+                        response.registers[offset : offset + width],
+                        tag.datatype.value,
+                        byte_order=tag.byte_order,
+                        word_order=tag.word_order,
+                    )
             except ValueError as e:
-                self._health.record_error(str(e))
-                results[tag.name] = TagValue(
-                    value=0,
-                    timestamp=now,
-                    quality=Quality.BAD_CONFIG_ERROR,
-                )
-            except Exception as e:
-                self._health.record_error(str(e))
+                self._health.record_error(str(e), now)
                 results[tag.name] = TagValue(
-                    value=0,
-                    timestamp=now,
-                    quality=Quality.BAD_NO_COMMUNICATION,
+                    value=0, timestamp=now, quality=Quality.BAD_CONFIG_ERROR
                 )
+                continue
+            results[tag.name] = TagValue(value=value, timestamp=now, quality=good)
+        self._health.record_success(now)
 
-        return results
+    async def _request_run(self, run: ReadRun) -> Any:
+        """Send the read request for a run and return the pymodbus response.
+
+        With support_fc23, a holding-register run carries one pending register
+        write in the same Read/Write Multiple Registers request.
+        """
+        if run.register_type is ModbusRegisterType.HOLDING_REGISTER:
+            pending = self._pending_writes
+            while pending:
+                address, registers, future = pending.pop(0)
+                # A done future belongs to a writer that gave up; drop its write
+                if future.done():
+                    continue
+                response = await self._read_write_run(run, address, registers, future)
+                if not isinstance(response, ExceptionResponse):
+                    return response
+                # The rejection may concern the write alone, which its writer
+                # now sends on its own; read the run without it
+                break
+
+        reader = getattr(self._client, _READERS[run.register_type][0])
+        response = await reader(address=run.start, count=run.count, slave=self._unit_id)
+        if isinstance(response, ExceptionResponse):
+            raise _DeviceRejectedError(f"Modbus exception: {response}")
+        return response
+
+    async def _read_write_run(
+        self, run: ReadRun, address: int, registers: list[int], future: asyncio.Future[Any]
+    ) -> Any:
+        """Read a run and write registers in one FC23 request.
+
+        The device writes before it reads, so the reply already reflects
+        the write. An I/O failure is reported to the writer as well as the
+        run. On an exception response, or if the poll is cancelled
+        mid-request, the writer is told the write was not carried and sends
+        it on its own; the exception response is returned to the caller.
+        """
+        try:
+            response = await self._client.readwrite_registers(
+                read_address=run.start,
+                read_count=run.count,
+                write_address=address,
+                values=registers,
+                slave=self._unit_id,
+            )
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            raise
+        except BaseException:
+            if not future.done():
+                future.set_result(_NOT_CARRIED)
+            raise
+        if not future.done():
+            future.set_result(_NOT_CARRIED if isinstance(response, ExceptionResponse) else response)
+        return response
+
+    def _release_pending_writes(self) -> None:
+        """Hand every queued write back to its writer to send on its own."""
+        for _, _, future in self._pending_writes:
+            if not future.done():
+                future.set_result(_NOT_CARRIED)
+        self._pending_writes.clear()
+
+    async def _write_registers(self, address: int, registers: list[int]) -> Any:
+        """Write holding registers and return the pymodbus response.
+
+        With support_fc23, while a poll is in flight on this connector the
+        write is queued for its next holding-register run and carried as
+        FC23, saving a round trip. It is sent on its own if no poll is
+        running, if the poll ends first, or after _FC23_HOLD_S.
+        """
+        if self._support_fc23 and self._polls_in_flight:
+            future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+            entry = (address, registers, future)
+            self._pending_writes.append(entry)
+            try:
+                await asyncio.wait((future,), timeout=_FC23_HOLD_S)
+            except asyncio.CancelledError:
+                # Withdraw the write so no later poll sends it for nobody
+                future.cancel()
+                if entry in self._pending_writes:
+                    self._pending_writes.remove(entry)
+                raise
+            if entry in self._pending_writes:
+                self._pending_writes.remove(entry)
+            else:
+                # Taken by a poll: wait for its request to complete
+                response = await future
+                if response is not _NOT_CARRIED:
+                    return response
+
+        if len(registers) == 1:
+            return await self._client.write_register(
+                address=address, value=registers[0], slave=self._unit_id
+            )
+        return await self._client.write_registers(
+            address=address, values=registers, slave=self._unit_id
+        )
 
     async def _read_single(
         self,
@@ -387,65 +704,76 @@ class ModbusTCPConnector(BaseConnector):
         """Read a single Modbus address."""
         if not self._client:
             raise ConnectionError("Not connected")
-        client = cast("Any", self._client)
 
-        count = get_register_count(datatype)
-
-        if parsed.register_type == ModbusRegisterType.COIL:
-            response = await client.read_coils(
-                address=parsed.address,
-                count=1,
-                slave=self._unit_id,
-            )
-            if isinstance(response, ExceptionResponse):
-                raise ModbusException(f"Modbus exception: {response}")
+        method, is_bit = _READERS[parsed.register_type]
+        response = await getattr(self._client, method)(
+            address=parsed.address,
+            count=1 if is_bit else get_register_count(datatype),
+            slave=self._unit_id,
+        )
+        if isinstance(response, ExceptionResponse):
+            raise ModbusException(f"Modbus exception: {response}")
+        if is_bit:
             return response.bits[0]
+        if parsed.bit_offset is not None:
+            return bool(response.registers[0] & _BIT_MASKS[parsed.bit_offset])
+        return decode_registers(
+            response.registers,
+            datatype,
+            byte_order=byte_order,
+            word_order=word_order,
+        )
 
-        elif parsed.register_type == ModbusRegisterType.DISCRETE_INPUT:
-            response = await client.read_discrete_inputs(
-                address=parsed.address,
-                count=1,
-                slave=self._unit_id,
-            )
-            if isinstance(response, ExceptionResponse):
-                raise ModbusException(f"Modbus exception: {response}")
-            return response.bits[0]
+    def _mark_failed(
+        self, run: ReadRun, message: str, results: dict[str, TagValue], now: datetime
+    ) -> None:
+        """Record a failed run as a communication error for every tag it covers."""
+        bad = TagValue(value=0, timestamp=now, quality=Quality.BAD_NO_COMMUNICATION)
+        for tag, _, _, _ in run.members:
+            self._health.record_error(message, now)
+            results[tag.name] = bad
 
-        elif parsed.register_type == ModbusRegisterType.INPUT_REGISTER:
-            response = await client.read_input_registers(
-                address=parsed.address,
-                count=count,
-                slave=self._unit_id,
-            )
-            if isinstance(response, ExceptionResponse):
-                raise ModbusException(f"Modbus exception: {response}")
-            if parsed.bit_offset is not None:
-                return bool((response.registers[0] >> parsed.bit_offset) & 0x01)
-            return decode_registers(
-                response.registers,
-                datatype,
-                byte_order=byte_order,
-                word_order=word_order,
-            )
 
-        elif parsed.register_type == ModbusRegisterType.HOLDING_REGISTER:
-            response = await client.read_holding_registers(
-                address=parsed.address,
-                count=count,
-                slave=self._unit_id,
-            )
-            if isinstance(response, ExceptionResponse):
-                raise ModbusException(f"Modbus exception: {response}")
-            if parsed.bit_offset is not None:
-                return bool((response.registers[0] >> parsed.bit_offset) & 0x01)
-            return decode_registers(
-                response.registers,
-                datatype,
-                byte_order=byte_order,
-                word_order=word_order,
-            )
+class ModbusTCPConnector(_ModbusConnectorBase):
+    """Modbus TCP connector implementation."""
+
+    __slots__ = ("_host", "_port")
+
+    def __init__(self, config: ModbusTCPConnectorConfig) -> None:
+        super().__init__(config)
+        self._client: AsyncModbusTcpClient | None = None
+        self._host = config.host
+        self._port = config.port
+        self._unit_id = config.unit_id
+        self._timeout = config.timeout_ms / 1000
+        self._max_read_gap = config.max_read_gap
+        self._support_fc23 = config.support_fc23
+        self._pending_writes: list[tuple[int, list[int], asyncio.Future[Any]]] = []
+        self._polls_in_flight = 0
 
-        raise ValueError(f"Unknown register type: {parsed.register_type}")
+    async def _do_connect(self) -> None:
+        """Establish Modbus TCP connection."""
+        self._client = AsyncModbusTcpClient(
+            host=self._host,
+            port=self._port,
+            timeout=self._timeout,
+        )
+        connected = await self._client.connect()
+        if not connected:
+            raise ConnectionError(f"Failed to connect to {self._host}:{self._port}")
+
+        logger.debug(
+            "Modbus TCP connected",
+            host=self._host,
+            port=self._port,
+            unit_id=self._unit_id,
+        )
+
+    async def _do_disconnect(self) -> None:
+        """Close Modbus TCP connection."""
+        if self._client:
+            self._client.close()
+            self._client = None
 
     async def _do_write(self, address: str, value: Any) -> None:
         """Write to a single Modbus address."""
@@ -472,18 +800,7 @@ class ModbusTCPConnector(BaseConnector):
             else:
                 raise ValueError(f"Unsupported write value type: {type(value)}")
 
-            if len(registers) == 1:
-                response = await client.write_register(
-                    address=parsed.address,
-                    value=registers[0],
-                    slave=self._unit_id,
-                )
-            else:
-                response = await client.write_registers(
-                    address=parsed.address,
-                    values=registers,
-                    slave=self._unit_id,
-                )
+            response = await self._write_registers(parsed.address, registers)
         else:
             raise ValueError(f"Cannot write to {parsed.register_type.value}")
 
@@ -518,18 +835,7 @@ class ModbusTCPConnector(BaseConnector):
                     word_order=tag.word_order,
                 )
 
-                if len(registers) == 1:
-                    response = await client.write_register(
-                        address=parsed.address,
-                        value=registers[0],
-                        slave=self._unit_id,
-                    )
-                else:
-                    response = await client.write_registers(
-                        address=parsed.address,
-                        values=registers,
-                        slave=self._unit_id,
-                    )
+                response = await self._write_registers(parsed.address, registers)
             else:
                 raise ValueError(f"Cannot write to {parsed.register_type.value}")
 
@@ -549,9 +855,11 @@ class ModbusTCPConnector(BaseConnector):
             return False
 
 
-class ModbusRTUConnector(BaseConnector):
+class ModbusRTUConnector(_ModbusConnectorBase):
     """Modbus RTU (serial) connector implementation."""
 
+    __slots__ = ("_baudrate", "_bytesize", "_parity", "_port", "_stopbits")
+
     def __init__(self, config: ModbusRTUConnectorConfig) -> None:
         super().__init__(config)
         self._client: AsyncModbusSerialClient | None = None
@@ -562,6 +870,10 @@ class ModbusRTUConnector(BaseConnector):
         self._bytesize = config.bytesize
         self._unit_id = config.unit_id
         self._timeout = config.timeout_ms / 1000
+        self._max_read_gap = config.max_read_gap
+        self._support_fc23 = config.support_fc23
+        self._pending_writes: list[tuple[int, list[int], asyncio.Future[Any]]] = []
+        self._polls_in_flight = 0
 
     async def _do_connect(self) -> None:
         """Establish Modbus RTU connection."""
@@ -589,153 +901,6 @@ class ModbusRTUConnector(BaseConnector):
             self._client.close()
             self._client = None
 
-    async def _do_read(self, addresses: list[str]) -> dict[str, Any]:
-        """Read multiple Modbus addresses (RTU)."""
-        # Same implementation as TCP, just different client
-        if not self._client:
-            raise ConnectionError("Not connected")
-
-        results: dict[str, Any] = {}
-
-        for addr_str in addresses:
-            try:
-                parsed = parse_modbus_address(addr_str)
-                value = await self._read_single_rtu(parsed)
-                results[addr_str] = value
-            except Exception as e:
-                logger.warning(
-                    "Failed to read address",
-                    address=addr_str,
-                    error=str(e),
-                )
-
-        return results
-
-    async def read_tag_values(self, tags: list[TagDefinition]) -> dict[str, TagValue]:
-        """Read Modbus RTU tags using datatype metadata."""
-        if not tags:
-            return {}
-
-        self._health.total_reads += len(tags)
-
-        if not self._client:
-            now = datetime.now(UTC)
-            self._health.record_error("Not connected")
-            return {
-                tag.name: TagValue(
-                    value=0,
-                    timestamp=now,
-                    quality=Quality.BAD_NO_COMMUNICATION,
-                )
-                for tag in tags
-            }
-
-        results: dict[str, TagValue] = {}
-        now = datetime.now(UTC)
-
-        for tag in tags:
-            try:
-                parsed = parse_modbus_address(tag.address)
-                value = await self._read_single_rtu(
-                    parsed,
-                    datatype=tag.datatype.value,
-                    byte_order=tag.byte_order,
-                    word_order=tag.word_order,
-                )
-                results[tag.name] = TagValue(
-                    value=value,
-                    timestamp=now,
-                    quality=Quality.GOOD,
-                )
-                self._health.record_success()
-            except ValueError as e:
-                self._health.record_error(str(e))
-                results[tag.name] = TagValue(
-                    value=0,
-                    timestamp=now,
-                    quality=Quality.BAD_CONFIG_ERROR,
-                )
-            except Exception as e:
-                self._health.record_error(str(e))
-                results[tag.name] = TagValue(
-                    value=0,
-                    timestamp=now,
-                    quality=Quality.BAD_NO_COMMUNICATION,
-                )
-
-        return results
-
-    async def _read_single_rtu(
-        self,
-        parsed: ParsedAddress,
-        datatype: str = "uint16",
-        *,
-        byte_order: str = "big",
-        word_order: str = "big",
-    ) -> Any:
-        """Read a single Modbus RTU address."""
-        if not self._client:
-            raise ConnectionError("Not connected")
-        client = cast("Any", self._client)
-
-        count = get_register_count(datatype)
-
-        if parsed.register_type == ModbusRegisterType.COIL:
-            response = await client.read_coils(
-                address=parsed.address,
-                count=1,
-                slave=self._unit_id,
-            )
-            if isinstance(response, ExceptionResponse):
-                raise ModbusException(f"Modbus exception: {response}")
-            return response.bits[0]
-
-        elif parsed.register_type == ModbusRegisterType.DISCRETE_INPUT:
-            response = await client.read_discrete_inputs(
-                address=parsed.address,
-                count=1,
-                slave=self._unit_id,
-            )
-            if isinstance(response, ExceptionResponse):
-                raise ModbusException(f"Modbus exception: {response}")
-            return response.bits[0]
-
-        elif parsed.register_type == ModbusRegisterType.INPUT_REGISTER:
-            response = await client.read_input_registers(
-                address=parsed.address,
-                count=count,
-                slave=self._unit_id,
-            )
-            if isinstance(response, ExceptionResponse):
-                raise ModbusException(f"Modbus exception: {response}")
-            if parsed.bit_offset is not None:
-                return bool((response.registers[0] >> parsed.bit_offset) & 0x01)
-            return decode_registers(
-                response.registers,
-                datatype,
-                byte_order=byte_order,
-                word_order=word_order,
-            )
-
-        elif parsed.register_type == ModbusRegisterType.HOLDING_REGISTER:
-            response = await client.read_holding_registers(
-                address=parsed.address,
-                count=count,
-                slave=self._unit_id,
-            )
-            if isinstance(response, ExceptionResponse):
-                raise ModbusException(f"Modbus exception: {response}")
-            if parsed.bit_offset is not None:
-                return bool((response.registers[0] >> parsed.bit_offset) & 0x01)
-            return decode_registers(
-                response.registers,
-                datatype,
-                byte_order=byte_order,
-                word_order=word_order,
-            )
-
-        raise ValueError(f"Unknown register type: {parsed.register_type}")
-
     async def _do_write(self, address: str, value: Any) -> None:
         """Write to a single Modbus RTU address."""
         if not self._client:
@@ -760,18 +925,7 @@ class ModbusRTUConnector(BaseConnector):
             else:
                 raise ValueError(f"Unsupported write value type: {type(value)}")
 
-            if len(registers) == 1:
-                response = await client.write_register(
-                    address=parsed.address,
-                    value=registers[0],
-                    slave=self._unit_id,
-                )
-            else:
-                response = await client.write_registers(
-                    address=parsed.address,
-                    values=registers,
-                    slave=self._unit_id,
-                )
+            response = await self._write_registers(parsed.address, registers)
         else:
             raise ValueError(f"Cannot write to {parsed.register_type.value}")
 
@@ -806,18 +960,7 @@ class ModbusRTUConnector(BaseConnector):
                     word_order=tag.word_order,
                 )
 
-                if len(registers) == 1:
-                    response = await client.write_register(
-                        address=parsed.address,
-                        value=registers[0],
-                        slave=self._unit_id,
-                    )
-                else:
-                    response = await client.write_registers(
-                        address=parsed.address,
-                        values=registers,
-                        slave=self._unit_id,
-                    )
+                response = await self._write_registers(parsed.address, registers)
             else:
                 raise ValueError(f"Cannot write to {parsed.register_type.value}")
 
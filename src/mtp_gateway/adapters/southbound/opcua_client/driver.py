@@ -21,8 +21,12 @@ Configuration example:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import os
 import re
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
@@ -33,6 +37,10 @@ from mtp_gateway.config.schema import SecurityPolicy
 from mtp_gateway.domain.model.tags import Quality, TagValue
 
 if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from asyncua.common.node import Node
+
     from mtp_gateway.config.schema import OPCUAClientConnectorConfig
 
 # Import asyncua - required dependency
@@ -41,20 +49,23 @@ from asyncua import Client, ua
 logger = structlog.get_logger(__name__)
 
 
-# Regular expressions for parsing NodeId strings
-# Format: ns=N;type=identifier or type=identifier (default ns=0)
-_NS_PATTERN = re.compile(r"^ns=(\d+);(.+)$", re.IGNORECASE)
-_NUMERIC_PATTERN = re.compile(r"^i=(\d+)$", re.IGNORECASE)
-_STRING_PATTERN = re.compile(r"^s=(.+)$", re.IGNORECASE)
-_GUID_PATTERN = re.compile(
-    r"^g=([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$",
+# NodeId string: optional "ns=N;" then exactly one of i=, s= or g= (default ns=0)
+_NODE_ID_PATTERN = re.compile(
+    r"(?:ns=(\d+);)?"
+    r"(?:i=(\d+)"
+    r"|s=(.+)"
+    r"|g=([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}))",
     re.IGNORECASE,
 )
 
 
+@lru_cache(maxsize=4096)
 def parse_node_id(address: str) -> ua.NodeId:
     """Parse OPC UA NodeId string to asyncua NodeId object.
 
+    Results are memoized, since the same addresses are parsed on every poll;
+    callers must treat the returned NodeId as read-only.
+
     Supports formats:
     - "ns=2;i=1001"          - Numeric ID in namespace 2
     - "ns=2;s=Temperature"   - String ID in namespace 2
@@ -76,69 +87,189 @@ def parse_node_id(address: str) -> ua.NodeId:
     if not address:
         raise ValueError("Invalid NodeId: empty string")
 
-    # Extract namespace if present
-    namespace = 0
-    identifier_part = address
-
-    ns_match = _NS_PATTERN.match(address)
-    if ns_match:
-        namespace = int(ns_match.group(1))
-        identifier_part = ns_match.group(2)
-
-    # Parse identifier based on type prefix (numeric)
-    numeric_match = _NUMERIC_PATTERN.match(identifier_part)
-    if numeric_match:
-        numeric_id = int(numeric_match.group(1))
-        return ua.NodeId(numeric_id, namespace)
-
-    # String NodeId (s=...)
-    string_match = _STRING_PATTERN.match(identifier_part)
-    if string_match:
-        string_id = string_match.group(1)
-        return ua.NodeId(string_id, namespace)
-
-    # GUID NodeId (g=...)
-    guid_match = _GUID_PATTERN.match(identifier_part)
-    if guid_match:
-        guid_id = UUID(guid_match.group(1))
-        return ua.NodeId(guid_id, namespace)
+    match = _NODE_ID_PATTERN.fullmatch(address)
+    if match:
+        ns, numeric_id, string_id, guid_id = match.groups()
+        namespace = int(ns) if ns is not None else 0
+        if numeric_id is not None:
+            return ua.NodeId(int(numeric_id), namespace)
+        if string_id is not None:
+            return ua.NodeId(string_id, namespace)
+        return ua.NodeId(UUID(guid_id), namespace)
 
     raise ValueError(f"Invalid NodeId format: '{address}'")
 
 
+# Bad StatusCodes that carry a more specific Quality than plain BAD
+_BAD_QUALITIES: dict[int, Quality] = {
+    ua.StatusCodes.BadNodeIdUnknown: Quality.BAD_CONFIG_ERROR,
+    ua.StatusCodes.BadNotConnected: Quality.BAD_NO_COMMUNICATION,
+    ua.StatusCodes.BadServerNotConnected: Quality.BAD_NO_COMMUNICATION,
+    ua.StatusCodes.BadNoCommunication: Quality.BAD_NO_COMMUNICATION,
+    ua.StatusCodes.BadCommunicationError: Quality.BAD_NO_COMMUNICATION,
+    ua.StatusCodes.BadConnectionClosed: Quality.BAD_NO_COMMUNICATION,
+    ua.StatusCodes.BadSessionClosed: Quality.BAD_NO_COMMUNICATION,
+}
+
+# Low 16 bits of a StatusCode are info bits; the code itself is the high word
+_STATUS_CODE_MASK = 0xFFFF0000
+
+# StatusCode value -> Quality, filled as codes are first seen
+_QUALITY_BY_CODE: dict[int, Quality] = {}
+
+
 def _status_code_to_quality(status_code: Any) -> Quality:
     """Map OPC UA StatusCode to Quality enum.
 
+    Good (0) is answered straight away; every other code is classified
+    once and then served from _QUALITY_BY_CODE.
+
     Args:
         status_code: asyncua StatusCode object
 
     Returns:
         Quality enum value
     """
-    if status_code.is_good():
+    code = status_code.value
+    if code == 0:
         return Quality.GOOD
+    quality = _QUALITY_BY_CODE.get(code)
+    if quality is None:
+        quality = _QUALITY_BY_CODE[code] = _classify_status_code(status_code)
+    return quality
 
-    # Check for specific bad status codes
-    status_name = getattr(status_code, "name", "")
 
+def _classify_status_code(status_code: Any) -> Quality:
+    """Derive the Quality of a StatusCode from its severity and code."""
+    if status_code.is_good():
+        return Quality.GOOD
     if status_code.is_bad():
-        if "NodeIdUnknown" in status_name:
-            return Quality.BAD_CONFIG_ERROR
-        if "NotConnected" in status_name:
-            return Quality.BAD_NO_COMMUNICATION
-        return Quality.BAD
-
+        return _BAD_QUALITIES.get(status_code.value & _STATUS_CODE_MASK, Quality.BAD)
     # Uncertain status
     return Quality.UNCERTAIN
 
 
+def _bad_values(addresses: list[str], quality: Quality, now: datetime) -> dict[str, TagValue]:
+    """Map every address to one shared bad-quality TagValue (it is frozen)."""
+    return dict.fromkeys(addresses, TagValue(value=0, timestamp=now, quality=quality))
+
+
+# Identifies a server session: endpoint, security policy, credentials digest,
+# certificate and private key paths
+_SessionKey = tuple[str, SecurityPolicy, str, str | None, str | None]
+
+# Per-process key for the credentials digest, so the registry holds neither
+# the password nor a hash that could be matched against a wordlist offline
+_CREDENTIALS_KEY = os.urandom(32)
+
+
+def _credentials_digest(username: str | None, password: str | None) -> str:
+    """Return a keyed digest identifying a username/password pair."""
+    # repr() of the pair is unambiguous, including for None and separators
+    credentials = repr((username, password)).encode()
+    return hashlib.blake2b(credentials, key=_CREDENTIALS_KEY, digest_size=16).hexdigest()
+
+
+class _SharedSession:
+    """One asyncua Client used by every sharing connector with the same session key.
+
+    Reads queued by the connectors in one loop iteration are merged into a
+    single read_values() request.
+    """
+
+    __slots__ = (
+        "_flush_handle",
+        "_pending",
+        "_tasks",
+        "client",
+        "connected",
+        "key",
+        "refs",
+    )
+
+    def __init__(self, key: _SessionKey, client: Client, connected: asyncio.Future[None]) -> None:
+        self.key = key
+        self.client = client
+        self.connected = connected
+        self.refs = 0
+        self._pending: list[tuple[list[Node], asyncio.Future[list[Any]]]] = []
+        self._flush_handle: asyncio.Handle | None = None
+        # Background batch reads and orphan closes, kept alive until done
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def read_values(self, nodes: list[Node]) -> list[Any]:
+        """Queue a read and return its DataValues once the merged request lands."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[Any]] = loop.create_future()
+        self._pending.append((nodes, future))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Start one read for every request queued so far."""
+        self._flush_handle = None
+        batch, self._pending = self._pending, []
+        self._spawn(self._read_batch(batch))
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run coro as a task that stays referenced until it finishes."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def close_when_opened(self) -> None:
+        """Disconnect the client once its pending open settles, if it succeeded.
+
+        Used when every connector waiting on the open has given up, so the
+        session would otherwise stay connected with nobody to close it.
+        """
+
+        def close(connected: asyncio.Future[None]) -> None:
+            if not connected.cancelled() and connected.exception() is None:
+                self._spawn(self.client.disconnect())
+
+        self.connected.add_done_callback(close)
+
+    async def _read_batch(self, batch: list[tuple[list[Node], asyncio.Future[list[Any]]]]) -> None:
+        """Read the concatenated nodes of a batch and hand each caller its slice."""
+        try:
+            if len(batch) == 1:
+                values = await self.client.read_values(batch[0][0])
+            else:
+                values = await self.client.read_values([n for nodes, _ in batch for n in nodes])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        start = 0
+        for nodes, future in batch:
+            end = start + len(nodes)
+            if not future.done():
+                future.set_result(values[start:end])
+            start = end
+
+
+# Sessions open for sharing; a session leaves this registry as soon as any of
+# its connectors disconnects, so reconnects never rejoin a session that failed
+_SESSIONS: dict[_SessionKey, _SharedSession] = {}
+
+
 class OPCUAClientConnector(BaseConnector):
     """OPC UA client connector using asyncua.
 
     Connects to external OPC UA servers as a southbound data source.
     asyncua is async-native, so no thread wrapping is needed.
 
-    Security policies and user authentication are supported.
+    Security policies and user authentication are supported. With
+    ``share_session`` set, connectors for the same server and credentials
+    use one session and their concurrent reads go out as one request.
     """
 
     def __init__(self, config: OPCUAClientConnectorConfig) -> None:
@@ -155,19 +286,61 @@ class OPCUAClientConnector(BaseConnector):
         self._password = config.password
         self._cert_path = config.cert_path
         self._key_path = config.key_path
+        self._share_session = config.share_session
+        self._session: _SharedSession | None = None
+        # address -> Node wrapper; Nodes are bound to a session, so the cache
+        # is rebuilt on every connect
+        self._node_cache: dict[str, Node] = {}
 
     async def _do_connect(self) -> None:
         """Connect to OPC UA server.
 
         Creates asyncua Client, applies security and credentials, then connects.
+        A sharing connector joins an open (or opening) session for the same
+        key instead, if there is one.
         """
-        self._client = Client(url=self._endpoint)
-
+        self._node_cache.clear()
+        if not self._share_session:
+            client = Client(url=self._endpoint)
+            await self._open(client)
+            self._client = client
+            return
+
+        key: _SessionKey = (
+            self._endpoint,
+            self._security_policy,
+            _credentials_digest(self._username, self._password),
+            str(self._cert_path) if self._cert_path else None,
+            str(self._key_path) if self._key_path else None,
+        )
+        session = _SESSIONS.get(key)
+        if session is None:
+            client = Client(url=self._endpoint)
+            session = _SESSIONS[key] = _SharedSession(
+                key, client, asyncio.ensure_future(self._open(client))
+            )
+        # Count this connector while it waits, so a disconnecting peer does
+        # not close the client under it
+        session.refs += 1
+        try:
+            await asyncio.shield(session.connected)
+        except BaseException:
+            session.refs -= 1
+            if _SESSIONS.get(key) is session:
+                del _SESSIONS[key]
+            if session.refs == 0:
+                session.close_when_opened()
+            raise
+        self._session = session
+        self._client = session.client
+
+    async def _open(self, client: Client) -> None:
+        """Apply credentials and security to a new Client and connect it."""
         # Set username/password if provided
         if self._username:
-            self._client.set_user(self._username)
+            client.set_user(self._username)
         if self._password:
-            self._client.set_password(self._password)
+            client.set_password(self._password)
 
         # Apply security policy if not None
         if (
@@ -187,11 +360,11 @@ class OPCUAClientConnector(BaseConnector):
             }
             security_string = policy_map.get(self._security_policy)
             if security_string:
-                await self._client.set_security_string(
+                await client.set_security_string(
                     f"{security_string},{self._cert_path},{self._key_path}"
                 )
 
-        await self._client.connect()
+        await client.connect()
 
         logger.debug(
             "OPC UA client connected",
@@ -199,11 +372,61 @@ class OPCUAClientConnector(BaseConnector):
         )
 
     async def _do_disconnect(self) -> None:
-        """Disconnect from OPC UA server."""
-        if self._client:
+        """Disconnect from OPC UA server.
+
+        A shared session is retired from the registry and closed once its
+        last connector has left.
+        """
+        self._node_cache.clear()
+        session = self._session
+        if session is not None:
+            self._session = None
+            self._client = None
+            if _SESSIONS.get(session.key) is session:
+                del _SESSIONS[session.key]
+            session.refs -= 1
+            if session.refs == 0:
+                await session.client.disconnect()
+        elif self._client:
             await self._client.disconnect()
             self._client = None
 
+    async def _read_values(self, nodes: list[Node]) -> list[Any]:
+        """Batch-read nodes, through the shared session when there is one."""
+        if self._session is not None:
+            return await self._session.read_values(nodes)
+        if self._client is None:
+            raise ConnectionError("Not connected")
+        return await self._client.read_values(nodes)
+
+    def _resolve_nodes(self, addresses: list[str]) -> tuple[list[Node], list[str]]:
+        """Return the Node for every parseable address, and those addresses.
+
+        Nodes are created once per address and session; a steady poll is then
+        a dict lookup per address.
+        """
+        if self._client is None:
+            raise ConnectionError("Not connected")
+
+        cache = self._node_cache
+        nodes: list[Node] = []
+        valid_addresses: list[str] = []
+        for addr in addresses:
+            node = cache.get(addr)
+            if node is None:
+                try:
+                    node = cache[addr] = self._client.get_node(parse_node_id(addr))
+                except ValueError as e:
+                    logger.warning(
+                        "Failed to parse NodeId",
+                        address=addr,
+                        error=str(e),
+                    )
+                    continue
+            nodes.append(node)
+            valid_addresses.append(addr)
+        return nodes, valid_addresses
+
     async def read_tags(self, addresses: list[str]) -> dict[str, TagValue]:
         """Read tags with OPC UA per-value quality handling.
 
@@ -220,56 +443,25 @@ class OPCUAClientConnector(BaseConnector):
             return {}
 
         self._health.total_reads += len(addresses)
+        # One timestamp per poll, shared by every value and health record
+        now = datetime.now(UTC)
 
         if not self._client:
-            # Not connected - return bad quality
-            now = datetime.now(UTC)
-            self._health.record_error("Not connected")
-            return {
-                addr: TagValue(
-                    value=0,
-                    timestamp=now,
-                    quality=Quality.BAD_NO_COMMUNICATION,
-                )
-                for addr in addresses
-            }
+            self._health.record_error("Not connected", now)
+            return _bad_values(addresses, Quality.BAD_NO_COMMUNICATION, now)
 
         try:
-            # Parse NodeIds and get nodes
-            nodes = []
-            valid_addresses = []
-
-            for addr in addresses:
-                try:
-                    node_id = parse_node_id(addr)
-                    node = self._client.get_node(node_id)
-                    nodes.append(node)
-                    valid_addresses.append(addr)
-                except ValueError as e:
-                    logger.warning(
-                        "Failed to parse NodeId",
-                        address=addr,
-                        error=str(e),
-                    )
+            nodes, valid_addresses = self._resolve_nodes(addresses)
 
             if not nodes:
-                now = datetime.now(UTC)
-                return {
-                    addr: TagValue(
-                        value=0,
-                        timestamp=now,
-                        quality=Quality.BAD_CONFIG_ERROR,
-                    )
-                    for addr in addresses
-                }
+                return _bad_values(addresses, Quality.BAD_CONFIG_ERROR, now)
 
             # Batch read all nodes
-            data_values = await self._client.read_values(nodes)
-            self._health.record_success()
+            data_values = await self._read_values(nodes)
+            self._health.record_success(now)
 
             # Process results with per-value quality
             result: dict[str, TagValue] = {}
-            now = datetime.now(UTC)
 
             for addr, dv in zip(valid_addresses, data_values, strict=False):
                 quality = _status_code_to_quality(dv.StatusCode)
@@ -281,36 +473,22 @@ class OPCUAClientConnector(BaseConnector):
                     quality=quality,
                 )
 
-            # Handle addresses that failed to parse
-            for addr in addresses:
-                if addr not in result:
-                    result[addr] = TagValue(
-                        value=0,
-                        timestamp=now,
-                        quality=Quality.BAD_CONFIG_ERROR,
-                    )
+            # Handle addresses that failed to parse, all in one bulk update
+            if len(result) < len(addresses):
+                missing = [addr for addr in addresses if addr not in result]
+                result.update(_bad_values(missing, Quality.BAD_CONFIG_ERROR, now))
 
             return result
 
         except Exception as e:
-            self._health.record_error(str(e))
+            self._health.record_error(str(e), now)
             logger.warning(
                 "Read failed",
                 connector=self.name,
                 addresses=addresses,
                 error=str(e),
             )
-
-            # Return bad quality values
-            now = datetime.now(UTC)
-            return {
-                addr: TagValue(
-                    value=0,
-                    timestamp=now,
-                    quality=Quality.BAD_NO_COMMUNICATION,
-                )
-                for addr in addresses
-            }
+            return _bad_values(addresses, Quality.BAD_NO_COMMUNICATION, now)
 
     async def _do_read(self, addresses: list[str]) -> dict[str, Any]:
         """Read multiple nodes from OPC UA server.
@@ -330,29 +508,13 @@ class OPCUAClientConnector(BaseConnector):
             raise ConnectionError("Not connected")
 
         results: dict[str, Any] = {}
-
-        # Parse NodeIds and get nodes
-        nodes = []
-        valid_addresses = []
-
-        for addr in addresses:
-            try:
-                node_id = parse_node_id(addr)
-                node = self._client.get_node(node_id)
-                nodes.append(node)
-                valid_addresses.append(addr)
-            except ValueError as e:
-                logger.warning(
-                    "Failed to parse NodeId",
-                    address=addr,
-                    error=str(e),
-                )
+        nodes, valid_addresses = self._resolve_nodes(addresses)
 
         if not nodes:
             return results
 
         # Batch read all nodes
-        data_values = await self._client.read_values(nodes)
+        data_values = await self._read_values(nodes)
 
         # Process results
         for addr, dv in zip(valid_addresses, data_values, strict=False):
@@ -17,11 +17,16 @@ S7 Address Formats:
 from __future__ import annotations
 
 import asyncio
+import ctypes
 import re
 import struct
-from dataclasses import dataclass
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import structlog
 
@@ -36,15 +41,23 @@ try:
     import snap7
     import snap7.client
 
+    try:
+        from snap7.type import S7DataItem  # python-snap7 >= 2.0
+    except ImportError:
+        from snap7.types import S7DataItem  # python-snap7 1.x
+
     _HAS_SNAP7 = True
 except ImportError:
     snap7 = None
+    S7DataItem = None
     _HAS_SNAP7 = False
 
 HAS_SNAP7: bool = _HAS_SNAP7
 
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
 
 class S7AreaType(Enum):
     """S7 memory areas."""
@@ -68,7 +81,7 @@ S7_AREA_CODES: dict[S7AreaType, int] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedS7Address:
     """Parsed S7 address components.
 
@@ -89,25 +102,28 @@ class ParsedS7Address:
     data_type: str
 
 
-# Regular expressions for parsing S7 addresses
-# DB addresses: DB<num>.DB<type><offset>[.<bit>]
-_DB_PATTERN = re.compile(
-    r"^DB(\d+)\.DB([DWBX])(\d+)(?:\.(\d+))?$",
-    re.IGNORECASE,
+# One pattern for every S7 address form; which named groups matched tells
+# the form apart, so a single scan both classifies and splits the address:
+# - DB<num>.DB<type><offset>[.<bit>]
+# - M/I/Q<offset>.<bit>
+# - M/I/Q[BWD]<offset>
+_ADDRESS_PATTERN = re.compile(
+    r"DB(?P<db>\d+)\.DB(?P<db_type>[DWBX])(?P<db_offset>\d+)(?:\.(?P<db_bit>\d+))?"
+    r"|(?P<bit_area>[MIQ])(?P<bit_byte>\d+)\.(?P<bit>[0-7])"
+    r"|(?P<area>[MIQ])(?P<type>[BWD])(?P<offset>\d+)"
 )
 
-# Memory/Marker: M<offset>.<bit> or M[BWD]<offset>
-_M_BIT_PATTERN = re.compile(r"^M(\d+)\.([0-7])$", re.IGNORECASE)
-_M_DATA_PATTERN = re.compile(r"^M([BWD])(\d+)$", re.IGNORECASE)
+_AREA_TYPES = {"M": S7AreaType.M, "I": S7AreaType.I, "Q": S7AreaType.Q}
+_DATA_SIZES = {"X": 1, "B": 1, "W": 2, "D": 4}
 
-# Input/Output: I/Q<offset>.<bit> or I/Q[BWD]<offset>
-_IO_BIT_PATTERN = re.compile(r"^([IQ])(\d+)\.([0-7])$", re.IGNORECASE)
-_IO_DATA_PATTERN = re.compile(r"^([IQ])([BWD])(\d+)$", re.IGNORECASE)
 
-
-def parse_s7_address(address_str: str) -> ParsedS7Address:  # noqa: PLR0912
+@lru_cache(maxsize=4096)
+def parse_s7_address(address_str: str) -> ParsedS7Address:
     """Parse an S7 address string into components.
 
+    Results are memoized (and immutable): tag addresses repeat every poll,
+    so after the first cycle parsing is a single cache lookup.
+
     Supports formats:
     - "DB100.DBD0" - Data Block double word
     - "DB100.DBW10" - Data Block word
@@ -132,13 +148,14 @@ def parse_s7_address(address_str: str) -> ParsedS7Address:  # noqa: PLR0912
     if not address_str:
         raise ValueError("Invalid S7 address: empty string")
 
-    # Try DB address pattern
-    match = _DB_PATTERN.match(address_str)
-    if match:
-        db_num = int(match.group(1))
-        data_type = match.group(2).upper()
-        offset = int(match.group(3))
-        bit_str = match.group(4)
+    match = _ADDRESS_PATTERN.fullmatch(address_str)
+    if match is None:
+        raise ValueError(f"Invalid S7 address: {address_str}")
+
+    db_str = match["db"]
+    if db_str is not None:
+        data_type = match["db_type"]
+        bit_str = match["db_bit"]
 
         bit_offset = None
         if data_type == "X":
@@ -147,88 +164,47 @@ def parse_s7_address(address_str: str) -> ParsedS7Address:  # noqa: PLR0912
             bit_offset = int(bit_str)
             if bit_offset > 7:
                 raise ValueError(f"Bit offset must be 0-7, got {bit_offset}")
-            size = 1
-        elif data_type == "D":
-            size = 4
-        elif data_type == "W":
-            size = 2
-        elif data_type == "B":
-            size = 1
-        else:
-            raise ValueError(f"Invalid S7 address: unknown data type {data_type}")
 
         return ParsedS7Address(
             area=S7AreaType.DB,
-            db_number=db_num,
-            offset=offset,
+            db_number=int(db_str),
+            offset=int(match["db_offset"]),
             bit_offset=bit_offset,
-            size=size,
+            size=_DATA_SIZES[data_type],
             data_type=f"DB{data_type}",
         )
 
-    # Try Memory bit pattern (M0.0)
-    match = _M_BIT_PATTERN.match(address_str)
-    if match:
-        offset = int(match.group(1))
-        bit_offset = int(match.group(2))
-        return ParsedS7Address(
-            area=S7AreaType.M,
-            db_number=None,
-            offset=offset,
-            bit_offset=bit_offset,
-            size=1,
-            data_type="M",
-        )
-
-    # Try Memory data pattern (MB100, MW100, MD100)
-    match = _M_DATA_PATTERN.match(address_str)
-    if match:
-        data_type = match.group(1).upper()
-        offset = int(match.group(2))
-        size = {"B": 1, "W": 2, "D": 4}[data_type]
-        return ParsedS7Address(
-            area=S7AreaType.M,
-            db_number=None,
-            offset=offset,
-            bit_offset=None,
-            size=size,
-            data_type=f"M{data_type}",
-        )
-
-    # Try I/Q bit pattern (I0.0, Q0.0)
-    match = _IO_BIT_PATTERN.match(address_str)
-    if match:
-        area_char = match.group(1).upper()
-        offset = int(match.group(2))
-        bit_offset = int(match.group(3))
-        area = S7AreaType.I if area_char == "I" else S7AreaType.Q
+    # Bit in M/I/Q (M0.0, I0.0, Q0.0)
+    area_char = match["bit_area"]
+    if area_char is not None:
         return ParsedS7Address(
-            area=area,
+            area=_AREA_TYPES[area_char],
             db_number=None,
-            offset=offset,
-            bit_offset=bit_offset,
+            offset=int(match["bit_byte"]),
+            bit_offset=int(match["bit"]),
             size=1,
             data_type=area_char,
         )
 
-    # Try I/Q data pattern (IB0, IW0, QB0, QW0, etc.)
-    match = _IO_DATA_PATTERN.match(address_str)
-    if match:
-        area_char = match.group(1).upper()
-        data_type = match.group(2).upper()
-        offset = int(match.group(3))
-        area = S7AreaType.I if area_char == "I" else S7AreaType.Q
-        size = {"B": 1, "W": 2, "D": 4}[data_type]
-        return ParsedS7Address(
-            area=area,
-            db_number=None,
-            offset=offset,
-            bit_offset=None,
-            size=size,
-            data_type=f"{area_char}{data_type}",
-        )
+    # Byte/word/double word in M/I/Q (MB100, IW0, QD4, ...)
+    area_char = match["area"]
+    data_type = match["type"]
+    return ParsedS7Address(
+        area=_AREA_TYPES[area_char],
+        db_number=None,
+        offset=int(match["offset"]),
+        bit_offset=None,
+        size=_DATA_SIZES[data_type],
+        data_type=f"{area_char}{data_type}",
+    )
+
 
-    raise ValueError(f"Invalid S7 address: {address_str}")
+# Precompiled big-endian codecs for S7 words and double words
+_INT16 = struct.Struct(">h")
+_UINT16 = struct.Struct(">H")
+_INT32 = struct.Struct(">i")
+_UINT32 = struct.Struct(">I")
+_FLOAT32 = struct.Struct(">f")
 
 
 def decode_s7_value(  # noqa: PLR0911
@@ -268,8 +244,7 @@ def decode_s7_value(  # noqa: PLR0911
     if data_type.endswith("W"):
         if len(raw_bytes) < 2:
             return 0
-        fmt = ">h" if signed else ">H"
-        result: int = struct.unpack(fmt, raw_bytes[:2])[0]
+        result: int = (_INT16 if signed else _UINT16).unpack_from(raw_bytes)[0]
         return result
 
     # Double word access (DBD, MD, ID, QD) - 4 bytes
@@ -277,10 +252,9 @@ def decode_s7_value(  # noqa: PLR0911
         if len(raw_bytes) < 4:
             return 0
         if as_float:
-            float_result: float = struct.unpack(">f", raw_bytes[:4])[0]
+            float_result: float = _FLOAT32.unpack_from(raw_bytes)[0]
             return float_result
-        fmt = ">i" if signed else ">I"
-        int_result: int = struct.unpack(fmt, raw_bytes[:4])[0]
+        int_result: int = (_INT32 if signed else _UINT32).unpack_from(raw_bytes)[0]
         return int_result
 
     # Default: treat as byte
@@ -320,26 +294,325 @@ def encode_s7_value(
 
     # Word access (DBW, MW, IW, QW) - 2 bytes
     if data_type.endswith("W"):
-        return struct.pack(">h", int(value))
+        return _INT16.pack(int(value))
 
     # Double word access (DBD, MD, ID, QD) - 4 bytes
     if data_type.endswith("D"):
         if as_float:
-            return struct.pack(">f", float(value))
-        return struct.pack(">i", int(value))
+            return _FLOAT32.pack(float(value))
+        return _INT32.pack(int(value))
 
     # Default: treat as byte
     return bytes([int(value) & 0xFF])
 
 
+# Decoder signature shared by the bound per-address decoders below
+S7Decoder = Callable[[bytes | bytearray | memoryview], Any]
+
+
+@lru_cache(maxsize=4096)
+def s7_decoder(parsed: ParsedS7Address) -> S7Decoder:
+    """Bind a decoder for one parsed address.
+
+    Resolves everything decode_s7_value decides per call (bit mask, width,
+    float vs integer) once, so decoding a read is a single call. DBD and MD
+    double words decode as float32, matching the connector's read path.
+
+    Args:
+        parsed: Parsed S7 address
+
+    Returns:
+        Callable mapping the raw bytes read for ``parsed`` to its value
+    """
+    data_type = parsed.data_type
+    if parsed.bit_offset is not None or data_type in ("DBX", "M", "I", "Q"):
+        mask = 1 << (parsed.bit_offset or 0)
+        return lambda raw: bool(raw[0] & mask)
+    if data_type.endswith("W"):
+        unpack_word = _INT16.unpack_from
+        return lambda raw: unpack_word(raw)[0]
+    if data_type.endswith("D"):
+        unpack_dword = (_FLOAT32 if data_type in ("DBD", "MD") else _INT32).unpack_from
+        return lambda raw: unpack_dword(raw)[0]
+    return itemgetter(0)
+
+
+# Encoder signature shared by the bound per-address encoders below
+S7Encoder = Callable[[Any], bytes]
+
+
+@lru_cache(maxsize=4096)
+def s7_encoder(parsed: ParsedS7Address) -> S7Encoder:
+    """Bind an encoder for one parsed address.
+
+    The write-side counterpart of s7_decoder: the result of every branch
+    encode_s7_value takes for ``parsed`` is fixed up front. DBD and MD
+    double words stay value-typed, as in the connector's write path:
+    floats encode as float32, anything else as a 32-bit integer.
+
+    Args:
+        parsed: Parsed S7 address
+
+    Returns:
+        Callable mapping a value to the bytes to write at ``parsed``
+    """
+    data_type = parsed.data_type
+    if parsed.bit_offset is not None or data_type in ("DBX", "M", "I", "Q"):
+        on, off = bytes([1 << (parsed.bit_offset or 0)]), b"\x00"
+        return lambda value: on if value else off
+    if data_type.endswith("W"):
+        pack_word = _INT16.pack
+        return lambda value: pack_word(int(value))
+    if data_type.endswith("D"):
+        pack_dint = _INT32.pack
+        if data_type in ("DBD", "MD"):
+            pack_real = _FLOAT32.pack
+            return lambda value: (
+                pack_real(value) if isinstance(value, float) else pack_dint(int(value))
+            )
+        return lambda value: pack_dint(int(value))
+    return lambda value: bytes([int(value) & 0xFF])
+
+
+# Payload bytes of one read reply with the common 480-byte PDU. snap7 splits
+# longer reads across several PDUs, so capping groups here keeps each
+# coalesced read to a single round trip.
+_MAX_READ_BYTES = 462
+
+
+@dataclass(slots=True)
+class S7ReadGroup:
+    """One coalesced read covering several addresses in the same block.
+
+    Attributes:
+        area: Memory area the group reads from
+        db_number: Data block number (DB area only)
+        start: First byte offset in the area
+        length: Number of bytes requested
+        members: (address, offset into the reply, size, bound decoder)
+        bulk: (offset, codec, addresses) for runs of back-to-back values of
+            one type, each decoded with a single unpack
+        singles: Members not covered by a bulk run
+    """
+
+    area: S7AreaType
+    db_number: int | None
+    start: int
+    length: int
+    members: list[tuple[str, int, int, S7Decoder]]
+    bulk: list[tuple[int, struct.Struct, list[str]]] = field(default_factory=list)
+    singles: list[tuple[str, int, int, S7Decoder]] = field(default_factory=list)
+
+
+def plan_s7_reads(
+    specs: list[tuple[str, ParsedS7Address, S7Decoder]], max_gap: int = 32
+) -> list[S7ReadGroup]:
+    """Group addresses into as few block reads as possible.
+
+    Addresses are grouped by area and data block and sorted by offset. An
+    address joins the current group when it starts at most ``max_gap``
+    bytes past the group's end and the group stays within one PDU.
+
+    Args:
+        specs: (address, parsed address, bound decoder) per address
+        max_gap: Unused bytes tolerated between merged addresses
+
+    Returns:
+        The groups to read
+    """
+    by_block: dict[
+        tuple[S7AreaType, int | None], list[tuple[int, int, str, S7Decoder, str | None]]
+    ] = {}
+    for addr, parsed, decoder in specs:
+        by_block.setdefault((parsed.area, parsed.db_number), []).append(
+            (parsed.offset, parsed.size, addr, decoder, _bulk_format(parsed))
+        )
+
+    groups: list[S7ReadGroup] = []
+    for (area, db_number), entries in by_block.items():
+        entries.sort(key=lambda entry: entry[0])
+        group: S7ReadGroup | None = None
+        formats: list[str | None] = []
+        for offset, size, addr, decoder, fmt in entries:
+            if group is not None:
+                end = group.start + group.length
+                new_end = max(end, offset + size)
+                if offset - end <= max_gap and new_end - group.start <= _MAX_READ_BYTES:
+                    group.length = new_end - group.start
+                    group.members.append((addr, offset - group.start, size, decoder))
+                    formats.append(fmt)
+                    continue
+                _split_bulk(group, formats)
+            group = S7ReadGroup(area, db_number, offset, size, [(addr, 0, size, decoder)])
+            formats = [fmt]
+            groups.append(group)
+        if group is not None:
+            _split_bulk(group, formats)
+
+    return groups
+
+
+# Shortest run of same-typed, back-to-back values decoded in one unpack
+_BULK_MIN_RUN = 8
+
+
+def _bulk_format(parsed: ParsedS7Address) -> str | None:
+    """struct format char matching s7_decoder for ``parsed`` (None for bits)."""
+    data_type = parsed.data_type
+    if parsed.bit_offset is not None or data_type in ("DBX", "M", "I", "Q"):
+        return None
+    if data_type.endswith("W"):
+        return "h"
+    if data_type.endswith("D"):
+        return "f" if data_type in ("DBD", "MD") else "i"
+    return "B"
+
+
+def _split_bulk(group: S7ReadGroup, formats: list[str | None]) -> None:
+    """Find runs a group can decode with one unpack; the rest stay singles."""
+    members = group.members
+    i = 0
+    while i < len(members):
+        fmt = formats[i]
+        _, offset, size, _ = members[i]
+        j = i + 1
+        while (
+            j < len(members)
+            and fmt is not None
+            and formats[j] == fmt
+            and members[j][1] == members[j - 1][1] + size
+        ):
+            j += 1
+        if fmt is not None and j - i >= _BULK_MIN_RUN:
+            codec = struct.Struct(f">{j - i}{fmt}")
+            group.bulk.append((offset, codec, [member[0] for member in members[i:j]]))
+        else:
+            group.singles.extend(members[i:j])
+        i = j
+
+
+# Items per multi-variable read request (snap7's MaxVars) and the word length
+# code for plain byte access
+_MAX_MULTI_VARS = 20
+_S7_WL_BYTE = 0x02
+# Reply bytes each item adds on top of its data
+_MULTI_VAR_ITEM_OVERHEAD = 4
+
+
+def _multi_var_batches(groups: list[S7ReadGroup]) -> list[list[S7ReadGroup]]:
+    """Pack groups into multi-variable requests whose replies fit one PDU."""
+    batches: list[list[S7ReadGroup]] = []
+    batch: list[S7ReadGroup] = []
+    reply_bytes = 0
+    for group in groups:
+        # Item data is padded to an even length in the reply
+        item_bytes = _MULTI_VAR_ITEM_OVERHEAD + group.length + (group.length & 1)
+        if batch and (len(batch) == _MAX_MULTI_VARS or reply_bytes + item_bytes > _MAX_READ_BYTES):
+            batches.append(batch)
+            batch, reply_bytes = [], 0
+        batch.append(group)
+        reply_bytes += item_bytes
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _read_multi(client: Any, batch: list[S7ReadGroup]) -> list[memoryview | None]:
+    """Read several groups in one multi-variable request.
+
+    snap7 writes every item straight into one shared buffer, so a batch
+    costs a single allocation and no copies.
+
+    Returns one view per group, or None where the PLC reported an error
+    for that item.
+    """
+    buffer = bytearray(sum(group.length for group in batch))
+    view = memoryview(buffer)
+    items = (S7DataItem * len(batch))()
+    offsets = []
+    offset = 0
+    for item, group in zip(items, batch, strict=True):
+        item.Area = S7_AREA_CODES[group.area]
+        item.WordLen = _S7_WL_BYTE
+        item.DBNumber = group.db_number or 0
+        item.Start = group.start
+        item.Amount = group.length
+        item.pData = ctypes.cast(
+            (ctypes.c_uint8 * group.length).from_buffer(buffer, offset),
+            ctypes.POINTER(ctypes.c_uint8),
+        )
+        offsets.append(offset)
+        offset += group.length
+
+    client.read_multi_vars(items)
+    return [
+        view[start : start + group.length] if item.Result == 0 else None
+        for item, group, start in zip(items, batch, offsets, strict=True)
+    ]
+
+
+def _read_block(
+    client: Any, area: S7AreaType, db_number: int | None, start: int, size: int
+) -> bytearray:
+    """Read ``size`` bytes from an S7 area with the blocking snap7 client."""
+    if area == S7AreaType.DB:
+        if db_number is None:
+            raise ValueError("DB address requires db_number")
+        return cast("bytearray", client.db_read(db_number, start, size))
+    return cast("bytearray", client.read_area(S7_AREA_CODES[area], 0, start, size))
+
+
+def _decode_group(
+    client: Any,
+    group: S7ReadGroup,
+    raw: bytearray | memoryview | None,
+    results: dict[str, Any],
+) -> None:
+    """Decode a group's members into ``results``, reading the block if needed."""
+    if raw is None:
+        try:
+            raw = _read_block(client, group.area, group.db_number, group.start, group.length)
+        except Exception as e:
+            if len(group.members) == 1:
+                logger.warning(
+                    "Failed to read S7 address", address=group.members[0][0], error=str(e)
+                )
+                return
+            # A merged block can run past the end of a DB; fall back to
+            # reading the members one by one
+
+    if raw is None:
+        members = group.members
+    else:
+        members = group.singles
+        for offset, codec, addrs in group.bulk:
+            try:
+                results.update(zip(addrs, codec.unpack_from(raw, offset), strict=True))
+            except struct.error as e:
+                for addr in addrs:
+                    logger.warning("Failed to read S7 address", address=addr, error=str(e))
+
+    for addr, offset, size, decoder in members:
+        try:
+            if raw is None:
+                member = _read_block(
+                    client, group.area, group.db_number, group.start + offset, size
+                )
+            else:
+                member = raw[offset : offset + size]
+            results[addr] = decoder(member)
+        except Exception as e:
+            logger.warning("Failed to read S7 address", address=addr, error=str(e))
+
+
 class S7Connector(BaseConnector):
     """Siemens S7 PLC connector using python-snap7.
 
     Supports S7-300, S7-400, S7-1200, and S7-1500 PLCs.
     Uses TCP/IP communication (port 102 by default).
 
-    snap7 is a synchronous library, so all operations are wrapped
-    with asyncio.to_thread() for async compatibility.
+    snap7 is a synchronous library and its Client is not safe for concurrent
+    use, so every call runs on one long-lived worker thread per connector.
     """
 
     def __init__(self, config: S7ConnectorConfig) -> None:
@@ -361,12 +634,36 @@ class S7Connector(BaseConnector):
         self._rack = config.rack
         self._slot = config.slot
         self._port = config.port
+        self._max_read_gap = config.max_read_gap
+        # address -> (parsed address, bound decoder), filled on first read
+        self._read_specs: dict[str, tuple[ParsedS7Address, S7Decoder]] = {}
+        # address -> (parsed address, bound encoder), filled on first write
+        self._write_specs: dict[str, tuple[ParsedS7Address, S7Encoder]] = {}
+        # (address list, its read groups) for the most recent poll
+        self._read_plan: tuple[list[str], list[S7ReadGroup]] | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _submit(self, call: Callable[[], T]) -> asyncio.Future[T]:
+        """Run a blocking snap7 call on the connector's worker thread.
+
+        The worker is started on first use and stopped on disconnect; calls
+        queue up behind each other, so the client never sees two at once.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"s7-{self.name}")
+        return asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    def _shutdown_executor(self) -> None:
+        """Let the worker thread exit once its queued calls have run."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     async def _do_connect(self) -> None:
         """Establish connection to S7 PLC.
 
         Uses snap7's connect method with rack and slot.
-        Connection is run in a thread to avoid blocking.
+        Connection is run on the worker thread to avoid blocking.
         """
         self._client = snap7.client.Client()
 
@@ -377,7 +674,7 @@ class S7Connector(BaseConnector):
             if not self._client.get_connected():
                 raise ConnectionError(f"Failed to connect to {self._host}")
 
-        await asyncio.to_thread(connect_sync)
+        await self._submit(connect_sync)
 
         logger.debug(
             "S7 connected",
@@ -394,77 +691,77 @@ class S7Connector(BaseConnector):
                 if self._client:
                     self._client.disconnect()
 
-            await asyncio.to_thread(disconnect_sync)
-            self._client = None
+            try:
+                await self._submit(disconnect_sync)
+            finally:
+                self._client = None
+        self._shutdown_executor()
 
     async def _do_read(self, addresses: list[str]) -> dict[str, Any]:
         """Read multiple S7 addresses.
 
+        Adjacent addresses are coalesced into block reads (see plan_s7_reads),
+        and every block of a poll is read in one hop to the worker thread.
+
         Args:
             addresses: List of S7 address strings to read
 
         Returns:
-            Dictionary mapping addresses to decoded values
-
-        Note:
-            Currently reads each address individually.
-            Future optimization: coalesce adjacent addresses.
+            Dictionary mapping addresses to decoded values; addresses that
+            could not be parsed or read are left out
         """
         if not self._client:
             raise ConnectionError("Not connected")
 
-        results: dict[str, Any] = {}
+        # Polls repeat the same address list; reuse its plan while it does
+        plan = self._read_plan
+        if plan is not None and plan[0] == addresses:
+            groups = plan[1]
+        else:
+            groups = plan_s7_reads(self._resolve(addresses), self._max_read_gap)
+            self._read_plan = (list(addresses), groups)
+        client = self._client
+        return await self._submit(lambda: self._read_groups(client, groups))
 
+    def _resolve(self, addresses: list[str]) -> list[tuple[str, ParsedS7Address, S7Decoder]]:
+        """Look up (or parse and bind) the read spec of every address."""
+        specs = self._read_specs
+        resolved: list[tuple[str, ParsedS7Address, S7Decoder]] = []
         for addr_str in addresses:
-            try:
-                parsed = parse_s7_address(addr_str)
-                value = await self._read_single(parsed)
-                results[addr_str] = value
-            except Exception as e:
-                logger.warning(
-                    "Failed to read S7 address",
-                    address=addr_str,
-                    error=str(e),
-                )
-                # Don't include failed reads - let caller handle quality
-
-        return results
-
-    async def _read_single(self, parsed: ParsedS7Address) -> Any:
-        """Read a single S7 address.
-
-        Args:
-            parsed: Parsed S7 address
-
-        Returns:
-            Decoded value from PLC
+            spec = specs.get(addr_str)
+            if spec is None:
+                try:
+                    parsed = parse_s7_address(addr_str)
+                except ValueError as e:
+                    logger.warning("Failed to read S7 address", address=addr_str, error=str(e))
+                    continue
+                spec = specs[addr_str] = (parsed, s7_decoder(parsed))
+            resolved.append((addr_str, *spec))
+        return resolved
+
+    @staticmethod
+    def _read_groups(client: Any, groups: list[S7ReadGroup]) -> dict[str, Any]:
+        """Read and decode every group (blocking; runs in a worker thread).
+
+        With more than one group, groups travel together in multi-variable
+        requests; any group those could not deliver is read on its own.
         """
-        if not self._client:
-            raise ConnectionError("Not connected")
-
-        client = self._client
+        prefetched: dict[int, memoryview] = {}
+        if S7DataItem is not None and len(groups) > 1:
+            for batch in _multi_var_batches(groups):
+                try:
+                    raws = _read_multi(client, batch)
+                except Exception as e:
+                    logger.debug("S7 multi-variable read failed", error=str(e))
+                    continue
+                for group, raw in zip(batch, raws, strict=True):
+                    if raw is not None:
+                        prefetched[id(group)] = raw
 
-        def read_sync() -> bytes:
-            if parsed.area == S7AreaType.DB:
-                if parsed.db_number is None:
-                    raise ValueError("DB address requires db_number")
-                return bytes(client.db_read(parsed.db_number, parsed.offset, parsed.size))
-            else:
-                area_code = S7_AREA_CODES[parsed.area]
-                return bytes(client.read_area(area_code, 0, parsed.offset, parsed.size))
-
-        raw_bytes = await asyncio.to_thread(read_sync)
-
-        # Determine if this should be decoded as float
-        # DBD with no bit offset is commonly used for floats
-        as_float = parsed.data_type in ("DBD", "MD") and parsed.bit_offset is None
-
-        return decode_s7_value(
-            raw_bytes,
-            parsed.data_type,
-            as_float=as_float,
-            bit_offset=parsed.bit_offset,
-        )
+        results: dict[str, Any] = {}
+        for group in groups:
+            _decode_group(client, group, prefetched.get(id(group)), results)
+        return results
 
     async def _do_write(self, address: str, value: Any) -> None:
         """Write to a single S7 address.
@@ -480,26 +777,22 @@ class S7Connector(BaseConnector):
         if not self._client:
             raise ConnectionError("Not connected")
 
-        parsed = parse_s7_address(address)
+        spec = self._write_specs.get(address)
+        if spec is None:
+            parsed = parse_s7_address(address)
+            spec = self._write_specs[address] = (parsed, s7_encoder(parsed))
+        parsed, encoder = spec
         client = self._client
-
-        # Determine if value should be encoded as float
-        as_float = isinstance(value, float) and parsed.data_type in ("DBD", "MD")
-
-        encoded = encode_s7_value(
-            value,
-            parsed.data_type,
-            as_float=as_float,
-            bit_offset=parsed.bit_offset,
-        )
+        # snap7 copies the payload into its own ctypes buffer, so plain bytes do
+        encoded = encoder(value)
 
         def write_sync() -> None:
             if parsed.area == S7AreaType.DB:
                 if parsed.db_number is None:
                     raise ValueError("DB address requires db_number")
-                client.db_write(parsed.db_number, parsed.offset, bytearray(encoded))
+                client.db_write(parsed.db_number, parsed.offset, encoded)
             else:
                 area_code = S7_AREA_CODES[parsed.area]
-                client.write_area(area_code, 0, parsed.offset, bytearray(encoded))
+                client.write_area(area_code, 0, parsed.offset, encoded)
 
-        await asyncio.to_thread(write_sync)
+        await self._submit(write_sync)
@@ -6,15 +6,21 @@ debugging, compliance, and operational visibility.
 
 from __future__ import annotations
 
-import asyncio
+import logging
+import re
+import time
 from collections import deque
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from mtp_gateway.domain.state_machine.packml import (
         PackMLCommand,
         PackMLState,
@@ -38,10 +44,24 @@ _SENSITIVE_KEYS = frozenset(
 )
 
 
+# All sensitive substrings as one alternation, so a key is scanned once
+_SENSITIVE_PATTERN = re.compile("|".join(map(re.escape, sorted(_SENSITIVE_KEYS))))
+
+
+@lru_cache(maxsize=1024)
 def _is_sensitive(key: str) -> bool:
-    """Check if a key name suggests sensitive content."""
-    key_lower = key.lower()
-    return any(sensitive in key_lower for sensitive in _SENSITIVE_KEYS)
+    """Check if a key name suggests sensitive content.
+
+    Memoized: security events reuse a small set of detail keys.
+    """
+    return _SENSITIVE_PATTERN.search(key.lower()) is not None
+
+
+def _loggable_details(details: dict[str, object]) -> dict[str, object]:
+    """Drop sensitive keys from event details, copying only when needed."""
+    if not any(_is_sensitive(key) for key in details):
+        return details
+    return {k: v for k, v in details.items() if not _is_sensitive(k)}
 
 
 @dataclass
@@ -114,6 +134,17 @@ class SecurityAuditEntry(AuditEntry):
     source_ip: str | None = None
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# Stored form of one entry: (entry class, service, epoch ns, remaining fields)
+_AuditRow = tuple["Callable[..., AuditEntry]", str, int, tuple[Any, ...]]
+
+
+def _timestamp(ns: int) -> datetime:
+    """Convert epoch nanoseconds to an aware UTC datetime (exact to the µs)."""
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
 class AuditTrail:
     """Audit trail for service operations.
 
@@ -144,8 +175,33 @@ class AuditTrail:
                          Oldest entries are discarded when limit is reached.
         """
         self._max_entries = max_entries
-        self._entries: deque[AuditEntry] = deque(maxlen=max_entries)
-        self._lock = asyncio.Lock()
+        # A single deque.append is atomic, and the log_* methods never await
+        # between building and storing an entry, so no lock is needed.
+        # Entries are kept as plain tuples with an integer timestamp and only
+        # become AuditEntry objects when get_entries() returns them.
+        self._entries: deque[_AuditRow] = deque(maxlen=max_entries)
+        # service -> its rows, oldest first; always the same rows as
+        # self._entries holds for that service (see _append)
+        self._by_service: dict[str, deque[_AuditRow]] = {}
+
+    def _append(self, row: _AuditRow) -> None:
+        """Store a row in the trail and in its service's index."""
+        entries = self._entries
+        if not entries.maxlen:
+            return
+        if len(entries) == entries.maxlen:
+            # The oldest row is about to fall off the trail; it is also the
+            # oldest row of its service, so the index drops it from the left
+            evicted = entries[0][1]
+            bucket = self._by_service[evicted]
+            bucket.popleft()
+            if not bucket:
+                del self._by_service[evicted]
+        entries.append(row)
+        bucket = self._by_service.get(row[1])
+        if bucket is None:
+            bucket = self._by_service[row[1]] = deque()
+        bucket.append(row)
 
     async def log_command(
         self,
@@ -164,17 +220,19 @@ class AuditTrail:
             result: TransitionResult from executing the command.
             procedure_id: Optional procedure ID for START commands.
         """
-        entry = CommandAuditEntry(
-            service=service,
-            command=command,
-            source=source,
-            result=result,
-            procedure_id=procedure_id,
+        self._append(
+            (
+                CommandAuditEntry,
+                service,
+                time.time_ns(),
+                (command, source, result, procedure_id),
+            )
         )
 
-        async with self._lock:
-            self._entries.append(entry)
-
+        # Ask structlog's own level check so the gate matches whichever
+        # wrapper class is configured, and skip building the debug kwargs
+        if not logger.is_enabled_for(logging.DEBUG):
+            return
         logger.debug(
             "Command logged",
             service=service,
@@ -200,16 +258,17 @@ class AuditTrail:
             to_state: State after the transition.
             trigger: What caused the transition.
         """
-        entry = StateTransitionAuditEntry(
-            service=service,
-            from_state=from_state,
-            to_state=to_state,
-            trigger=trigger,
+        self._append(
+            (
+                StateTransitionAuditEntry,
+                service,
+                time.time_ns(),
+                (from_state, to_state, trigger),
+            )
         )
 
-        async with self._lock:
-            self._entries.append(entry)
-
+        if not logger.is_enabled_for(logging.DEBUG):
+            return
         logger.debug(
             "State transition logged",
             service=service,
@@ -245,17 +304,16 @@ class AuditTrail:
             success: Whether the operation succeeded.
             source_ip: Optional source IP for network events.
         """
-        entry = SecurityAuditEntry(
-            service=service,
-            event_type=event_type,
-            details=details or {},
-            success=success,
-            source_ip=source_ip,
+        details = details or {}
+        self._append(
+            (
+                SecurityAuditEntry,
+                service,
+                time.time_ns(),
+                (event_type, details, success, source_ip),
+            )
         )
 
-        async with self._lock:
-            self._entries.append(entry)
-
         # Log at appropriate level based on event type and success
         log_func = logger.warning if not success else logger.info
         log_func(
@@ -264,7 +322,7 @@ class AuditTrail:
             service=service,
             success=success,
             source_ip=source_ip,
-            **{k: v for k, v in (details or {}).items() if not _is_sensitive(k)},
+            **_loggable_details(details),
         )
 
     def get_entries(
@@ -281,19 +339,23 @@ class AuditTrail:
         Returns:
             List of audit entries in chronological order.
         """
-        entries = list(self._entries)
-
-        if service is not None:
-            entries = [e for e in entries if e.service == service]
+        # Walk newest-first so a limited query stops after ``limit`` matches
+        # instead of copying the whole trail
+        rows: Iterable[_AuditRow] = reversed(
+            self._entries if service is None else self._by_service.get(service, ())
+        )
 
-        if limit is not None:
-            entries = entries[-limit:]
+        if limit:  # as with the former entries[-limit:], 0 means no limit
+            rows = islice(rows, limit)
 
+        entries = [cls(svc, _timestamp(ns), *fields) for cls, svc, ns, fields in rows]
+        entries.reverse()
         return entries
 
     def clear(self) -> None:
         """Clear all audit entries."""
         self._entries.clear()
+        self._by_service.clear()
         logger.info("Audit trail cleared")
 
     @property
@@ -24,6 +24,8 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+_UNDEFINED = PackMLState.UNDEFINED
+
 
 class HybridProxy(ServiceProxy):
     """Hybrid proxy - writes to PLC and tracks locally.
@@ -110,10 +112,11 @@ class HybridProxy(ServiceProxy):
         # Try to get state from PLC first
         plc_state = await self._thin_proxy.get_state()
 
-        if plc_state != PackMLState.UNDEFINED:
+        if plc_state is not _UNDEFINED:
             # Sync local state with PLC
-            if plc_state != self._state_machine.current_state:
-                self._state_machine._state = plc_state
+            state_machine = self._state_machine
+            if state_machine._state is not plc_state:
+                state_machine._state = plc_state
             return plc_state
 
         # Fall back to local state
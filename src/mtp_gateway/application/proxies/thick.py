@@ -7,6 +7,7 @@ auto-complete after hooks finish.
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 import structlog
@@ -25,6 +26,22 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Acting (-ING) states, which complete into a target state
+_ACTING_STATES: frozenset[PackMLState] = frozenset(
+    {
+        PackMLState.STARTING,
+        PackMLState.COMPLETING,
+        PackMLState.HOLDING,
+        PackMLState.UNHOLDING,
+        PackMLState.STOPPING,
+        PackMLState.ABORTING,
+        PackMLState.CLEARING,
+        PackMLState.SUSPENDING,
+        PackMLState.UNSUSPENDING,
+        PackMLState.RESETTING,
+    }
+)
+
 
 class ThickProxy(ServiceProxy):
     """Thick proxy - state machine runs in gateway.
@@ -56,7 +73,15 @@ class ThickProxy(ServiceProxy):
         # Convert config hooks to domain model
         self._state_hooks = StateHooks.from_config(config.state_hooks)
 
+        # Acting states that wait for a configured condition instead of
+        # auto-completing
+        self._conditioned_states = frozenset(
+            PackMLState[condition_state.value] for condition_state in config.acting_state_conditions
+        )
+        self._auto_complete = config.timeouts.auto_complete_acting_states
+
         # Register state entry callbacks for hooks
+        self._hooks_by_state: dict[PackMLState, tuple[WriteAction, ...]] = {}
         self._register_state_callbacks()
 
     @property
@@ -69,29 +94,35 @@ class ThickProxy(ServiceProxy):
         for state in PackMLState:
             hooks = self._state_hooks.get_hooks_for_state(state)
             if hooks:
-
-                async def on_enter_state(
-                    entered_state: PackMLState,
-                    hooks: tuple[WriteAction, ...] = hooks,
-                ) -> None:
-                    await self._execute_hooks(hooks)
-                    logger.debug(
-                        "Executed hooks for state",
-                        service=self._config.name,
-                        state=entered_state.name,
-                        hook_count=len(hooks),
-                    )
-
-                self._state_machine.on_enter(state, on_enter_state)
+                self._hooks_by_state[state] = hooks
+                self._state_machine.on_enter(state, self._on_enter_state)
+
+    async def _on_enter_state(self, entered_state: PackMLState) -> None:
+        """Run the hooks registered for the state just entered."""
+        hooks = self._hooks_by_state[entered_state]
+        await self._execute_hooks(hooks)
+        logger.debug(
+            "Executed hooks for state",
+            service=self._config.name,
+            state=entered_state.name,
+            hook_count=len(hooks),
+        )
 
     async def _execute_hooks(self, hooks: tuple[WriteAction, ...]) -> None:
         """Execute a sequence of write actions.
 
+        Writes go out one at a time in listed order, or all at once when the
+        service sets ``parallel_hooks``.
+
         Args:
             hooks: Tuple of WriteAction to execute.
         """
+        write_tag = self._tag_manager.write_tag
+        if self._config.parallel_hooks and len(hooks) > 1:
+            await asyncio.gather(*(write_tag(action.tag, action.value) for action in hooks))
+            return
         for action in hooks:
-            await self._tag_manager.write_tag(action.tag, action.value)
+            await write_tag(action.tag, action.value)
 
     async def send_command(
         self,
@@ -131,37 +162,26 @@ class ThickProxy(ServiceProxy):
         )
 
     async def _auto_complete_acting_state(self) -> None:
-        """Auto-complete an acting state after hooks finish."""
-        result = await self._state_machine.complete_acting_state()
+        """Auto-complete an acting state after hooks finish.
 
-        # Check if new state is also an acting state
-        if result.success and result.to_state and self._is_acting_state(result.to_state):
-            await self._auto_complete_acting_state()
+        Completing can land in another acting state, which is completed in
+        turn; the chain is walked in a loop that visits each acting state at
+        most once.
+        """
+        for _ in range(len(_ACTING_STATES)):
+            result = await self._state_machine.complete_acting_state()
+
+            # Stop once the new state is not an acting state
+            if not (result.success and result.to_state and self._is_acting_state(result.to_state)):
+                return
 
     def _is_acting_state(self, state: PackMLState) -> bool:
         """Check if state is an acting state (-ING suffix)."""
-        acting_states = {
-            PackMLState.STARTING,
-            PackMLState.COMPLETING,
-            PackMLState.HOLDING,
-            PackMLState.UNHOLDING,
-            PackMLState.STOPPING,
-            PackMLState.ABORTING,
-            PackMLState.CLEARING,
-            PackMLState.SUSPENDING,
-            PackMLState.UNSUSPENDING,
-            PackMLState.RESETTING,
-        }
-        return state in acting_states
+        return state in _ACTING_STATES
 
     def _should_auto_complete(self, state: PackMLState) -> bool:
         """Determine whether acting state should auto-complete."""
-        if not self._config.timeouts.auto_complete_acting_states:
-            return False
-        for condition_state in self._config.acting_state_conditions:
-            if PackMLState[condition_state.value] == state:
-                return False
-        return True
+        return self._auto_complete and state not in self._conditioned_states
 
     async def complete_acting_state(self) -> None:
         """Advance from an acting state to its target state."""
@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+_UNDEFINED = PackMLState.UNDEFINED
+
 
 class ThinProxy(ServiceProxy):
     """Thin proxy - state machine runs in PLC.
@@ -42,6 +44,9 @@ class ThinProxy(ServiceProxy):
         """
         self._config = config
         self._tag_manager = tag_manager
+        # (raw state value, its PackMLState) from the last successful lookup;
+        # the state tag rarely changes between polls
+        self._state_cache: tuple[int, PackMLState] | None = None
 
     @property
     def name(self) -> str:
@@ -106,20 +111,26 @@ class ThinProxy(ServiceProxy):
             Current PackML state, or UNDEFINED if unavailable.
         """
         if self._config.state_cur_tag is None:
-            return PackMLState.UNDEFINED
+            return _UNDEFINED
 
         value = self._tag_manager.get_value(self._config.state_cur_tag)
         if value is None or value.value is None:
-            return PackMLState.UNDEFINED
+            return _UNDEFINED
 
+        raw = value.value
         try:
-            if isinstance(value.value, int):
-                return PackMLState(value.value)
+            if isinstance(raw, int):
+                cached = self._state_cache
+                if cached is not None and cached[0] == raw:
+                    return cached[1]
+                state = PackMLState(raw)
+                self._state_cache = (raw, state)
+                return state
         except ValueError:
             logger.warning(
                 "Invalid state value from PLC",
                 service=self._config.name,
-                value=value.value,
+                value=raw,
             )
 
-        return PackMLState.UNDEFINED
+        return _UNDEFINED
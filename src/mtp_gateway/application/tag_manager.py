@@ -264,6 +264,8 @@ class TagManager:
             error=error,
         )
         now = datetime.now(UTC)
+        # Tags without a last good value all get this one (frozen) instance
+        no_comm = TagValue(value=0, timestamp=now, quality=Quality.BAD_NO_COMMUNICATION)
         for tag_def in tags:
             tag_state = self._tags.get(tag_def.name)
             if tag_state:
@@ -276,11 +278,7 @@ class TagManager:
                         source_timestamp=tag_state.last_good_value.timestamp,
                     )
                 else:
-                    bad_value = TagValue(
-                        value=0,
-                        timestamp=now,
-                        quality=Quality.BAD_NO_COMMUNICATION,
-                    )
+                    bad_value = no_comm
                 tag_state.update(bad_value)
                 self._notify_subscribers(tag_def.name, bad_value)
 
@@ -243,6 +243,16 @@ class ModbusTCPConnectorConfig(BaseConnectorConfig):
     host: str = Field(..., description="PLC hostname or IP address")
     port: int = Field(default=502, ge=1, le=65535, description="Modbus TCP port")
     unit_id: int = Field(default=1, ge=0, le=255, description="Modbus unit/slave ID")
+    max_read_gap: int = Field(
+        default=4,
+        ge=0,
+        le=124,
+        description="Unused registers/coils allowed between tags merged into one read",
+    )
+    support_fc23: bool = Field(
+        default=False,
+        description="Carry register writes on concurrent reads as FC23 (Read/Write Multiple)",
+    )
 
 
 class ModbusRTUConnectorConfig(BaseConnectorConfig):
@@ -255,6 +265,16 @@ class ModbusRTUConnectorConfig(BaseConnectorConfig):
     stopbits: Literal[1, 2] = Field(default=1)
     bytesize: Literal[7, 8] = Field(default=8)
     unit_id: int = Field(default=1, ge=0, le=255)
+    max_read_gap: int = Field(
+        default=4,
+        ge=0,
+        le=124,
+        description="Unused registers/coils allowed between tags merged into one read",
+    )
+    support_fc23: bool = Field(
+        default=False,
+        description="Carry register writes on concurrent reads as FC23 (Read/Write Multiple)",
+    )
 
 
 class S7ConnectorConfig(BaseConnectorConfig):
@@ -265,6 +285,12 @@ class S7ConnectorConfig(BaseConnectorConfig):
     rack: int = Field(default=0, ge=0, le=7)
     slot: int = Field(default=1, ge=0, le=31)
     port: int = Field(default=102, ge=1, le=65535)
+    max_read_gap: int = Field(
+        default=32,
+        ge=0,
+        le=462,
+        description="Unused bytes allowed between tags merged into one read",
+    )
 
 
 class EIPConnectorConfig(BaseConnectorConfig):
@@ -273,6 +299,35 @@ class EIPConnectorConfig(BaseConnectorConfig):
     type: Literal[ConnectorType.EIP] = ConnectorType.EIP
     host: str = Field(..., description="PLC hostname or IP address")
     slot: int = Field(default=0, ge=0, description="Processor slot")
+    coalesce_window_ms: float = Field(
+        default=0.0,
+        ge=0,
+        le=100,
+        description="Hold concurrent reads this long to merge them into one CIP request",
+    )
+    keepalive_s: float = Field(
+        default=0.0,
+        ge=0,
+        le=3600,
+        description="Send a no-op request after this many idle seconds (0 disables)",
+    )
+    cip_mtu: int = Field(
+        default=0,
+        ge=0,
+        le=4002,
+        description="Target bytes per batch read request (0 leaves packing to pycomm3)",
+    )
+    max_tags_per_packet: int = Field(
+        default=0,
+        ge=0,
+        description="Upper bound on tags per batch read request (0 means no limit)",
+    )
+    cache_ttl_ms: int = Field(
+        default=0,
+        ge=0,
+        le=10000,
+        description="Serve repeat reads of a tag from memory for this long (0 disables)",
+    )
 
 
 class OPCUAClientConnectorConfig(BaseConnectorConfig):
@@ -285,6 +340,10 @@ class OPCUAClientConnectorConfig(BaseConnectorConfig):
     password: str | None = Field(default=None)
     cert_path: Path | None = Field(default=None)
     key_path: Path | None = Field(default=None)
+    share_session: bool = Field(
+        default=False,
+        description="Share one session (and batched reads) with connectors on the same server",
+    )
 
 
 # Union of all connector types
@@ -548,6 +607,10 @@ class ServiceConfig(BaseModel):
         description="Report value data assembly references",
     )
     state_hooks: StateHooksConfig = Field(default_factory=StateHooksConfig)
+    parallel_hooks: bool = Field(
+        default=False,
+        description="Issue a state's hook writes concurrently instead of in listed order",
+    )
     completion: CompletionConfig = Field(default_factory=CompletionConfig)
     timeouts: StateTimeoutsConfig = Field(default_factory=StateTimeoutsConfig)
     acting_state_conditions: dict[PackMLStateName, ConditionConfig] = Field(
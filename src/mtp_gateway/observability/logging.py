@@ -45,6 +45,9 @@ def setup_logging(
 
     # Configure structlog processors
     shared_processors: list[Any] = [
+        # Drop events below the configured level before any other processor
+        # (timestamping, rendering) spends time on them
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
@@ -10,6 +10,7 @@ Secrets are never logged - the audit module masks sensitive values.
 from __future__ import annotations
 
 import os
+import re
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
@@ -35,6 +36,9 @@ SENSITIVE_KEYS = frozenset(
     }
 )
 
+# SENSITIVE_KEYS compiled into a single alternation for is_sensitive_key
+_SENSITIVE_PATTERN = re.compile("|".join(map(re.escape, sorted(SENSITIVE_KEYS))))
+
 
 def is_sensitive_key(key: str) -> bool:
     """Check if a key name suggests sensitive content.
@@ -45,8 +49,7 @@ def is_sensitive_key(key: str) -> bool:
     Returns:
         True if the key appears to be sensitive.
     """
-    key_lower = key.lower()
-    return any(sensitive in key_lower for sensitive in SENSITIVE_KEYS)
+    return _SENSITIVE_PATTERN.search(key.lower()) is not None
 
 
 def mask_sensitive_value(value: str) -> str:
@@ -5,11 +5,18 @@ Tests command logging, state transition logging, and audit retrieval.
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 import pytest
-
-from mtp_gateway.application.audit import AuditTrail, CommandAuditEntry, StateTransitionAuditEntry
+from structlog.testing import capture_logs
+
+from mtp_gateway.application.audit import (
+    AuditTrail,
+    CommandAuditEntry,
+    StateTransitionAuditEntry,
+    _is_sensitive,
+    _loggable_details,
+)
 from mtp_gateway.domain.state_machine.packml import (
     PackMLCommand,
     PackMLState,
@@ -301,6 +308,33 @@ class TestAuditTrailGetEntries:
         entries = audit_trail.get_entries()
         assert entries[0].timestamp <= entries[1].timestamp
 
+    @pytest.mark.asyncio
+    async def test_entries_are_built_with_utc_timestamps(self, audit_trail: AuditTrail) -> None:
+        """get_entries() rebuilds typed entries with aware timestamps, newest last."""
+        before = datetime.now(UTC).replace(microsecond=0)
+        await audit_trail.log_state_transition(
+            service="Service1",
+            from_state=PackMLState.IDLE,
+            to_state=PackMLState.STARTING,
+            trigger="START command",
+        )
+        await audit_trail.log_state_transition(
+            service="Service1",
+            from_state=PackMLState.STARTING,
+            to_state=PackMLState.EXECUTE,
+            trigger="auto-complete",
+        )
+
+        entries = audit_trail.get_entries(service="Service1", limit=1)
+
+        assert len(entries) == 1
+        entry = entries[0]
+        assert isinstance(entry, StateTransitionAuditEntry)
+        assert entry.to_state == PackMLState.EXECUTE
+        assert entry.trigger == "auto-complete"
+        assert entry.timestamp.tzinfo is UTC
+        assert entry.timestamp >= before
+
 
 class TestAuditTrailLimits:
     """Tests for AuditTrail entry limits and cleanup."""
@@ -328,6 +362,25 @@ class TestAuditTrailLimits:
         # Should keep most recent entries
         assert entries[-1].service == "Service9"
 
+    @pytest.mark.asyncio
+    async def test_service_filter_follows_eviction(self) -> None:
+        """Per-service queries only see entries still held by the trail."""
+        audit_trail = AuditTrail(max_entries=3)
+
+        for i in range(5):
+            await audit_trail.log_state_transition(
+                service="A" if i % 2 == 0 else "B",
+                from_state=PackMLState.IDLE,
+                to_state=PackMLState.STARTING,
+                trigger=f"t{i}",
+            )
+
+        assert [e.trigger for e in audit_trail.get_entries()] == ["t2", "t3", "t4"]
+        assert [e.trigger for e in audit_trail.get_entries(service="A")] == ["t2", "t4"]
+        assert [e.trigger for e in audit_trail.get_entries(service="B")] == ["t3"]
+        assert [e.trigger for e in audit_trail.get_entries(service="A", limit=1)] == ["t4"]
+        assert audit_trail.get_entries(service="C") == []
+
     @pytest.mark.asyncio
     async def test_clear_entries(self, audit_trail: AuditTrail) -> None:
         """clear() should remove all entries."""
@@ -346,3 +399,43 @@ class TestAuditTrailLimits:
         audit_trail.clear()
         entries = audit_trail.get_entries()
         assert len(entries) == 0
+
+
+def test_sensitive_key_checks_are_memoized() -> None:
+    """Detail keys are classified once, case-insensitively."""
+    _is_sensitive.cache_clear()
+
+    assert _is_sensitive("User_Password") is True
+    assert _is_sensitive("username") is False
+    assert _is_sensitive("User_Password") is True
+
+    info = _is_sensitive.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+
+
+def test_loggable_details_copies_only_when_redacting() -> None:
+    """Clean details pass through; sensitive keys are dropped from a copy."""
+    clean = {"user": "op1", "host": "plc-1"}
+    assert _loggable_details(clean) is clean
+
+    mixed = {"user": "op1", "api_key": "s3cret"}
+    assert _loggable_details(mixed) == {"user": "op1"}
+    assert mixed == {"user": "op1", "api_key": "s3cret"}
+
+
+async def test_debug_events_follow_structlog_level(audit_trail: AuditTrail) -> None:
+    """Without stdlib logging configured, structlog's own level decides."""
+    with capture_logs() as logs:
+        await audit_trail.log_command(
+            service="Reactor1",
+            command=PackMLCommand.START,
+            source="user",
+            result=TransitionResult(
+                success=True,
+                from_state=PackMLState.IDLE,
+                to_state=PackMLState.STARTING,
+            ),
+        )
+
+    assert [log["event"] for log in logs] == ["Command logged"]
@@ -13,6 +13,8 @@ EIP Address Formats:
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -21,6 +23,7 @@ import pytest
 from mtp_gateway.adapters.southbound.base import ConnectorState
 from mtp_gateway.adapters.southbound.eip.driver import (
     EIPConnector,
+    _chunk_tags,
     parse_eip_address,
 )
 from mtp_gateway.config.schema import EIPConnectorConfig
@@ -110,6 +113,13 @@ class TestEIPAddressParsing:
         assert parsed.tag_name == "MyUDT.ArrayMember"
         assert parsed.element == 2
 
+    def test_parse_nested_array_path(self) -> None:
+        """MyUDT[1].Values[2] → tag_name=MyUDT[1].Values, element=2."""
+        parsed = parse_eip_address("MyUDT[1].Values[2]")
+        assert parsed.tag_name == "MyUDT[1].Values"
+        assert parsed.element == 2
+        assert parsed.bit is None
+
     # --- Bit access ---
 
     def test_parse_bit_access(self) -> None:
@@ -152,8 +162,28 @@ class TestEIPAddressParsing:
         parsed = parse_eip_address("MyMixedCaseTag")
         assert parsed.tag_name == "MyMixedCaseTag"
 
+    # --- Caching ---
+
+    def test_parse_is_memoized(self) -> None:
+        """Repeated parses return the same cached, immutable instance."""
+        parse_eip_address.cache_clear()
+        first = parse_eip_address("Cached[1]{2}")
+        second = parse_eip_address("Cached[1]{2}")
+        assert first is second
+        assert parse_eip_address.cache_info().hits == 1
+        with pytest.raises(AttributeError):
+            first.bit = 3  # type: ignore[misc]
+
     # --- Invalid addresses ---
 
+    def test_chunk_tags_respects_mtu(self) -> None:
+        """Tags are packed greedily until the estimated packet size is reached."""
+        tags = ["Tag1", "Tag2", "Tag3", "Tag4"]
+        assert _chunk_tags(tags, 0, 0) == [tags]
+        # 24 byte header + 20 bytes per 4-char tag: two tags fit in 70 bytes
+        assert _chunk_tags(tags, 70, 0) == [["Tag1", "Tag2"], ["Tag3", "Tag4"]]
+        assert _chunk_tags(tags, 0, 3) == [["Tag1", "Tag2", "Tag3"], ["Tag4"]]
+
     def test_invalid_address_empty_raises(self) -> None:
         """Empty address should raise ValueError."""
         with pytest.raises(ValueError, match=r"[Ee]mpty|[Ii]nvalid"):
@@ -306,6 +336,184 @@ class TestEIPConnectorMocked:
             assert abs(result["Tag1"].value - 10.0) < 0.0001
             assert abs(result["Tag2"].value - 20.0) < 0.0001
 
+    async def test_concurrent_reads_are_coalesced(self, eip_config: EIPConnectorConfig) -> None:
+        """Reads issued in the same loop iteration share one pycomm3 request."""
+        with (
+            patch("mtp_gateway.adapters.southbound.eip.driver.LogixDriver") as mock_logix,
+            patch("mtp_gateway.adapters.southbound.eip.driver.HAS_PYCOMM3", True),
+        ):
+            mock_driver = MagicMock()
+            mock_driver.open.return_value = None
+
+            def read(*tags: str) -> list[MagicMock]:
+                return [MagicMock(value=float(len(tag)), error=None) for tag in tags]
+
+            mock_driver.read.side_effect = read
+            mock_logix.return_value = mock_driver
+
+            connector = EIPConnector(eip_config)
+            await connector.connect()
+
+            first, second = await asyncio.gather(
+                connector.read_tags(["A", "BB"]),
+                connector.read_tags(["BB", "CCC"]),
+            )
+
+            mock_driver.read.assert_called_once_with("A", "BB", "CCC")
+            assert set(first) == {"A", "BB"}
+            assert set(second) == {"BB", "CCC"}
+            assert second["CCC"].value == 3.0
+
+    async def test_coalesced_read_failure_reaches_all_callers(
+        self, eip_config: EIPConnectorConfig
+    ) -> None:
+        """A failed batched read marks every caller's tags bad."""
+        with (
+            patch("mtp_gateway.adapters.southbound.eip.driver.LogixDriver") as mock_logix,
+            patch("mtp_gateway.adapters.southbound.eip.driver.HAS_PYCOMM3", True),
+        ):
+            mock_driver = MagicMock()
+            mock_driver.open.return_value = None
+            mock_driver.read.side_effect = Exception("Connection lost")
+            mock_logix.return_value = mock_driver
+
+            connector = EIPConnector(eip_config.model_copy(update={"coalesce_window_ms": 1.0}))
+            await connector.connect()
+
+            first, second = await asyncio.gather(
+                connector.read_tags(["A"]),
+                connector.read_tags(["B"]),
+            )
+
+            assert mock_driver.read.call_count == 1
+            assert first["A"].quality == Quality.BAD_NO_COMMUNICATION
+            assert second["B"].quality == Quality.BAD_NO_COMMUNICATION
+
+    async def test_read_plan_is_reused_until_reconnect(
+        self, eip_config: EIPConnectorConfig
+    ) -> None:
+        """Repeated polls of the same address list reuse the parsed plan."""
+        with (
+            patch("mtp_gateway.adapters.southbound.eip.driver.LogixDriver") as mock_logix,
+            patch("mtp_gateway.adapters.southbound.eip.driver.HAS_PYCOMM3", True),
+        ):
+            mock_driver = MagicMock()
+            mock_driver.read.return_value = [
+                MagicMock(value=1, error=None),
+                MagicMock(value=2, error=None),
+            ]
+            mock_logix.return_value = mock_driver
+
+            connector = EIPConnector(eip_config)
+            await connector.connect()
+
+            await connector.read_tags(["Tag1", "Arr[3]"])
+            plan = connector._read_plan(["Tag1", "Arr[3]"])
+            await connector.read_tags(["Tag1", "Arr[3]"])
+
+            assert connector._read_plan(["Tag1", "Arr[3]"]) is plan
+            assert plan[0] == ["Tag1", "Arr[3]"]
+
+            await connector.disconnect()
+            assert not connector._plan_cache
+
+    async def test_bits_of_one_tag_share_a_single_read(
+        self, eip_config: EIPConnectorConfig
+    ) -> None:
+        """Several bit addresses on the same INT read the tag once."""
+        with (
+            patch("mtp_gateway.adapters.southbound.eip.driver.LogixDriver") as mock_logix,
+            patch("mtp_gateway.adapters.southbound.eip.driver.HAS_PYCOMM3", True),
+        ):
+            mock_driver = MagicMock()
+            mock_driver.read.return_value = MagicMock(value=0b1001, error=None)
+            mock_logix.return_value = mock_driver
+
+            connector = EIPConnector(eip_config)
+            await connector.connect()
+
+            result = await connector.read_tags(["Status{0}", "Status{1}", "Status{3}"])
+
+            mock_driver.read.assert_called_once_with("Status")
+            assert result["Status{0}"].value is True
+            assert result["Status{1}"].value is False
+            assert result["Status{3}"].value is True
+
+    async def test_batch_read_is_split_into_packets(self, eip_config: EIPConnectorConfig) -> None:
+        """max_tags_per_packet splits one batch into ordered driver reads."""
+        with (
+            patch("mtp_gateway.adapters.southbound.eip.driver.LogixDriver") as mock_logix,
+            patch("mtp_gateway.adapters.southbound.eip.driver.HAS_PYCOMM3", True),
+        ):
+            mock_driver = MagicMock()
+
+            def read(*tags: str) -> list[MagicMock] | MagicMock:
+                results = [MagicMock(value=tag, error=None) for tag in tags]
+                return results if len(results) > 1 else results[0]
+
+            mock_driver.read.side_effect = read
+            mock_logix.return_value = mock_driver
+
+            config = eip_config.model_copy(update={"max_tags_per_packet": 2})
+            connector = EIPConnector(config)
+            await connector.connect()
+
+            result = await connector.read_tags(["A", "B", "C"])
+
+            assert [c.args for c in mock_driver.read.call_args_list] == [("A", "B"), ("C",)]
+            assert {addr: tv.value for addr, tv in result.items()} == {
+                "A": "A",
+                "B": "B",
+                "C": "C",
+            }
+
+    async def test_value_cache_serves_repeat_reads(self, eip_config: EIPConnectorConfig) -> None:
+        """Within the TTL repeat reads skip the PLC; a write invalidates the tag."""
+        with (
+            patch("mtp_gateway.adapters.southbound.eip.driver.LogixDriver") as mock_logix,
+            patch("mtp_gateway.adapters.southbound.eip.driver.HAS_PYCOMM3", True),
+        ):
+            mock_driver = MagicMock()
+            mock_driver.read.return_value = MagicMock(value=0b10, error=None)
+            mock_driver.write.return_value = MagicMock(error=None)
+            mock_logix.return_value = mock_driver
+
+            connector = EIPConnector(eip_config.model_copy(update={"cache_ttl_ms": 60_000}))
+            await connector.connect()
+
+            first = await connector.read_tags(["Status{1}"])
+            second = await connector.read_tags(["Status{0}", "Status{1}"])
+
+            assert mock_driver.read.call_count == 1
+            assert first["Status{1}"].value is True
+            assert second["Status{0}"].value is False
+
+            await connector.write_tag("Status", 0)
+            await connector.read_tags(["Status{1}"])
+            assert mock_driver.read.call_count == 2
+
+    async def test_invalid_address_is_reported_once(self, eip_config: EIPConnectorConfig) -> None:
+        """A malformed address is parsed once, then skipped as a config error."""
+        with (
+            patch("mtp_gateway.adapters.southbound.eip.driver.LogixDriver") as mock_logix,
+            patch("mtp_gateway.adapters.southbound.eip.driver.HAS_PYCOMM3", True),
+            patch("mtp_gateway.adapters.southbound.eip.driver.logger") as mock_logger,
+        ):
+            mock_driver = MagicMock()
+            mock_driver.read.return_value = MagicMock(value=1, error=None)
+            mock_logix.return_value = mock_driver
+
+            connector = EIPConnector(eip_config)
+            await connector.connect()
+
+            await connector.read_tags(["Good", "Bad[x"])
+            result = await connector.read_tags(["Bad[x", "Good"])
+
+            assert result["Good"].quality == Quality.GOOD
+            assert result["Bad[x"].quality == Quality.BAD_CONFIG_ERROR
+            parse_warnings = [c for c in mock_logger.warning.call_args_list if "parse" in c.args[0]]
+            assert len(parse_warnings) == 1
+
     async def test_read_failure_returns_bad_quality(self, eip_config: EIPConnectorConfig) -> None:
         """Read errors return bad quality."""
         with (
@@ -513,6 +721,34 @@ class TestEIPConnectorMocked:
 
             assert result is True
 
+    async def test_concurrent_writes_share_one_request(
+        self, eip_config: EIPConnectorConfig
+    ) -> None:
+        """Concurrent writes go out as one multi-tag write with per-write errors."""
+        with (
+            patch("mtp_gateway.adapters.southbound.eip.driver.LogixDriver") as mock_logix,
+            patch("mtp_gateway.adapters.southbound.eip.driver.HAS_PYCOMM3", True),
+        ):
+            mock_driver = MagicMock()
+            mock_driver.write.return_value = [
+                MagicMock(error=None),
+                MagicMock(error="Tag not found"),
+            ]
+            mock_logix.return_value = mock_driver
+
+            connector = EIPConnector(eip_config)
+            await connector.connect()
+
+            ok, failed = await asyncio.gather(
+                connector.write_tag("Setpoint", 42.0),
+                connector.write_tag("Missing", 1),
+            )
+            await connector.flush_writes()
+
+            mock_driver.write.assert_called_once_with(("Setpoint", 42.0), ("Missing", 1))
+            assert ok is True
+            assert failed is False
+
     async def test_disconnect_graceful(self, eip_config: EIPConnectorConfig) -> None:
         """Disconnect closes driver cleanly."""
         with (
@@ -531,6 +767,56 @@ class TestEIPConnectorMocked:
             health = connector.health_status()
             assert health.state == ConnectorState.STOPPED
 
+    async def test_driver_calls_share_one_worker_thread(
+        self, eip_config: EIPConnectorConfig
+    ) -> None:
+        """open/read/close all run on the connector's own thread, released on disconnect."""
+        with (
+            patch("mtp_gateway.adapters.southbound.eip.driver.LogixDriver") as mock_logix,
+            patch("mtp_gateway.adapters.southbound.eip.driver.HAS_PYCOMM3", True),
+        ):
+            threads: list[threading.Thread] = []
+
+            def record(*_: object) -> MagicMock:
+                threads.append(threading.current_thread())
+                return MagicMock(value=1, error=None)
+
+            mock_driver = MagicMock()
+            mock_driver.open.side_effect = record
+            mock_driver.read.side_effect = record
+            mock_driver.close.side_effect = record
+            mock_logix.return_value = mock_driver
+
+            connector = EIPConnector(eip_config)
+            await connector.connect()
+            await connector.read_tags(["Tag1"])
+            await connector.read_tags(["Tag2"])
+            await connector.disconnect()
+
+            assert len(threads) == 4
+            assert len(set(threads)) == 1
+            assert threads[0] is not threading.current_thread()
+            assert threads[0].name.startswith("eip-test_eip")
+            assert connector._executor is None
+
+    async def test_keepalive_pings_idle_connection(self, eip_config: EIPConnectorConfig) -> None:
+        """An idle connection gets a no-op request; disconnect stops the pings."""
+        with (
+            patch("mtp_gateway.adapters.southbound.eip.driver.LogixDriver") as mock_logix,
+            patch("mtp_gateway.adapters.southbound.eip.driver.HAS_PYCOMM3", True),
+        ):
+            mock_driver = MagicMock()
+            mock_logix.return_value = mock_driver
+
+            connector = EIPConnector(eip_config.model_copy(update={"keepalive_s": 0.01}))
+            await connector.connect()
+            await asyncio.sleep(0.05)
+
+            assert mock_driver.get_plc_time.called
+
+            await connector.disconnect()
+            assert connector._keepalive_task is None
+
     async def test_read_without_connect_fails(self, eip_config: EIPConnectorConfig) -> None:
         """Reading without connecting returns bad quality."""
         with (
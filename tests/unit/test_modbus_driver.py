@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 
 import pytest
+from pymodbus.exceptions import ModbusIOException
+from pymodbus.pdu import ExceptionResponse
 
+from mtp_gateway.adapters.southbound.modbus import driver as driver_module
 from mtp_gateway.adapters.southbound.modbus.driver import (
     ModbusRegisterType,
+    ModbusRTUConnector,
     ModbusTCPConnector,
     ParsedAddress,
     decode_registers,
+    decode_registers_batch,
     encode_value,
     parse_modbus_address,
+    plan_reads,
 )
-from mtp_gateway.config.schema import ModbusTCPConnectorConfig
+from mtp_gateway.config.schema import ModbusRTUConnectorConfig, ModbusTCPConnectorConfig
 from mtp_gateway.domain.model.tags import DataType, Quality, TagDefinition
 
 
@@ -101,6 +108,32 @@ def test_parse_modbus_address_bit_offset() -> None:
     assert parsed.bit_offset == 3
 
 
+def test_parse_modbus_address_prefixes_and_rejects() -> None:
+    assert parse_modbus_address(" hr100 ").register_type == ModbusRegisterType.HOLDING_REGISTER
+    assert parse_modbus_address("C5.2") == ParsedAddress(
+        register_type=ModbusRegisterType.COIL, address=5, bit_offset=2
+    )
+    assert parse_modbus_address("IR7").address == 7
+    assert parse_modbus_address("DI3").register_type == ModbusRegisterType.DISCRETE_INPUT
+
+    with pytest.raises(ValueError, match="format"):
+        parse_modbus_address("HR-5")
+    with pytest.raises(ValueError, match="format"):
+        parse_modbus_address("40001.x")
+    with pytest.raises(ValueError, match="range"):
+        parse_modbus_address("25000")
+
+
+def test_parse_modbus_address_is_memoized() -> None:
+    parse_modbus_address.cache_clear()
+
+    first = parse_modbus_address("40010")
+    second = parse_modbus_address("40010")
+
+    assert first is second
+    assert parse_modbus_address.cache_info().hits == 1
+
+
 def test_encode_decode_roundtrip_float32() -> None:
     value = 12.5
     registers = encode_value(value, "float32")
@@ -108,6 +141,60 @@ def test_encode_decode_roundtrip_float32() -> None:
     assert decoded == pytest.approx(value)
 
 
+@pytest.mark.parametrize(
+    ("registers", "byte_order", "word_order"),
+    [
+        ([0x4148, 0x0000], "big", "big"),
+        ([0x0000, 0x4148], "big", "little"),
+        ([0x4841, 0x0000], "little", "big"),
+        ([0x0000, 0x4841], "little", "little"),
+    ],
+)
+def test_codec_byte_and_word_order(registers: list[int], byte_order: str, word_order: str) -> None:
+    value = decode_registers(registers, "float32", byte_order=byte_order, word_order=word_order)
+    assert value == 12.5
+    assert encode_value(12.5, "float32", byte_order=byte_order, word_order=word_order) == registers
+
+
+@pytest.mark.parametrize("byte_order", ["big", "little"])
+@pytest.mark.parametrize("word_order", ["big", "little"])
+@pytest.mark.parametrize(
+    ("datatype", "values"),
+    [("int16", [-1, 2, 300]), ("uint32", [1, 70000, 0]), ("float64", [1.5, -2.25])],
+)
+def test_decode_registers_batch_matches_single_decode(
+    datatype: str, values: list[float], byte_order: str, word_order: str
+) -> None:
+    orders = {"byte_order": byte_order, "word_order": word_order}
+    registers = [reg for value in values for reg in encode_value(value, datatype, **orders)]
+
+    assert decode_registers_batch(registers, datatype, **orders) == values
+
+
+@pytest.mark.parametrize("register", [0, 1, 0x7FFF, 0x8000, 0xFFFE, 0xFFFF])
+def test_single_register_fast_path_matches_struct(register: int) -> None:
+    raw = register.to_bytes(2, "big")
+
+    assert decode_registers([register], "uint16") == register
+    assert decode_registers([register], "int16") == int.from_bytes(raw, "big", signed=True)
+    assert decode_registers([register], "int16", byte_order="little") == int.from_bytes(
+        raw, "little", signed=True
+    )
+    assert decode_registers([register], "bool", byte_order="little") is bool(register & 1)
+
+
+def test_decode_registers_batch_rejects_ragged_buffer() -> None:
+    with pytest.raises(ValueError, match="multiple"):
+        decode_registers_batch([0, 1, 2], "float32")
+
+
+def test_encode_value_bool_and_unsupported() -> None:
+    assert encode_value(True, "bool") == [1]
+    assert encode_value(-2, "int16", byte_order="little") == [0xFEFF]
+    with pytest.raises(ValueError, match="Unsupported"):
+        encode_value(1, "string")
+
+
 @pytest.mark.asyncio
 async def test_read_tag_values_not_connected() -> None:
     config = ModbusTCPConnectorConfig(name="modbus", host="127.0.0.1")
@@ -146,6 +233,18 @@ async def test_read_single_bit_offset() -> None:
     assert value is True
 
 
+@pytest.mark.asyncio
+async def test_rtu_read_single_shares_dispatch() -> None:
+    connector = ModbusRTUConnector(ModbusRTUConnectorConfig(name="rtu", port="/dev/null"))
+    client = DummyClient()
+    connector._client = client
+
+    value = await connector._read_single(parse_modbus_address("10005"), datatype="bool")
+
+    assert value is False
+    assert client.last_read == ("discrete", 4, 1)
+
+
 @pytest.mark.asyncio
 async def test_write_tag_value_coil() -> None:
     connector = make_tcp_connector()
@@ -174,3 +273,367 @@ async def test_write_tag_value_register_float32() -> None:
 
     success = await connector.write_tag_value(tag, 3.14)
     assert success is True
+
+
+class RangeClient:
+    """Holding-register table where register N holds value N; records each request."""
+
+    def __init__(self, implemented: range = range(1000)) -> None:
+        self.requests: list[tuple[str, int, int]] = []
+        self.implemented = implemented
+
+    async def read_holding_registers(
+        self, address: int, count: int = 1, **_kwargs: object
+    ) -> DummyResponse | ExceptionResponse:
+        self.requests.append(("holding", address, count))
+        if any(a not in self.implemented for a in range(address, address + count)):
+            return ExceptionResponse(0x03, 0x02)
+        return DummyResponse(registers=list(range(address, address + count)))
+
+    async def read_coils(self, address: int, count: int = 1, **_kwargs: object) -> DummyResponse:
+        self.requests.append(("coil", address, count))
+        return DummyResponse(bits=[i % 2 == 1 for i in range(address, address + count)])
+
+
+def make_tag(name: str, address: str, datatype: DataType = DataType.UINT16) -> TagDefinition:
+    return TagDefinition(name=name, connector="modbus", address=address, datatype=datatype)
+
+
+def test_plan_reads_merges_adjacent_and_near_addresses() -> None:
+    tags = [
+        make_tag("c", "40011"),
+        make_tag("a", "40001", DataType.FLOAT32),
+        make_tag("b", "40003"),
+        make_tag("far", "40100"),
+        make_tag("coil", "5"),
+    ]
+
+    runs, errors = plan_reads(tags, max_gap=8)
+
+    assert errors == {}
+    holding = [r for r in runs if r.register_type == ModbusRegisterType.HOLDING_REGISTER]
+    assert [(r.start, r.count) for r in holding] == [(0, 11), (99, 1)]
+    assert [(t.name, offset, width) for t, _, offset, width in holding[0].members] == [
+        ("a", 0, 2),
+        ("b", 2, 1),
+        ("c", 10, 1),
+    ]
+    assert [(r.register_type, r.start) for r in runs if r not in holding] == [
+        (ModbusRegisterType.COIL, 4)
+    ]
+
+
+def test_plan_reads_respects_protocol_limit_and_reports_bad_addresses() -> None:
+    tags = [make_tag(f"t{i}", str(40001 + i)) for i in range(130)]
+    tags.append(make_tag("bad", "HRx"))
+
+    runs, errors = plan_reads(tags)
+
+    assert [(r.start, r.count) for r in runs] == [(0, 125), (125, 5)]
+    assert set(errors) == {"bad"}
+
+
+@pytest.mark.asyncio
+async def test_read_tag_values_issues_one_request_per_run() -> None:
+    connector = make_tcp_connector()
+    client = RangeClient()
+    connector._client = client
+    tags = [
+        make_tag("a", "40001"),
+        make_tag("b", "40002"),
+        make_tag("bit", "40003.1"),
+        make_tag("coil", "2", DataType.BOOL),
+    ]
+
+    results = await connector.read_tag_values(tags)
+
+    assert sorted(client.requests) == [("coil", 1, 1), ("holding", 0, 3)]
+    assert results["a"].value == 0
+    assert results["b"].value == 1
+    assert results["bit"].value is True
+    assert results["coil"].value is True
+    assert all(tv.quality == Quality.GOOD for tv in results.values())
+
+
+@pytest.mark.asyncio
+async def test_read_tag_values_falls_back_when_merged_span_is_rejected() -> None:
+    connector = make_tcp_connector()
+    client = RangeClient(implemented=range(0, 1))
+    connector._client = client
+    tags = [make_tag("ok", "40001"), make_tag("missing", "40003")]
+
+    results = await connector.read_tag_values(tags)
+
+    assert client.requests == [("holding", 0, 3), ("holding", 0, 1), ("holding", 2, 1)]
+    assert results["ok"].quality == Quality.GOOD
+    assert results["missing"].quality == Quality.BAD_NO_COMMUNICATION
+
+
+@pytest.mark.asyncio
+async def test_homogeneous_run_decodes_as_one_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    batches: list[str] = []
+
+    def spy(registers: list[int], datatype: str, **kwargs: str) -> list[float | int | bool]:
+        batches.append(datatype)
+        return decode_registers_batch(registers, datatype, **kwargs)
+
+    monkeypatch.setattr(driver_module, "decode_registers_batch", spy)
+    connector = make_tcp_connector()
+    connector._client = RangeClient()
+    floats = [make_tag(f"f{i}", str(40001 + 2 * i), DataType.FLOAT32) for i in range(3)]
+
+    results = await connector.read_tag_values([*floats, make_tag("gap", "40009")])
+
+    assert batches == []
+    for i, tag in enumerate(floats):
+        assert results[tag.name].value == decode_registers([2 * i, 2 * i + 1], "float32")
+
+    results = await connector.read_tag_values(floats)
+
+    assert batches == ["float32"]
+    assert results["f2"].value == decode_registers([4, 5], "float32")
+    assert all(tv.quality == Quality.GOOD for tv in results.values())
+
+
+@pytest.mark.asyncio
+async def test_io_error_fails_merged_run_without_splitting() -> None:
+    class TimeoutClient(RangeClient):
+        async def read_holding_registers(
+            self, address: int, count: int = 1, **_kwargs: object
+        ) -> DummyResponse | ExceptionResponse:
+            self.requests.append(("holding", address, count))
+            raise ModbusIOException("No response received")
+
+    connector = make_tcp_connector()
+    client = TimeoutClient()
+    connector._client = client
+    tags = [make_tag("a", "40001"), make_tag("b", "40003")]
+
+    results = await connector.read_tag_values(tags)
+
+    assert client.requests == [("holding", 0, 3)]
+    assert {tv.quality for tv in results.values()} == {Quality.BAD_NO_COMMUNICATION}
+
+
+@pytest.mark.asyncio
+async def test_fallback_keeps_bits_of_one_register_in_one_read() -> None:
+    connector = make_tcp_connector()
+    client = RangeClient(implemented=range(5, 6))
+    connector._client = client
+    tags = [make_tag(f"b{bit}", f"40006.{bit}") for bit in range(16)]
+    tags.append(make_tag("missing", "40008"))
+
+    results = await connector.read_tag_values(tags)
+
+    assert client.requests == [("holding", 5, 3), ("holding", 5, 1), ("holding", 7, 1)]
+    assert [results[f"b{bit}"].value for bit in range(4)] == [True, False, True, False]
+    assert results["missing"].quality == Quality.BAD_NO_COMMUNICATION
+
+
+def test_parse_modbus_address_rejects_bit_past_register() -> None:
+    with pytest.raises(ValueError, match="bit offset"):
+        parse_modbus_address("40001.16")
+
+
+@pytest.mark.asyncio
+async def test_read_tags_goes_through_planner_with_per_address_quality() -> None:
+    connector = ModbusRTUConnector(ModbusRTUConnectorConfig(name="rtu", port="/dev/null"))
+    client = RangeClient(implemented=range(0, 2))
+    connector._client = client
+
+    results = await connector.read_tags(["40001", "40002", "40101", "HRx"])
+
+    assert client.requests == [("holding", 0, 2), ("holding", 100, 1)]
+    assert results["40002"].value == 1
+    assert results["40101"].quality == Quality.BAD_NO_COMMUNICATION
+    assert results["HRx"].quality == Quality.BAD_CONFIG_ERROR
+    assert await connector._do_read(["40001", "40101"]) == {"40001": 0}
+
+
+def test_connectors_have_no_instance_dict() -> None:
+    tcp = make_tcp_connector()
+    rtu = ModbusRTUConnector(ModbusRTUConnectorConfig(name="rtu", port="/dev/null"))
+
+    assert not hasattr(tcp, "__dict__")
+    assert not hasattr(rtu, "__dict__")
+
+
+class ReadWriteClient(RangeClient):
+    """RangeClient whose reads take one loop tick, as a network round trip would."""
+
+    async def read_holding_registers(
+        self, address: int, count: int = 1, **kwargs: object
+    ) -> DummyResponse | ExceptionResponse:
+        await asyncio.sleep(0)
+        return await super().read_holding_registers(address, count, **kwargs)
+
+    async def readwrite_registers(
+        self, *, read_address: int, write_address: int, **_kwargs: object
+    ) -> DummyResponse | ExceptionResponse:
+        self.requests.append(("readwrite", read_address, write_address))
+        return DummyResponse(registers=[7])
+
+    async def write_register(self, address: int, value: int, **_kwargs: object) -> DummyResponse:
+        self.requests.append(("write", address, value))
+        return DummyResponse()
+
+
+class GatedClient(ReadWriteClient):
+    """ReadWriteClient whose register reads wait until ``released`` is set."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.released = asyncio.Event()
+
+    async def read_holding_registers(
+        self, address: int, count: int = 1, **kwargs: object
+    ) -> DummyResponse | ExceptionResponse:
+        await self.released.wait()
+        return await super().read_holding_registers(address, count, **kwargs)
+
+
+def make_fc23_connector() -> tuple[ModbusTCPConnector, ReadWriteClient]:
+    config = ModbusTCPConnectorConfig(name="modbus", host="127.0.0.1", support_fc23=True)
+    connector = ModbusTCPConnector(config)
+    client = ReadWriteClient()
+    connector._client = client
+    return connector, client
+
+
+# Two holding runs: the write is queued while the first is on the wire
+FC23_POLL = [make_tag("level", "40001"), make_tag("sp", "40101")]
+
+
+@pytest.mark.asyncio
+async def test_fc23_carries_write_on_next_run_of_poll() -> None:
+    connector, client = make_fc23_connector()
+
+    read, written = await asyncio.gather(
+        connector.read_tag_values(FC23_POLL), connector.write_tag_value(FC23_POLL[1], 7)
+    )
+
+    assert written is True
+    assert read["sp"].value == 7
+    assert client.requests == [("holding", 0, 1), ("readwrite", 100, 100)]
+    assert connector._pending_writes == []
+
+
+@pytest.mark.asyncio
+async def test_fc23_write_without_poll_is_sent_alone() -> None:
+    connector, client = make_fc23_connector()
+
+    assert await connector.write_tag_value(FC23_POLL[1], 7) is True
+    assert client.requests == [("write", 100, 7)]
+
+
+@pytest.mark.asyncio
+async def test_fc23_write_is_sent_alone_when_poll_ends() -> None:
+    connector, client = make_fc23_connector()
+
+    _, written = await asyncio.gather(
+        connector.read_tag_values(FC23_POLL[:1]), connector.write_tag_value(FC23_POLL[1], 7)
+    )
+
+    assert written is True
+    assert client.requests == [("holding", 0, 1), ("write", 100, 7)]
+    assert connector._pending_writes == []
+
+
+@pytest.mark.asyncio
+async def test_fc23_write_is_sent_alone_after_hold(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(driver_module, "_FC23_HOLD_S", 0.01)
+    connector, _ = make_fc23_connector()
+    client = GatedClient()
+    connector._client = client
+
+    poll = asyncio.create_task(connector.read_tag_values(FC23_POLL))
+    await asyncio.sleep(0)
+    assert await connector.write_tag_value(FC23_POLL[1], 7) is True
+    client.released.set()
+    await poll
+
+    assert client.requests == [("write", 100, 7), ("holding", 0, 1), ("holding", 100, 1)]
+    assert connector._pending_writes == []
+
+
+@pytest.mark.asyncio
+async def test_fc23_cancelled_write_is_withdrawn() -> None:
+    connector, _ = make_fc23_connector()
+    client = GatedClient()
+    connector._client = client
+
+    poll = asyncio.create_task(connector.read_tag_values(FC23_POLL))
+    write = asyncio.create_task(connector.write_tag_value(FC23_POLL[1], 7))
+    await asyncio.sleep(0)
+    assert connector._pending_writes
+    write.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await write
+    client.released.set()
+    await poll
+
+    assert client.requests == [("holding", 0, 1), ("holding", 100, 1)]
+    assert connector._pending_writes == []
+
+
+@pytest.mark.asyncio
+async def test_fc23_skips_writes_whose_writer_gave_up() -> None:
+    connector, client = make_fc23_connector()
+    abandoned: asyncio.Future[object] = asyncio.get_running_loop().create_future()
+    abandoned.cancel()
+    connector._pending_writes.append((10, [7], abandoned))
+
+    await connector.read_tag_values([make_tag("sp", "40011")])
+
+    assert client.requests == [("holding", 10, 1)]
+    assert connector._pending_writes == []
+
+
+@pytest.mark.asyncio
+async def test_fc23_write_survives_cancelled_poll() -> None:
+    class HangingClient(ReadWriteClient):
+        started = asyncio.Event()
+
+        async def readwrite_registers(
+            self, *, read_address: int, write_address: int, **_kwargs: object
+        ) -> DummyResponse:
+            self.requests.append(("readwrite", read_address, write_address))
+            self.started.set()
+            await asyncio.Event().wait()
+            raise AssertionError
+
+    connector, _ = make_fc23_connector()
+    client = HangingClient()
+    connector._client = client
+
+    poll = asyncio.create_task(connector.read_tag_values(FC23_POLL))
+    write = asyncio.create_task(connector.write_tag_value(FC23_POLL[1], 7))
+    await asyncio.wait_for(client.started.wait(), timeout=1)
+    poll.cancel()
+
+    assert await asyncio.wait_for(write, timeout=1) is True
+    assert client.requests[-1] == ("write", 100, 7)
+
+
+@pytest.mark.asyncio
+async def test_fc23_rejection_falls_back_to_plain_write_and_read() -> None:
+    class RejectingClient(ReadWriteClient):
+        async def readwrite_registers(
+            self, *, read_address: int, write_address: int, **_kwargs: object
+        ) -> ExceptionResponse:
+            self.requests.append(("readwrite", read_address, write_address))
+            return ExceptionResponse(0x17, 0x02)
+
+    connector, _ = make_fc23_connector()
+    client = RejectingClient()
+    connector._client = client
+
+    read, written = await asyncio.gather(
+        connector.read_tag_values(FC23_POLL), connector.write_tag_value(FC23_POLL[1], 7)
+    )
+
+    assert written is True
+    assert ("write", 100, 7) in client.requests
+    assert client.requests[:3] == [("holding", 0, 1), ("readwrite", 100, 100), ("holding", 100, 1)]
+    assert read["sp"].quality == Quality.GOOD
+    assert read["sp"].value == 100
@@ -14,15 +14,21 @@ OPC UA NodeId Formats:
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from asyncua import ua
 
 # Import will fail initially - that's expected for TDD
 from mtp_gateway.adapters.southbound.base import ConnectorState
+from mtp_gateway.adapters.southbound.opcua_client import driver as driver_module
 from mtp_gateway.adapters.southbound.opcua_client.driver import (
+    _QUALITY_BY_CODE,
     OPCUAClientConnector,
+    _status_code_to_quality,
     parse_node_id,
 )
 from mtp_gateway.config.schema import OPCUAClientConnectorConfig, SecurityPolicy
@@ -148,6 +154,16 @@ class TestNodeIdParsing:
         with pytest.raises(ValueError, match=r"[Ii]nvalid"):
             parse_node_id("random_string")
 
+    def test_parse_is_memoized(self) -> None:
+        """Repeated addresses should be served from the parse cache."""
+        parse_node_id.cache_clear()
+
+        first = parse_node_id("ns=3;s=Pump.Speed")
+        second = parse_node_id("ns=3;s=Pump.Speed")
+
+        assert first is second
+        assert parse_node_id.cache_info().hits == 1
+
 
 # =============================================================================
 # OPC UA CLIENT CONNECTOR TESTS (MOCKED)
@@ -291,8 +307,7 @@ class TestOPCUAClientConnectorMocked:
             # Bad status code
             mock_data_value = MagicMock()
             mock_data_value.Value.Value = None
-            mock_data_value.StatusCode.is_good.return_value = False
-            mock_data_value.StatusCode.name = "BadNodeIdUnknown"
+            mock_data_value.StatusCode = ua.StatusCode(ua.StatusCodes.BadNodeIdUnknown)
             mock_client.read_values = AsyncMock(return_value=[mock_data_value])
 
             mock_client_class.return_value = mock_client
@@ -423,6 +438,116 @@ class TestOPCUAClientConnectorMocked:
             assert "ns=2;s=MyStringNode" in result
             assert result["ns=2;s=MyStringNode"].value == "Hello"
 
+    async def test_nodes_are_reused_until_reconnect(
+        self, opcua_config: OPCUAClientConnectorConfig
+    ) -> None:
+        """Node wrappers are created once per address and session."""
+        with patch(
+            "mtp_gateway.adapters.southbound.opcua_client.driver.Client"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.connect = AsyncMock()
+            mock_client.disconnect = AsyncMock()
+            mock_client.get_node = MagicMock(return_value=MagicMock())
+
+            mock_data_value = MagicMock()
+            mock_data_value.Value.Value = 1
+            mock_data_value.StatusCode.is_good.return_value = True
+            mock_client.read_values = AsyncMock(return_value=[mock_data_value])
+
+            mock_client_class.return_value = mock_client
+
+            connector = OPCUAClientConnector(opcua_config)
+            await connector.connect()
+            await connector.read_tags(["ns=2;i=1001"])
+            await connector.read_tags(["ns=2;i=1001"])
+
+            assert mock_client.get_node.call_count == 1
+
+            await connector.disconnect()
+            await connector.connect()
+            await connector.read_tags(["ns=2;i=1001"])
+
+            assert mock_client.get_node.call_count == 2
+
+    async def test_sharing_connectors_use_one_session(self) -> None:
+        """Connectors with share_session reuse one Client and merge concurrent reads."""
+        configs = [
+            OPCUAClientConnectorConfig(
+                name=f"opcua_{i}", endpoint="opc.tcp://localhost:4840", share_session=True
+            )
+            for i in range(2)
+        ]
+        with patch(
+            "mtp_gateway.adapters.southbound.opcua_client.driver.Client"
+        ) as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.connect = AsyncMock()
+            mock_client.disconnect = AsyncMock()
+            mock_client.get_node = MagicMock(side_effect=lambda node_id: node_id)
+
+            def read_values(nodes: list[Any]) -> list[MagicMock]:
+                values = []
+                for node in nodes:
+                    dv = MagicMock()
+                    dv.Value.Value = node.Identifier
+                    dv.StatusCode.value = 0
+                    values.append(dv)
+                return values
+
+            mock_client.read_values = AsyncMock(side_effect=read_values)
+            mock_client_class.return_value = mock_client
+
+            first, second = (OPCUAClientConnector(config) for config in configs)
+            await asyncio.gather(first.connect(), second.connect())
+            a, b = await asyncio.gather(
+                first.read_tags(["ns=2;i=1", "ns=2;i=2"]), second.read_tags(["ns=2;i=3"])
+            )
+
+            assert mock_client_class.call_count == 1
+            assert mock_client.connect.await_count == 1
+            assert mock_client.read_values.await_count == 1
+            assert [tv.value for tv in a.values()] == [1, 2]
+            assert b["ns=2;i=3"].value == 3
+
+            await first.disconnect()
+            mock_client.disconnect.assert_not_awaited()
+            await second.disconnect()
+            mock_client.disconnect.assert_awaited_once()
+
+    async def test_cancelled_join_closes_orphaned_session(self) -> None:
+        """A session whose only waiter gave up is closed once its open succeeds."""
+        config = OPCUAClientConnectorConfig(
+            name="opcua_0",
+            endpoint="opc.tcp://localhost:4840",
+            username="operator",
+            password="s3cret",
+            share_session=True,
+        )
+        with patch(
+            "mtp_gateway.adapters.southbound.opcua_client.driver.Client"
+        ) as mock_client_class:
+            opened = asyncio.Event()
+            mock_client = MagicMock()
+            mock_client.connect = AsyncMock(side_effect=opened.wait)
+            mock_client.disconnect = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            connect = asyncio.create_task(OPCUAClientConnector(config).connect())
+            await asyncio.sleep(0)
+            assert all("s3cret" not in map(str, key) for key in driver_module._SESSIONS)
+
+            connect.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await connect
+            assert not driver_module._SESSIONS
+            mock_client.disconnect.assert_not_awaited()
+
+            opened.set()
+            for _ in range(5):
+                await asyncio.sleep(0)
+            mock_client.disconnect.assert_awaited_once()
+
 
 # =============================================================================
 # SECURITY CONFIGURATION TESTS
@@ -584,9 +709,7 @@ class TestStatusCodeMapping:
 
             mock_dv = MagicMock()
             mock_dv.Value.Value = None
-            mock_dv.StatusCode.is_good.return_value = False
-            mock_dv.StatusCode.is_bad.return_value = True
-            mock_dv.StatusCode.name = "BadNodeIdUnknown"
+            mock_dv.StatusCode = ua.StatusCode(ua.StatusCodes.BadNodeIdUnknown)
             mock_client.read_values = AsyncMock(return_value=[mock_dv])
 
             mock_client_class.return_value = mock_client
@@ -614,9 +737,7 @@ class TestStatusCodeMapping:
 
             mock_dv = MagicMock()
             mock_dv.Value.Value = None
-            mock_dv.StatusCode.is_good.return_value = False
-            mock_dv.StatusCode.is_bad.return_value = True
-            mock_dv.StatusCode.name = "BadNotConnected"
+            mock_dv.StatusCode = ua.StatusCode(ua.StatusCodes.BadNotConnected)
             mock_client.read_values = AsyncMock(return_value=[mock_dv])
 
             mock_client_class.return_value = mock_client
@@ -627,3 +748,23 @@ class TestStatusCodeMapping:
             result = await connector.read_tags(["ns=2;i=1001"])
 
             assert result["ns=2;i=1001"].quality == Quality.BAD_NO_COMMUNICATION
+
+    def test_status_codes_are_classified_once(self) -> None:
+        """Real StatusCodes map by value, and non-Good codes are memoized."""
+        good = ua.StatusCode(ua.StatusCodes.Good)
+        unknown = ua.StatusCode(ua.StatusCodes.BadNodeIdUnknown)
+        uncertain = ua.StatusCode(ua.StatusCodes.UncertainLastUsableValue)
+
+        assert _status_code_to_quality(good) == Quality.GOOD
+        assert _status_code_to_quality(unknown) == Quality.BAD_CONFIG_ERROR
+        assert _status_code_to_quality(uncertain) == Quality.UNCERTAIN
+        assert _QUALITY_BY_CODE[ua.StatusCodes.BadNodeIdUnknown] == Quality.BAD_CONFIG_ERROR
+        assert ua.StatusCodes.Good not in _QUALITY_BY_CODE
+
+    def test_bad_codes_map_by_code_ignoring_info_bits(self) -> None:
+        """Specific bad codes are looked up numerically, without their info bits."""
+        closed = ua.StatusCode(ua.StatusCodes.BadSessionClosed | 0x0400)
+        other = ua.StatusCode(ua.StatusCodes.BadTypeMismatch)
+
+        assert _status_code_to_quality(closed) == Quality.BAD_NO_COMMUNICATION
+        assert _status_code_to_quality(other) == Quality.BAD
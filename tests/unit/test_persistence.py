@@ -6,11 +6,18 @@ Covers service state persistence, tag history, and command audit logging.
 
 from __future__ import annotations
 
+import sqlite3
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
 import pytest
 
+from mtp_gateway.adapters.persistence import repository as repo_module
+from mtp_gateway.adapters.persistence.migrations import SCHEMA_VERSION, SchemaVersionError
 from mtp_gateway.adapters.persistence.models import (
+    VALUE_KIND_INT,
+    VALUE_KIND_JSON,
+    VALUE_KIND_REAL,
     CommandAuditLog,
     ServiceStateSnapshot,
     TagValueRecord,
@@ -19,6 +26,32 @@ from mtp_gateway.adapters.persistence.repository import PersistenceRepository
 from mtp_gateway.domain.model.tags import Quality
 from mtp_gateway.domain.state_machine.packml import PackMLState
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Schema written by gateways before the database carried a version number
+_LEGACY_SCHEMA = """
+CREATE TABLE service_states (
+    id INTEGER NOT NULL, service_name VARCHAR(255) NOT NULL, state VARCHAR(50) NOT NULL,
+    procedure_id INTEGER, parameters TEXT, started_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL, PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX ix_service_states_service_name ON service_states (service_name);
+CREATE TABLE tag_values (
+    id INTEGER NOT NULL, tag_name VARCHAR(255) NOT NULL, value TEXT NOT NULL,
+    quality VARCHAR(50) NOT NULL, timestamp DATETIME NOT NULL, source_timestamp DATETIME,
+    PRIMARY KEY (id)
+);
+CREATE INDEX ix_tag_values_tag_name ON tag_values (tag_name);
+CREATE INDEX ix_tag_values_timestamp ON tag_values (timestamp);
+CREATE TABLE command_audit (
+    id INTEGER NOT NULL, timestamp DATETIME NOT NULL, command_type VARCHAR(50) NOT NULL,
+    target VARCHAR(255) NOT NULL, parameters TEXT, result VARCHAR(50) NOT NULL,
+    error_message TEXT, PRIMARY KEY (id)
+);
+CREATE INDEX ix_command_audit_timestamp ON command_audit (timestamp);
+"""
+
 
 @pytest.fixture
 async def repository() -> PersistenceRepository:
@@ -115,6 +148,105 @@ class TestServiceStatePersistence:
         assert snapshot.procedure_id == 2
         assert snapshot.parameters == {"flow": 10.0}
 
+    @pytest.mark.asyncio
+    async def test_save_unchanged_service_state_refreshes_updated_at(
+        self, repository: PersistenceRepository
+    ) -> None:
+        """Re-saving an identical snapshot only moves updated_at."""
+        await repository.save_service_state(
+            service_name="Reactor1",
+            state=PackMLState.IDLE,
+            procedure_id=None,
+            parameters={"flow": 1.0},
+        )
+        first = await repository.get_service_state("Reactor1")
+
+        await repository.save_service_state(
+            service_name="Reactor1",
+            state=PackMLState.IDLE,
+            procedure_id=None,
+            parameters={"flow": 1.0},
+        )
+        second = await repository.get_service_state("Reactor1")
+
+        assert first is not None
+        assert second is not None
+        assert second.updated_at > first.updated_at
+        assert second.started_at == first.started_at
+        assert second.parameters == {"flow": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_save_service_state_rewrites_row_changed_elsewhere(self, tmp_path: Path) -> None:
+        """A row changed by another writer is not mistaken for the cached one."""
+        db_path = str(tmp_path / "shared.db")
+        repo = PersistenceRepository(db_path=db_path)
+        other = PersistenceRepository(db_path=db_path)
+        try:
+            await repo.initialize()
+            await repo.save_service_state(
+                service_name="Reactor1",
+                state=PackMLState.IDLE,
+                procedure_id=None,
+                parameters={},
+            )
+            await other.save_service_state(
+                service_name="Reactor1",
+                state=PackMLState.STOPPED,
+                procedure_id=None,
+                parameters={},
+            )
+            await repo.save_service_state(
+                service_name="Reactor1",
+                state=PackMLState.IDLE,
+                procedure_id=None,
+                parameters={},
+            )
+            snapshot = await repo.get_service_state("Reactor1")
+        finally:
+            await other.close()
+            await repo.close()
+
+        assert snapshot is not None
+        assert snapshot.state == PackMLState.IDLE.name
+
+    @pytest.mark.asyncio
+    async def test_save_service_state_after_delete_rewrites(
+        self, repository: PersistenceRepository
+    ) -> None:
+        """Deleting a snapshot clears the unchanged-write shortcut."""
+        await repository.save_service_state(
+            service_name="Reactor1",
+            state=PackMLState.IDLE,
+            procedure_id=None,
+            parameters={},
+        )
+        await repository.delete_service_state("Reactor1")
+        await repository.save_service_state(
+            service_name="Reactor1",
+            state=PackMLState.IDLE,
+            procedure_id=None,
+            parameters={},
+        )
+
+        assert await repository.get_service_state("Reactor1") is not None
+
+    @pytest.mark.asyncio
+    async def test_save_service_state_accepts_state_name(
+        self, repository: PersistenceRepository
+    ) -> None:
+        """save_service_state() stores plain string states unchanged."""
+        await repository.save_service_state(
+            service_name="Reactor1",
+            state="HELD",
+            procedure_id=None,
+            parameters={},
+        )
+
+        snapshot = await repository.get_service_state("Reactor1")
+
+        assert snapshot is not None
+        assert snapshot.state == "HELD"
+
     @pytest.mark.asyncio
     async def test_delete_service_state(self, repository: PersistenceRepository) -> None:
         """delete_service_state() removes the service state record."""
@@ -263,6 +395,27 @@ class TestTagValueHistory:
         assert 22.0 in values
         assert 23.0 in values
 
+    @pytest.mark.asyncio
+    async def test_timestamps_round_trip_as_utc(self, repository: PersistenceRepository) -> None:
+        """Timestamps keep microsecond precision and come back UTC-aware."""
+        timestamp = datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=UTC)
+        source_timestamp = timestamp - timedelta(milliseconds=5)
+
+        await repository.record_tag_value(
+            tag_name="Temp",
+            value=20.0,
+            quality=Quality.GOOD,
+            timestamp=timestamp,
+            source_timestamp=source_timestamp,
+        )
+
+        history = await repository.get_tag_history("Temp", timestamp, timestamp)
+
+        assert len(history) == 1
+        assert history[0].timestamp == timestamp
+        assert history[0].timestamp.tzinfo is UTC
+        assert history[0].source_timestamp == source_timestamp
+
     @pytest.mark.asyncio
     async def test_get_tag_history_empty_range(self, repository: PersistenceRepository) -> None:
         """get_tag_history() returns empty list for no matches."""
@@ -366,6 +519,29 @@ class TestCommandAuditLog:
         assert logs[0].result == "SUCCESS"
         assert logs[0].error_message is None
 
+    @pytest.mark.asyncio
+    async def test_get_audit_log_large_result_offloaded(
+        self, repository: PersistenceRepository, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """get_audit_log() decodes large result sets off the event loop."""
+        monkeypatch.setattr(repo_module, "_OFFLOAD_THRESHOLD", 2)
+        base_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+        for i in range(3):
+            await repository.log_command(
+                timestamp=base_time + timedelta(minutes=i),
+                command_type="START",
+                target="Reactor1",
+                parameters={"procedure_id": i},
+            )
+
+        logs = await repository.get_audit_log(
+            start=base_time,
+            end=base_time + timedelta(minutes=2),
+        )
+
+        assert [log.parameters for log in logs] == [{"procedure_id": i} for i in range(3)]
+
     @pytest.mark.asyncio
     async def test_log_command_with_error(self, repository: PersistenceRepository) -> None:
         """log_command() stores failed commands with error message."""
@@ -464,6 +640,149 @@ class TestCommandAuditLog:
         assert cmd_types == ["CMD1", "CMD2", "CMD3"]
 
 
+class TestTransactions:
+    """Tests for grouping writes with transaction()."""
+
+    @pytest.mark.asyncio
+    async def test_transaction_commits_all_writes(self, repository: PersistenceRepository) -> None:
+        """Writes sharing a transaction session are committed together."""
+        timestamp = datetime.now(UTC)
+
+        async with repository.transaction() as session:
+            await repository.save_service_state(
+                service_name="Reactor1",
+                state=PackMLState.EXECUTE,
+                procedure_id=1,
+                parameters={},
+                session=session,
+            )
+            await repository.log_command(
+                timestamp=timestamp,
+                command_type="START",
+                target="Reactor1",
+                session=session,
+            )
+
+        snapshot = await repository.get_service_state("Reactor1")
+        logs = await repository.get_audit_log(
+            start=timestamp - timedelta(seconds=1),
+            end=timestamp + timedelta(seconds=1),
+        )
+        assert snapshot is not None
+        assert snapshot.state == PackMLState.EXECUTE.name
+        assert [log.command_type for log in logs] == ["START"]
+
+    @pytest.mark.asyncio
+    async def test_transaction_rolls_back_on_error(self, repository: PersistenceRepository) -> None:
+        """No write in the transaction is kept if the block raises."""
+        with pytest.raises(RuntimeError):
+            async with repository.transaction() as session:
+                await repository.save_service_state(
+                    service_name="Reactor1",
+                    state=PackMLState.EXECUTE,
+                    procedure_id=1,
+                    parameters={},
+                    session=session,
+                )
+                raise RuntimeError("abort")
+
+        assert await repository.get_service_state("Reactor1") is None
+
+
+class TestSchemaMigration:
+    """Tests for upgrading databases written by older gateways."""
+
+    @pytest.mark.asyncio
+    async def test_legacy_tag_values_move_to_typed_columns(self, tmp_path: Path) -> None:
+        """JSON tag values are split into the typed columns on initialize()."""
+        db_path = tmp_path / "legacy.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(_LEGACY_SCHEMA)
+            conn.executemany(
+                "INSERT INTO tag_values (tag_name, value, quality, timestamp) "
+                "VALUES (?, ?, 'GOOD', '2024-01-02 03:04:05.000000')",
+                [("b", "true"), ("i", "42"), ("r", "1.5"), ("s", '"on"'), ("j", "[1,2]")],
+            )
+
+        repo = PersistenceRepository(db_path=str(db_path))
+        try:
+            await repo.initialize()
+            await repo.initialize()
+        finally:
+            await repo.close()
+
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute(
+                "SELECT tag_name, value_kind, value_bool, value_int, value_real, value_text "
+                "FROM tag_values ORDER BY id"
+            ).fetchall()
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        assert rows == [
+            ("b", 0, 1, None, None, None),
+            ("i", 1, None, 42, None, None),
+            ("r", 2, None, None, 1.5, None),
+            ("s", 3, None, None, None, "on"),
+            ("j", 4, None, None, None, "[1,2]"),
+        ]
+        assert version == SCHEMA_VERSION
+
+    @pytest.mark.asyncio
+    async def test_legacy_timestamps_become_microseconds(self, tmp_path: Path) -> None:
+        """Text DATETIME columns are converted so reads and range filters work."""
+        db_path = tmp_path / "legacy.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(_LEGACY_SCHEMA)
+            conn.execute(
+                "INSERT INTO service_states (service_name, state, parameters, started_at, "
+                "updated_at) VALUES ('Reactor1', 'EXECUTE', '{}', "
+                "'2024-01-02 03:04:05.000000', '2024-01-02 03:04:06.250000')"
+            )
+            conn.execute(
+                "INSERT INTO tag_values (tag_name, value, quality, timestamp, source_timestamp) "
+                "VALUES ('Level', '1.5', 'GOOD', '2024-01-02 03:04:05.123456', NULL)"
+            )
+            conn.execute(
+                "INSERT INTO command_audit (timestamp, command_type, target, result) "
+                "VALUES ('2024-01-02 03:04:05.000000', 'START', 'Reactor1', 'SUCCESS')"
+            )
+
+        repo = PersistenceRepository(db_path=str(db_path))
+        try:
+            await repo.initialize()
+            snapshot = await repo.get_service_state("Reactor1")
+            window = {
+                "start": datetime(2024, 1, 2, tzinfo=UTC),
+                "end": datetime(2024, 1, 3, tzinfo=UTC),
+            }
+            history = await repo.get_tag_history("Level", **window)
+            logs = await repo.get_audit_log(**window)
+        finally:
+            await repo.close()
+
+        assert snapshot is not None
+        assert snapshot.updated_at == datetime(2024, 1, 2, 3, 4, 6, 250000, tzinfo=UTC)
+        assert [record.timestamp for record in history] == [
+            datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=UTC)
+        ]
+        assert history[0].value == 1.5
+        assert history[0].source_timestamp is None
+        assert [log.timestamp for log in logs] == [datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)]
+
+    @pytest.mark.asyncio
+    async def test_newer_schema_is_refused(self, tmp_path: Path) -> None:
+        """A database from a newer gateway is not opened."""
+        db_path = tmp_path / "newer.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+
+        repo = PersistenceRepository(db_path=str(db_path))
+        try:
+            with pytest.raises(SchemaVersionError):
+                await repo.initialize()
+        finally:
+            await repo.close()
+
+
 class TestServiceStateSnapshotModel:
     """Tests for ServiceStateSnapshot model."""
 
@@ -480,7 +799,7 @@ class TestServiceStateSnapshotModel:
         assert snapshot.state == "EXECUTE"
         assert snapshot.procedure_id == 1
         # Parameters are serialized to JSON internally
-        assert snapshot.parameters == '{"key": "value"}'
+        assert snapshot.parameters == '{"key":"value"}'
 
     def test_parameters_default_empty(self) -> None:
         """parameters should default to None when not provided."""
@@ -530,6 +849,27 @@ class TestTagValueRecordModel:
         )
         assert record_bool.value is True
 
+    def test_values_stored_in_typed_columns(self) -> None:
+        """Scalar values use typed columns; other values fall back to JSON."""
+        timestamp = datetime.now(UTC)
+
+        record_int = TagValueRecord(tag_name="Int", value=7, quality="GOOD", timestamp=timestamp)
+        assert record_int.value_kind == VALUE_KIND_INT
+        assert record_int.value_int == 7
+        assert record_int.value_real is None
+
+        record_real = TagValueRecord(
+            tag_name="Real", value=1.5, quality="GOOD", timestamp=timestamp
+        )
+        assert record_real.value_kind == VALUE_KIND_REAL
+        assert record_real.value_real == 1.5
+
+        record_json = TagValueRecord(
+            tag_name="List", value=[1, 2], quality="GOOD", timestamp=timestamp
+        )
+        assert record_json.value_kind == VALUE_KIND_JSON
+        assert record_json.value == [1, 2]
+
 
 class TestCommandAuditLogModel:
     """Tests for CommandAuditLog model."""
@@ -550,6 +890,6 @@ class TestCommandAuditLogModel:
         assert log.command_type == "START"
         assert log.target == "Reactor1"
         # Parameters are serialized to JSON internally
-        assert log.parameters == '{"proc": 1}'
+        assert log.parameters == '{"proc":1}'
         assert log.result == "SUCCESS"
         assert log.error_message is None
@@ -6,6 +6,7 @@ service command execution in different modes.
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -155,6 +156,44 @@ class TestThickProxy:
         ]
         assert len(calls) >= 1
 
+    @pytest.mark.asyncio
+    async def test_parallel_hooks_write_concurrently(self, mock_tag_manager: MagicMock) -> None:
+        """With parallel_hooks, every hook write is in flight before any finishes."""
+        in_flight = 0
+        peak = 0
+
+        async def write_tag(_tag: str, _value: object) -> bool:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return True
+
+        mock_tag_manager.write_tag = AsyncMock(side_effect=write_tag)
+        config = ServiceConfig(
+            name="ParallelService",
+            mode=ProxyMode.THICK,
+            parallel_hooks=True,
+            state_hooks=StateHooksConfig(
+                on_starting=[
+                    WriteAction(tag="PLC.A", value=1),
+                    WriteAction(tag="PLC.B", value=2),
+                    WriteAction(tag="PLC.C", value=3),
+                ],
+            ),
+        )
+        proxy = ThickProxy(config=config, tag_manager=mock_tag_manager)
+
+        await proxy.send_command(PackMLCommand.START)
+
+        assert peak == 3
+        assert {call.args for call in mock_tag_manager.write_tag.call_args_list} >= {
+            ("PLC.A", 1),
+            ("PLC.B", 2),
+            ("PLC.C", 3),
+        }
+
     @pytest.mark.asyncio
     async def test_invalid_command_returns_error(
         self, mock_tag_manager: MagicMock, thick_service_config: ServiceConfig
@@ -280,6 +319,23 @@ class TestThinProxy:
         assert state == PackMLState.EXECUTE
         mock_tag_manager.get_value.assert_called_with("PLC.StateCur")
 
+    @pytest.mark.asyncio
+    async def test_get_state_follows_state_changes(
+        self, mock_tag_manager: MagicMock, thin_service_config: ServiceConfig
+    ) -> None:
+        """Repeated reads reuse the last state, and a new value or type is re-converted."""
+        proxy = ThinProxy(config=thin_service_config, tag_manager=mock_tag_manager)
+
+        mock_tag_manager.get_value.return_value = TagValue.good(PackMLState.EXECUTE.value)
+        assert await proxy.get_state() == PackMLState.EXECUTE
+        assert await proxy.get_state() == PackMLState.EXECUTE
+
+        mock_tag_manager.get_value.return_value = TagValue.good(PackMLState.HELD.value)
+        assert await proxy.get_state() == PackMLState.HELD
+
+        mock_tag_manager.get_value.return_value = TagValue.good(float(PackMLState.HELD.value))
+        assert await proxy.get_state() == PackMLState.UNDEFINED
+
     @pytest.mark.asyncio
     async def test_get_state_returns_undefined_on_missing_tag(
         self, mock_tag_manager: MagicMock
@@ -6,7 +6,9 @@ Follows TDD - these tests are written first, then implementation.
 
 from __future__ import annotations
 
+import ctypes
 import struct
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,9 +18,13 @@ from mtp_gateway.adapters.southbound.base import ConnectorState
 from mtp_gateway.adapters.southbound.s7.driver import (
     S7AreaType,
     S7Connector,
+    _decode_group,
     decode_s7_value,
     encode_s7_value,
     parse_s7_address,
+    plan_s7_reads,
+    s7_decoder,
+    s7_encoder,
 )
 from mtp_gateway.config.schema import S7ConnectorConfig
 from mtp_gateway.domain.model.tags import Quality
@@ -220,11 +226,27 @@ class TestS7AddressParsing:
         with pytest.raises(ValueError, match="Invalid S7 address"):
             parse_s7_address("DB100")  # Missing data type
 
+    @pytest.mark.parametrize("address", ["M0.8", "IX0", "DB1.DBW0X", "MW", "Q1.2.3"])
+    def test_near_miss_addresses_raise(self, address: str) -> None:
+        """Addresses that only partly fit a format are rejected as a whole."""
+        with pytest.raises(ValueError, match="Invalid S7 address"):
+            parse_s7_address(address)
+
     def test_invalid_bit_offset_raises(self) -> None:
         """Bit offset > 7 should raise ValueError."""
         with pytest.raises(ValueError, match="Bit offset"):
             parse_s7_address("DB100.DBX0.8")
 
+    def test_parse_is_memoized(self) -> None:
+        """Repeated addresses should be served from the parse cache."""
+        parse_s7_address.cache_clear()
+
+        first = parse_s7_address("DB7.DBW4")
+        second = parse_s7_address("DB7.DBW4")
+
+        assert first is second
+        assert parse_s7_address.cache_info().hits == 1
+
 
 # =============================================================================
 # S7 DATA ENCODING/DECODING TESTS
@@ -365,6 +387,57 @@ class TestS7DataConversion:
         assert len(result) == 1
         assert result[0] == 0b00100000
 
+    # --- Bound decoders ---
+
+    @pytest.mark.parametrize(
+        ("address", "raw"),
+        [
+            ("DB1.DBD0", struct.pack(">f", -2.5)),
+            ("MD4", struct.pack(">f", 7.25)),
+            ("ID0", struct.pack(">i", -70000)),
+            ("DB1.DBW2", struct.pack(">h", -3)),
+            ("QW0", struct.pack(">h", 512)),
+            ("DB1.DBB3", bytes([0xAB])),
+            ("DB1.DBX3.6", bytes([0b01000000])),
+            ("M0.1", bytes([0b00000001])),
+        ],
+    )
+    def test_bound_decoder_matches_decode_s7_value(self, address: str, raw: bytes) -> None:
+        """s7_decoder gives the same value as the generic decode path."""
+        parsed = parse_s7_address(address)
+        as_float = parsed.data_type in ("DBD", "MD") and parsed.bit_offset is None
+
+        expected = decode_s7_value(
+            raw, parsed.data_type, as_float=as_float, bit_offset=parsed.bit_offset
+        )
+
+        assert s7_decoder(parsed)(raw) == expected
+
+    @pytest.mark.parametrize(
+        ("address", "value"),
+        [
+            ("DB1.DBD0", -2.5),
+            ("DB1.DBD0", 70000),
+            ("MD4", 7.25),
+            ("ID0", -70000),
+            ("DB1.DBW2", -3),
+            ("QW0", 512),
+            ("DB1.DBB3", 0x1AB),
+            ("DB1.DBX3.6", True),
+            ("M0.1", 0),
+        ],
+    )
+    def test_bound_encoder_matches_encode_s7_value(self, address: str, value: float) -> None:
+        """s7_encoder gives the same bytes as the connector's generic encode path."""
+        parsed = parse_s7_address(address)
+        as_float = isinstance(value, float) and parsed.data_type in ("DBD", "MD")
+
+        expected = encode_s7_value(
+            value, parsed.data_type, as_float=as_float, bit_offset=parsed.bit_offset
+        )
+
+        assert s7_encoder(parsed)(value) == expected
+
 
 # =============================================================================
 # S7 CONNECTOR TESTS (MOCKED)
@@ -453,6 +526,36 @@ class TestS7ConnectorMocked:
             assert tag_value.quality == Quality.GOOD
             assert abs(tag_value.value - 25.5) < 0.0001
 
+    async def test_client_calls_share_one_worker_thread(self, s7_config: S7ConnectorConfig) -> None:
+        """connect/read/write/disconnect run on one worker, released on disconnect."""
+        with (
+            patch("mtp_gateway.adapters.southbound.s7.driver.snap7") as mock_snap7,
+            patch("mtp_gateway.adapters.southbound.s7.driver.HAS_SNAP7", True),
+        ):
+            threads: list[threading.Thread] = []
+
+            def record(*_args: object) -> bytearray:
+                threads.append(threading.current_thread())
+                return bytearray(2)
+
+            mock_client = MagicMock()
+            mock_client.get_connected.return_value = True
+            for method in ("connect", "db_read", "db_write", "disconnect"):
+                getattr(mock_client, method).side_effect = record
+            mock_snap7.client.Client.return_value = mock_client
+
+            connector = S7Connector(s7_config)
+            await connector.connect()
+            await connector.read_tags(["DB1.DBW0"])
+            await connector.write_tag("DB1.DBW0", 7)
+            await connector.disconnect()
+
+            assert len(threads) == 4
+            assert len(set(threads)) == 1
+            assert threads[0] is not threading.current_thread()
+            assert threads[0].name.startswith("s7-test_s7")
+            assert connector._executor is None
+
     async def test_read_multiple_tags(self, s7_config: S7ConnectorConfig) -> None:
         """Reading multiple tags returns all values."""
         with (
@@ -655,3 +758,146 @@ class TestS7ConnectorMocked:
 
             assert "DB100.DBD0" in result
             assert result["DB100.DBD0"].quality.is_bad()
+
+    async def test_adjacent_addresses_share_one_block_read(
+        self, s7_config: S7ConnectorConfig
+    ) -> None:
+        """Nearby addresses in one DB are read with a single db_read."""
+        block = bytearray(16)
+        block[0:4] = struct.pack(">f", 1.5)
+        block[4:6] = struct.pack(">h", -7)
+        block[10] = 0b00000100
+        with (
+            patch("mtp_gateway.adapters.southbound.s7.driver.snap7") as mock_snap7,
+            patch("mtp_gateway.adapters.southbound.s7.driver.HAS_SNAP7", True),
+        ):
+            mock_client = MagicMock()
+            mock_client.get_connected.return_value = True
+            mock_client.db_read.side_effect = lambda _db, start, size: block[start : start + size]
+            mock_snap7.client.Client.return_value = mock_client
+
+            connector = S7Connector(s7_config)
+            await connector.connect()
+
+            result = await connector.read_tags(["DB100.DBX10.2", "DB100.DBD0", "DB100.DBW4"])
+
+            mock_client.db_read.assert_called_once_with(100, 0, 11)
+            assert result["DB100.DBD0"].value == 1.5
+            assert result["DB100.DBW4"].value == -7
+            assert result["DB100.DBX10.2"].value is True
+
+    async def test_rejected_block_falls_back_to_single_reads(
+        self, s7_config: S7ConnectorConfig
+    ) -> None:
+        """A merged block the PLC rejects is retried per address."""
+        block = bytearray(struct.pack(">h", 42))
+
+        def db_read(_db: int, start: int, size: int) -> bytearray:
+            if start + size > len(block):
+                raise RuntimeError("Address out of range")
+            return block[start : start + size]
+
+        with (
+            patch("mtp_gateway.adapters.southbound.s7.driver.snap7") as mock_snap7,
+            patch("mtp_gateway.adapters.southbound.s7.driver.HAS_SNAP7", True),
+        ):
+            mock_client = MagicMock()
+            mock_client.get_connected.return_value = True
+            mock_client.db_read.side_effect = db_read
+            mock_snap7.client.Client.return_value = mock_client
+
+            connector = S7Connector(s7_config)
+            await connector.connect()
+
+            result = await connector.read_tags(["DB1.DBW0", "DB1.DBW8"])
+
+            assert result["DB1.DBW0"].value == 42
+            assert result["DB1.DBW8"].quality == Quality.BAD_CONFIG_ERROR
+
+
+class FakeS7DataItem(ctypes.Structure):
+    """Layout of snap7's S7DataItem."""
+
+    _fields_ = [
+        ("Area", ctypes.c_int32),
+        ("WordLen", ctypes.c_int32),
+        ("Result", ctypes.c_int32),
+        ("DBNumber", ctypes.c_int32),
+        ("Start", ctypes.c_int32),
+        ("Amount", ctypes.c_int32),
+        ("pData", ctypes.POINTER(ctypes.c_uint8)),
+    ]
+
+
+async def test_scattered_blocks_share_one_multi_variable_read() -> None:
+    """Groups in different DBs travel in one read_multi_vars request."""
+    blocks = {1: bytearray(struct.pack(">h", 11)), 2: bytearray(struct.pack(">h", 22))}
+    client = MagicMock()
+    client.get_connected.return_value = True
+
+    def read_multi_vars(items: ctypes.Array[FakeS7DataItem]) -> tuple[int, object]:
+        for item in items:
+            if item.DBNumber in blocks:
+                data = blocks[item.DBNumber][item.Start : item.Start + item.Amount]
+                ctypes.memmove(item.pData, bytes(data), item.Amount)
+            else:
+                item.Result = 0x0A  # object does not exist
+        return 0, items
+
+    client.read_multi_vars.side_effect = read_multi_vars
+    client.db_read.side_effect = RuntimeError("not expected")
+    with (
+        patch("mtp_gateway.adapters.southbound.s7.driver.snap7") as mock_snap7,
+        patch("mtp_gateway.adapters.southbound.s7.driver.HAS_SNAP7", True),
+        patch("mtp_gateway.adapters.southbound.s7.driver.S7DataItem", FakeS7DataItem),
+    ):
+        mock_snap7.client.Client.return_value = client
+        connector = S7Connector(S7ConnectorConfig(name="s7", host="10.0.0.1"))
+        await connector.connect()
+
+        result = await connector.read_tags(["DB1.DBW0", "DB2.DBW0", "DB3.DBW0"])
+
+    client.read_multi_vars.assert_called_once()
+    assert result["DB1.DBW0"].value == 11
+    assert result["DB2.DBW0"].value == 22
+    assert result["DB3.DBW0"].quality == Quality.BAD_CONFIG_ERROR
+
+
+def test_plan_s7_reads_groups_by_block_and_gap() -> None:
+    """Addresses merge within a DB and gap, never across areas or DBs."""
+    addresses = ["DB1.DBW0", "DB1.DBD2", "DB1.DBB100", "DB2.DBW0", "MW0", "MB1"]
+    specs = [(a, parse_s7_address(a), s7_decoder(parse_s7_address(a))) for a in addresses]
+
+    groups = plan_s7_reads(specs, max_gap=8)
+
+    assert [(g.area, g.db_number, g.start, g.length) for g in groups] == [
+        (S7AreaType.DB, 1, 0, 6),
+        (S7AreaType.DB, 1, 100, 1),
+        (S7AreaType.DB, 2, 0, 2),
+        (S7AreaType.M, None, 0, 2),
+    ]
+    assert [(addr, offset) for addr, offset, _, _ in groups[0].members] == [
+        ("DB1.DBW0", 0),
+        ("DB1.DBD2", 2),
+    ]
+
+
+def test_plan_s7_reads_decodes_homogeneous_runs_in_bulk() -> None:
+    """Back-to-back values of one type become a single unpack."""
+    addresses = [f"DB5.DBD{4 * i}" for i in range(10)] + ["DB5.DBW40", "DB5.DBX42.1"]
+    specs = [(a, parse_s7_address(a), s7_decoder(parse_s7_address(a))) for a in addresses]
+    raw = bytearray(struct.pack(">10f", *range(10)) + struct.pack(">h", -5) + bytes([2]))
+
+    (group,) = plan_s7_reads(specs)
+    results: dict[str, object] = {}
+    _decode_group(MagicMock(), group, raw, results)
+
+    assert [(offset, addrs[0], len(addrs)) for offset, _, addrs in group.bulk] == [
+        (0, "DB5.DBD0", 10)
+    ]
+    assert [member[0] for member in group.singles] == ["DB5.DBW40", "DB5.DBX42.1"]
+    assert results == {
+        **{f"DB5.DBD{4 * i}": float(i) for i in range(10)},
+        "DB5.DBW40": -5,
+        "DB5.DBX42.1": True,
+    }
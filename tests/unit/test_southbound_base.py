@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+from mtp_gateway.adapters.southbound.base import (
+    BaseConnector,
+    ConnectorHealth,
+    ConnectorState,
+    ExponentialBackoff,
+    create_connector,
+)
+from mtp_gateway.adapters.southbound.modbus.driver import ModbusTCPConnector
+from mtp_gateway.config.schema import ModbusTCPConnectorConfig
+from mtp_gateway.domain.model.tags import DataType, Quality, TagDefinition
+
+
+class DummyConnector(BaseConnector):
+    def __init__(self) -> None:
+        super().__init__(ModbusTCPConnectorConfig(name="dummy", host="127.0.0.1"))
+        self.values: dict[str, Any] = {}
+        self.fail_reads = False
+
+    async def _do_connect(self) -> None:
+        return None
+
+    async def _do_disconnect(self) -> None:
+        return None
+
+    async def _do_read(self, addresses: list[str]) -> dict[str, Any]:
+        if self.fail_reads:
+            raise OSError("link down")
+        return {addr: self.values[addr] for addr in addresses if addr in self.values}
+
+    async def _do_write(self, address: str, value: Any) -> None:
+        self.values[address] = value
+
+
+def test_health_records_caller_timestamp() -> None:
+    health = ConnectorHealth(state=ConnectorState.CONNECTED)
+    now = datetime(2024, 1, 1, tzinfo=UTC)
+
+    health.record_success(now)
+    assert health.last_success == now
+
+    health.record_error("boom", now)
+    assert health.last_error == now
+    assert health.consecutive_errors == 1
+
+
+async def test_read_tags_shares_timestamp_with_health() -> None:
+    connector = DummyConnector()
+    connector.values = {"a": 1}
+
+    result = await connector.read_tags(["a", "missing"])
+
+    assert result["a"].value == 1
+    assert result["a"].quality == Quality.GOOD
+    assert result["missing"].quality == Quality.BAD_CONFIG_ERROR
+    assert connector.health_status().last_success == result["a"].timestamp
+
+
+async def test_read_tags_ignores_unrequested_keys_and_keeps_order() -> None:
+    connector = DummyConnector()
+    connector.values = {"b": 2, "x": 9}
+
+    async def read_everything(addresses: list[str]) -> dict[str, Any]:
+        return dict(connector.values)
+
+    connector._do_read = read_everything  # type: ignore[method-assign]
+    result = await connector.read_tags(["a", "b"])
+
+    assert list(result) == ["a", "b"]
+    assert result["a"].quality == Quality.BAD_CONFIG_ERROR
+    assert result["b"].value == 2
+
+
+async def test_read_tags_failure_returns_bad_quality() -> None:
+    connector = DummyConnector()
+    connector.fail_reads = True
+
+    result = await connector.read_tags(["a", "b"])
+
+    assert {tv.quality for tv in result.values()} == {Quality.BAD_NO_COMMUNICATION}
+    assert connector.health_status().last_error == result["a"].timestamp
+
+
+async def test_read_tag_values_follows_address_edited_in_place() -> None:
+    connector = DummyConnector()
+    connector.values = {"40001": 5, "40009": 9}
+    tag = TagDefinition(name="Level", connector="dummy", address="40001", datatype=DataType.INT16)
+    tags = [tag]
+
+    first = await connector.read_tag_values(tags)
+    tag.address = "40009"
+    second = await connector.read_tag_values(tags)
+
+    assert first["Level"].value == 5
+    assert second["Level"].value == 9
+
+
+async def test_read_tag_values_returns_fresh_dict_each_poll() -> None:
+    connector = DummyConnector()
+    connector.values = {"40001": 5}
+    tags = [
+        TagDefinition(name="Level", connector="dummy", address="40001", datatype=DataType.INT16)
+    ]
+
+    first = await connector.read_tag_values(tags)
+    connector.values["40001"] = 6
+    second = await connector.read_tag_values(tags)
+
+    assert second is not first
+    assert first["Level"].value == 5
+    assert second["Level"].value == 6
+
+
+def test_backoff_delays_double_and_cap() -> None:
+    backoff = ExponentialBackoff(base_delay=1.0, max_delay=5.0, max_retries=4, jitter=0.0)
+
+    delays = [backoff.next_delay() for _ in range(5)]
+
+    assert delays == [1.0, 2.0, 4.0, 5.0, None]
+    backoff.reset()
+    assert backoff.next_delay() == 1.0
+
+
+def test_backoff_allows_many_retries() -> None:
+    backoff = ExponentialBackoff(base_delay=1.0, max_delay=30.0, max_retries=2000, jitter=0.0)
+
+    delays = [backoff.next_delay() for _ in range(2001)]
+
+    assert delays[:6] == [1.0, 2.0, 4.0, 8.0, 16.0, 30.0]
+    assert delays[1999] == 30.0
+    assert delays[2000] is None
+
+
+def test_backoff_jitter_stays_within_bounds() -> None:
+    backoff = ExponentialBackoff(base_delay=10.0, max_delay=10.0, max_retries=200, jitter=0.1)
+
+    delays = [backoff.next_delay() for _ in range(200)]
+
+    assert all(d is not None and 9.0 <= d <= 11.0 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_create_connector_dispatches_on_type() -> None:
+    connector = create_connector(ModbusTCPConnectorConfig(name="plc", host="127.0.0.1"))
+
+    assert isinstance(connector, ModbusTCPConnector)
+    assert connector.name == "plc"
+
+
+async def test_connect_skips_lock_when_already_connected() -> None:
+    connector = DummyConnector()
+    await connector.connect()
+    assert connector.health_status().state == ConnectorState.CONNECTED
+
+    async with connector._lock:
+        # Would deadlock if connect() tried to take the lock again
+        await connector.connect()
+
+    await connector.disconnect()
+    assert connector.health_status().state == ConnectorState.STOPPED
+    async with connector._lock:
+        await connector.disconnect()